@@ -21,16 +21,13 @@ def main():
 
     local_library = []
     with audible.Client(auth=auth) as client:
-        library = client.get(
-            "1.0/library",
-            num_results=1000,
+        books = client.iter_library(
             response_groups="product_desc, product_attrs",
             sort_by="-PurchaseDate",
         )
-        books = library["items"]
-        book = books[0]
-        print(f"keys:{book.keys()}")
         for i, book in enumerate(books):
+            if i == 0:
+                print(f"keys:{book.keys()}")
             asin = book.get("asin")
             print(
                 f'#{i} Title: {book.get("title")} - time:{book.get("runtime_length_min")} asin:{asin}'
@@ -1,10 +1,9 @@
 import json
 import pathlib
 
-import httpx
-
 import audible
 from audible.aescipher import decrypt_voucher_from_licenserequest
+from audible.download import Downloader
 
 
 # files downloaded via this script can be converted
@@ -38,12 +37,9 @@ def get_download_link(license_response):
 
 
 def download_file(url, filename):
-    headers = {"User-Agent": "Audible/671 CFNetwork/1240.0.4 Darwin/20.6.0"}
-    with httpx.stream("GET", url, headers=headers) as r:
-        with open(filename, "wb") as f:
-            for chunck in r.iter_bytes():
-                f.write(chunck)
-    return filename
+    # parallel range requests, an interrupted download is resumed on next run
+    with Downloader(max_connections=4) as downloader:
+        return downloader.download(url, filename)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,122 @@
+import re
+
+
+_STRUCTURAL = re.compile(rb'["{}\[\]]')
+_STRING_END = re.compile(rb'["\\]')
+
+
+class ItemSplitter:
+    """Incrementally splits an array of a JSON object into raw items.
+
+    Data is fed chunk by chunk. Every item of the array stored under
+    `items_key` in the top-level object is returned as raw JSON bytes as
+    soon as it is complete. All other bytes of the top-level object are kept
+    and can be retrieved with :meth:`rest` after the last chunk.
+
+    Only objects and arrays are supported as items. The JSON is not
+    validated, invalid JSON leads to wrong results.
+
+    Args:
+        items_key: The key of the array in the top-level object.
+    """
+
+    def __init__(self, items_key: str = "items") -> None:
+        self._items_key = items_key.encode("utf-8")
+        self._buf = bytearray()
+        self._pos = 0  # next position in buffer to scan
+        self._depth = 0
+        self._last_string: bytes | None = None
+        self._in_items = False
+        self._item_start: int | None = None
+        self._rest = bytearray()
+        self._rest_start: int | None = 0  # None while inside the items array
+
+    def feed(self, data: bytes) -> list[bytes]:
+        """Feeds a chunk and returns the items completed by this chunk."""
+        self._buf += data
+        items = self._scan()
+        self._compact()
+        return items
+
+    def rest(self) -> bytes:
+        """Returns the top-level object with an empty items array.
+
+        Must be called after all data are fed.
+        """
+        if self._rest_start is not None:
+            self._rest += self._buf[self._rest_start :]
+            self._rest_start = len(self._buf)
+        return bytes(self._rest)
+
+    def _scan(self) -> list[bytes]:
+        buf = self._buf
+        items: list[bytes] = []
+        items_depth = 2  # depth of items inside the array of the top-level object
+
+        while True:
+            match = _STRUCTURAL.search(buf, self._pos)
+            if match is None:
+                self._pos = len(buf)
+                return items
+            i = match.start()
+            char = buf[i]
+
+            if char == 0x22:  # "
+                end = self._find_string_end(i + 1)
+                if end is None:  # incomplete string, wait for more data
+                    self._pos = i
+                    return items
+                if self._depth == 1:
+                    self._last_string = bytes(buf[i + 1 : end])
+                self._pos = end + 1
+                continue
+
+            self._pos = i + 1
+            if char in (0x7B, 0x5B):  # { [
+                if self._in_items and self._depth == items_depth:
+                    self._item_start = i
+                self._depth += 1
+                if (
+                    char == 0x5B
+                    and self._depth == items_depth
+                    and not self._in_items
+                    and self._last_string == self._items_key
+                ):
+                    self._in_items = True
+                    self._rest += buf[self._rest_start : i + 1]
+                    self._rest_start = None
+            else:  # } ]
+                self._depth -= 1
+                if not self._in_items:
+                    continue
+                if self._depth == items_depth and self._item_start is not None:
+                    items.append(bytes(buf[self._item_start : i + 1]))
+                    self._item_start = None
+                elif self._depth == items_depth - 1:
+                    self._in_items = False
+                    self._rest_start = i
+
+    def _find_string_end(self, start: int) -> int | None:
+        buf = self._buf
+        pos = start
+        while True:
+            match = _STRING_END.search(buf, pos)
+            if match is None:
+                return None
+            if buf[match.start()] == 0x22:
+                return match.start()
+            pos = match.start() + 2  # skip escaped character
+            if pos > len(buf):
+                return None
+
+    def _compact(self) -> None:
+        # drop scanned bytes which are not needed anymore
+        keep = self._pos if self._item_start is None else self._item_start
+        if self._rest_start is not None:
+            self._rest += self._buf[self._rest_start : keep]
+            self._rest_start = 0
+        if keep:
+            del self._buf[:keep]
+            self._pos -= keep
+            if self._item_start is not None:
+                self._item_start -= keep
@@ -8,6 +8,7 @@ from typing import TYPE_CHECKING, Literal, overload
 import httpx
 
 from .exceptions import AuthFlowError
+from .pool import get_shared_mounts, get_shared_transport
 
 
 if TYPE_CHECKING:
@@ -51,7 +52,11 @@ def get_player_token(auth: "audible.Authenticator") -> str:
         },
     )
 
-    with httpx.Client(cookies=auth.website_cookies) as session:
+    with httpx.Client(
+        cookies=auth.website_cookies,
+        transport=get_shared_transport(),
+        mounts=get_shared_mounts(),
+    ) as session:
         resp = session.get(url, follow_redirects=True)
 
     query = resp.url.query.decode()
@@ -120,7 +125,9 @@ def fetch_activation(player_token: str) -> bytes:
     deregister_params = {"customer_token": player_token, "action": "de-register"}
 
     headers = {"User-Agent": "Audible Download Manager"}
-    with httpx.Client(headers=headers) as session:
+    with httpx.Client(
+        headers=headers, transport=get_shared_transport(), mounts=get_shared_mounts()
+    ) as session:
         session.get(url, params=deregister_params)
         try:
             resp = session.get(url, params=register_params)
@@ -151,7 +158,9 @@ def fetch_activation_sign_auth(auth: "audible.Authenticator") -> bytes:
         "action": "register",
         "player_model": "iPhone",
     }
-    with httpx.Client(auth=auth) as client:
+    with httpx.Client(
+        auth=auth, transport=get_shared_transport(), mounts=get_shared_mounts()
+    ) as client:
         resp = client.get(url, params=params)
         return resp.content
 
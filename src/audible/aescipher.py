@@ -6,6 +6,7 @@ import os
 import pathlib
 import re
 import struct
+from functools import lru_cache
 from hashlib import sha256
 from typing import TYPE_CHECKING, Any, Literal
 
@@ -393,6 +394,44 @@ def remove_file_encryption(
     pathlib.Path(target).write_text(decrypted)
 
 
+@lru_cache(maxsize=1024)
+def _derive_voucher_key(
+    device_type: str, device_serial_number: str, customer_id: str, asin: str
+) -> tuple[bytes, bytes]:
+    # https://github.com/mkb79/Audible/issues/3#issuecomment-705262614
+    # cached, a title can be licensed many times with the same device
+    buf_str = device_type + device_serial_number + customer_id + asin
+    buf = buf_str.encode("ascii")
+    digest = sha256(buf).digest()
+    return digest[0:16], digest[16:]
+
+
+def get_voucher_device_data(auth: "audible.Authenticator") -> tuple[str, str, str]:
+    """Returns the device data needed to decrypt vouchers.
+
+    Returns:
+        The device serial number, the customer id and the device type.
+
+    Raises:
+        Exception: If device info or customer info data is missing.
+
+    .. versionadded:: v0.10.1
+    """
+    device_info = auth.device_info
+    if device_info is None:
+        raise Exception("Device info data is missing.")
+
+    customer_info = auth.customer_info
+    if customer_info is None:
+        raise Exception("Customer info data is missing.")
+
+    return (
+        device_info["device_serial_number"],
+        customer_info["user_id"],
+        device_info["device_type"],
+    )
+
+
 def _decrypt_voucher(
     device_serial_number: str,
     customer_id: str,
@@ -400,12 +439,7 @@ def _decrypt_voucher(
     asin: str,
     voucher: str,
 ) -> dict[str, Any]:
-    # https://github.com/mkb79/Audible/issues/3#issuecomment-705262614
-    buf_str = device_type + device_serial_number + customer_id + asin
-    buf = buf_str.encode("ascii")
-    digest = sha256(buf).digest()
-    key = digest[0:16]
-    iv = digest[16:]
+    key, iv = _derive_voucher_key(device_type, device_serial_number, customer_id, asin)
 
     # decrypt "voucher" using AES in CBC mode with no padding
     b64d_voucher = base64.b64decode(voucher)
@@ -422,6 +456,35 @@ def _decrypt_voucher(
         return match.groupdict()
 
 
+def decrypt_voucher(
+    device_serial_number: str,
+    customer_id: str,
+    device_type: str,
+    asin: str,
+    voucher: str,
+) -> dict[str, Any]:
+    """Decrypts an encrypted voucher.
+
+    Unlike :func:`decrypt_voucher_from_licenserequest`, no authenticator is
+    needed, so the function can run in a process pool.
+
+    Args:
+        device_serial_number: The serial number of the registered device.
+        customer_id: The user id of the customer.
+        device_type: The type of the registered device.
+        asin: The ASIN of the license.
+        voucher: The encrypted ``license_response`` of the license.
+
+    Returns:
+        The decrypted license voucher with needed key and iv.
+
+    .. versionadded:: v0.10.1
+    """
+    return _decrypt_voucher(
+        device_serial_number, customer_id, device_type, asin, voucher
+    )
+
+
 def decrypt_voucher_from_licenserequest(
     auth: "audible.Authenticator", license_response: dict[str, Any]
 ) -> dict[str, Any]:
@@ -442,18 +505,7 @@ def decrypt_voucher_from_licenserequest(
         A device registration is needed to use the auth instance for a
         license request and to obtain the needed device data
     """
-    # device data
-    device_info = auth.device_info
-    if device_info is None:
-        raise Exception("Device info data is missing.")
-    device_serial_number = device_info["device_serial_number"]
-    device_type = device_info["device_type"]
-
-    # user data
-    customer_info = auth.customer_info
-    if customer_info is None:
-        raise Exception("Customer info data is missing.")
-    customer_id = customer_info["user_id"]
+    device_serial_number, customer_id, device_type = get_voucher_device_data(auth)
 
     # book specific data
     asin = license_response["content_license"]["asin"]
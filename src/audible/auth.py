@@ -1,8 +1,13 @@
+import asyncio
 import base64
 import json
 import logging
-from collections.abc import Callable, Generator, Iterator
+import threading
+from abc import ABCMeta, abstractmethod
+from collections.abc import AsyncGenerator, Callable, Generator, Iterator
+from concurrent.futures import Executor, ProcessPoolExecutor
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache, partial
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -21,6 +26,12 @@ from .activation_bytes import get_activation_bytes as get_ab
 from .aescipher import AESCipher, detect_file_encryption
 from .exceptions import AuthFlowError, FileEncryptionError, NoRefreshToken
 from .login import external_login, login
+from .pool import (
+    get_shared_async_mounts,
+    get_shared_async_transport,
+    get_shared_mounts,
+    get_shared_transport,
+)
 from .register import deregister as deregister_
 from .register import register as register_
 from .utils import test_convert
@@ -35,6 +46,38 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger("audible.auth")
 
+#: The minimum time in seconds between two background refreshes of the
+#: access token.
+MIN_REFRESH_INTERVAL = 60.0
+
+
+def _build_refresh_access_token_request(
+    refresh_token: str, domain: str, with_username: bool
+) -> tuple[str, dict[str, str]]:
+    body = {
+        "app_name": "Audible",
+        "app_version": "3.56.2",
+        "source_token": refresh_token,
+        "requested_token_type": "access_token",
+        "source_token_type": "refresh_token",
+    }
+
+    target_domain = "audible" if with_username else "amazon"
+
+    return f"https://api.{target_domain}.{domain}/auth/token", body
+
+
+def _parse_refresh_access_token_response(resp: httpx.Response) -> dict[str, Any]:
+    resp.raise_for_status()
+    resp_dict = resp.json()
+
+    expires_in_sec = int(resp_dict["expires_in"])
+    expires = (
+        datetime.now(timezone.utc) + timedelta(seconds=expires_in_sec)
+    ).timestamp()
+
+    return {"access_token": resp_dict["access_token"], "expires": expires}
+
 
 def refresh_access_token(
     refresh_token: str, domain: str, with_username: bool = False
@@ -57,26 +100,44 @@ def refresh_access_token(
     .. versionadded:: v0.8
         The with_username argument
     """
-    body = {
-        "app_name": "Audible",
-        "app_version": "3.56.2",
-        "source_token": refresh_token,
-        "requested_token_type": "access_token",
-        "source_token_type": "refresh_token",
-    }
+    url, body = _build_refresh_access_token_request(
+        refresh_token, domain, with_username
+    )
+    with httpx.Client(
+        transport=get_shared_transport(), mounts=get_shared_mounts()
+    ) as session:
+        resp = session.post(url, data=body)
+    return _parse_refresh_access_token_response(resp)
 
-    target_domain = "audible" if with_username else "amazon"
 
-    resp = httpx.post(f"https://api.{target_domain}.{domain}/auth/token", data=body)
-    resp.raise_for_status()
-    resp_dict = resp.json()
+async def async_refresh_access_token(
+    refresh_token: str, domain: str, with_username: bool = False
+) -> dict[str, Any]:
+    """Refreshes an access token without blocking the event loop.
 
-    expires_in_sec = int(resp_dict["expires_in"])
-    expires = (
-        datetime.now(timezone.utc) + timedelta(seconds=expires_in_sec)
-    ).timestamp()
+    Same as :func:`refresh_access_token` but uses a :class:`httpx.AsyncClient`.
 
-    return {"access_token": resp_dict["access_token"], "expires": expires}
+    Args:
+        refresh_token: The refresh token obtained after a device
+            registration.
+        domain: The top level domain of the requested Amazon server
+            (e.g. com).
+        with_username: If ``True`` uses `audible` domain instead of `amazon`.
+
+    Returns:
+        A dict with the new access token and expiration timestamp.
+
+    .. versionadded:: v0.10.1
+    """
+    url, body = _build_refresh_access_token_request(
+        refresh_token, domain, with_username
+    )
+    async with httpx.AsyncClient(
+        transport=get_shared_async_transport(),
+        mounts=get_shared_async_mounts(),
+    ) as session:
+        resp = await session.post(url, data=body)
+    return _parse_refresh_access_token_response(resp)
 
 
 def refresh_website_cookies(
@@ -113,7 +174,10 @@ def refresh_website_cookies(
         "domain": f".{target_domain}.{cookies_domain}",
     }
 
-    resp = httpx.post(url, data=body)
+    with httpx.Client(
+        transport=get_shared_transport(), mounts=get_shared_mounts()
+    ) as session:
+        resp = session.post(url, data=body)
     resp.raise_for_status()
     resp_dict = resp.json()
 
@@ -142,7 +206,10 @@ def user_profile(access_token: str, domain: str) -> dict[str, Any]:
     """
     headers = {"Authorization": f"Bearer {access_token}"}
 
-    resp = httpx.get(f"https://api.amazon.{domain}/user/profile", headers=headers)
+    with httpx.Client(
+        transport=get_shared_transport(), mounts=get_shared_mounts()
+    ) as session:
+        resp = session.get(f"https://api.amazon.{domain}/user/profile", headers=headers)
     resp.raise_for_status()
     profile = resp.json()
 
@@ -168,7 +235,12 @@ def user_profile_audible(access_token: str, domain: str) -> dict[str, Any]:
     """
     headers = {"Authorization": f"Bearer {access_token}"}
 
-    resp = httpx.get(f"https://api.audible.{domain}/user/profile", headers=headers)
+    with httpx.Client(
+        transport=get_shared_transport(), mounts=get_shared_mounts()
+    ) as session:
+        resp = session.get(
+            f"https://api.audible.{domain}/user/profile", headers=headers
+        )
     resp.raise_for_status()
     profile = resp.json()
 
@@ -178,8 +250,128 @@ def user_profile_audible(access_token: str, domain: str) -> dict[str, Any]:
     return profile
 
 
+class Signer(metaclass=ABCMeta):
+    """Base class for SHA256withRSA signers used to sign API requests.
+
+    A signer holds the loaded private key, so the PEM encoded key have to be
+    parsed only once.
+
+    .. versionadded:: v0.10.1
+    """
+
+    backend: str
+
+    @abstractmethod
+    def __init__(self, private_key: str) -> None: ...
+
+    @abstractmethod
+    def sign(self, data: bytes) -> bytes:
+        """Signs `data` with PKCS#1 v1.5 padding and SHA-256.
+
+        Args:
+            data: The data to sign.
+
+        Returns:
+            The raw signature.
+        """
+
+
+class RsaSigner(Signer):
+    """Signer using the pure-Python :mod:`rsa` package.
+
+    .. versionadded:: v0.10.1
+    """
+
+    backend = "rsa"
+
+    def __init__(self, private_key: str | rsa.PrivateKey) -> None:
+        if isinstance(private_key, str):
+            private_key = rsa.PrivateKey.load_pkcs1(private_key.encode("utf-8"))
+        self.private_key = private_key
+
+    def sign(self, data: bytes) -> bytes:
+        return rsa.pkcs1.sign(data, self.private_key, "SHA-256")
+
+
+class CryptographySigner(Signer):
+    """Signer using the OpenSSL backed :mod:`cryptography` package.
+
+    Requires the optional ``cryptography`` package. The signature is
+    identical to the one created by :class:`RsaSigner` but much faster.
+
+    .. versionadded:: v0.10.1
+    """
+
+    backend = "cryptography"
+
+    def __init__(self, private_key: str) -> None:
+        # cryptography is an optional dependency
+        from cryptography.hazmat.primitives import (  # noqa: PLC0415
+            hashes,
+            serialization,
+        )
+        from cryptography.hazmat.primitives.asymmetric import (  # noqa: PLC0415
+            padding,
+        )
+        from cryptography.hazmat.primitives.asymmetric.rsa import (  # noqa: PLC0415
+            RSAPrivateKey,
+        )
+
+        key = serialization.load_pem_private_key(
+            private_key.encode("utf-8"), password=None
+        )
+        if not isinstance(key, RSAPrivateKey):
+            raise TypeError(f"Expected rsa private key, got {type(key).__name__}.")
+        self.private_key = key
+        self._padding = padding.PKCS1v15()
+        self._hash = hashes.SHA256()
+
+    def sign(self, data: bytes) -> bytes:
+        return self.private_key.sign(data, self._padding, self._hash)
+
+
+SIGNER_BACKENDS: dict[str, type[Signer]] = {
+    "cryptography": CryptographySigner,
+    "rsa": RsaSigner,
+}
+
+
+def get_signer(private_key: str, backend: str | None = None) -> Signer:
+    """Returns a signer for the given private key.
+
+    Args:
+        private_key: The PEM encoded rsa key obtained after device
+            registration.
+        backend: The name of the signer backend (``cryptography`` or
+            ``rsa``). If ``None``, ``cryptography`` is used if installed,
+            otherwise the ``rsa`` backend.
+
+    Returns:
+        A :class:`Signer` instance for the private key.
+
+    Raises:
+        ValueError: If the backend is unknown.
+
+    .. versionadded:: v0.10.1
+    """
+    if backend is not None:
+        if backend not in SIGNER_BACKENDS:
+            raise ValueError(f"Unknown signer backend: {backend}.")
+        return SIGNER_BACKENDS[backend](private_key)
+
+    try:
+        return CryptographySigner(private_key)
+    except ImportError:
+        logger.debug("cryptography package not found, use rsa signer backend")
+        return RsaSigner(private_key)
+
+
 def sign_request(
-    method: str, path: str, body: bytes, adp_token: str, private_key: str
+    method: str,
+    path: str,
+    body: bytes,
+    adp_token: str,
+    private_key: str | Signer,
 ) -> dict[str, str]:
     """Helper function who creates signed headers for http requests.
 
@@ -188,18 +380,22 @@ def sign_request(
         method: The http request method (GET, POST, DELETE, ...).
         body: The http message body.
         adp_token: The adp token obtained after a device registration.
-        private_key: The rsa key obtained after device registration.
+        private_key: The rsa key obtained after device registration. Can be
+            the PEM encoded key or a :class:`Signer` holding the loaded key.
 
     Returns:
         A dict with the signed headers.
+
+    .. versionchanged:: v0.10.1
+       The private_key argument accepts a :class:`Signer` instance.
     """
     date = datetime.now(timezone.utc).isoformat("T") + "Z"
     str_body = body.decode("utf-8")
 
     data = f"{method}\n{path}\n{date}\n{str_body}\n{adp_token}"
 
-    key = rsa.PrivateKey.load_pkcs1(private_key.encode("utf-8"))
-    cipher = rsa.pkcs1.sign(data.encode(), key, "SHA-256")
+    signer = private_key if isinstance(private_key, Signer) else get_signer(private_key)
+    cipher = signer.sign(data.encode())
     signed_encoded = base64.b64encode(cipher)
 
     signature = f"{signed_encoded.decode()}:{date}"
@@ -211,6 +407,25 @@ def sign_request(
     }
 
 
+@lru_cache(maxsize=8)
+def _get_cached_signer(private_key: str) -> Signer:
+    return get_signer(private_key)
+
+
+def _sign_request_in_worker(
+    method: str, path: str, body: bytes, adp_token: str, private_key: str
+) -> dict[str, str]:
+    # Used with process pools. Signer objects can't be pickled, so the PEM
+    # encoded key is sent and the loaded signer is cached per worker process.
+    return sign_request(
+        method=method,
+        path=path,
+        body=body,
+        adp_token=adp_token,
+        private_key=_get_cached_signer(private_key),
+    )
+
+
 class Authenticator(httpx.Auth):
     """Audible Authenticator class.
 
@@ -249,6 +464,15 @@ class Authenticator(httpx.Auth):
     requires_request_body: bool = True
     _forbid_new_attrs: bool = True
     _apply_test_convert: bool = True
+    _signer: Signer | None = None
+    _signing_executor: Executor | None = None
+    _async_refresh_lock: tuple[asyncio.AbstractEventLoop, asyncio.Lock] | None = None
+    _refresh_lock: threading.Lock
+    _refresher_thread: tuple[threading.Thread, threading.Event] | None = None
+    _refresher_task: "asyncio.Task[None] | None" = None
+
+    def __init__(self) -> None:
+        object.__setattr__(self, "_refresh_lock", threading.Lock())
 
     def __setattr__(self, attr: str, value: Any) -> None:
         if self._forbid_new_attrs and not hasattr(self, attr):
@@ -262,6 +486,24 @@ class Authenticator(httpx.Auth):
             value = test_convert(attr, value)
         object.__setattr__(self, attr, value)
 
+        if attr == "device_private_key":
+            # the parsed key belongs to the old value, load it again on demand
+            object.__setattr__(self, "_signer", None)
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Runtime state (locks, token refresher, signer and signing executor)
+        # is not pickled. The signer can hold an OpenSSL key which can't be
+        # pickled, it is loaded again on demand.
+        return {
+            attr: value
+            for attr, value in self.__dict__.items()
+            if not attr.startswith("_")
+        }
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        object.__setattr__(self, "_refresh_lock", threading.Lock())
+
     def __iter__(self) -> Iterator[str]:
         for i in self.__dict__:
             if self.__dict__[i] is not None and not i.startswith("_"):
@@ -517,6 +759,80 @@ class Authenticator(httpx.Auth):
 
         yield request
 
+    async def async_auth_flow(
+        self, request: httpx.Request
+    ) -> AsyncGenerator[httpx.Request, httpx.Response]:
+        """Auth flow to be executed on every request by :class:`httpx.AsyncClient`.
+
+        If a :attr:`signing_executor` is set, the request signature is created
+        in the executor instead of blocking the event loop.
+
+        Args:
+            request: The request made by ``httpx``.
+
+        Yields:
+            The next request
+
+        Raises:
+            AuthFlowError: If no auth flow is available.
+
+        .. versionadded:: v0.10.1
+        """
+        if self.requires_request_body:
+            await request.aread()
+
+        available_modes = self.available_auth_modes
+
+        if "signing" in available_modes:
+            await self._async_apply_signing_auth_flow(request)
+        elif "bearer" in available_modes:
+            await self._async_apply_bearer_auth_flow(request)
+        else:
+            message = "signing or bearer auth flow are not available."
+            logger.critical(message)
+            raise AuthFlowError(message)
+
+        yield request
+
+    @property
+    def signing_executor(self) -> Executor | None:
+        """The executor used by :meth:`async_auth_flow` to sign requests.
+
+        If ``None`` (the default), requests are signed on the event loop.
+        Thread and process pools are supported. Setting an executor allows
+        concurrent requests of an :class:`audible.AsyncClient` to overlap the
+        CPU bound signing with network I/O. The executor is not shut down by
+        the Authenticator.
+
+        .. versionadded:: v0.10.1
+        """
+        return self._signing_executor
+
+    @signing_executor.setter
+    def signing_executor(self, executor: Executor | None) -> None:
+        object.__setattr__(self, "_signing_executor", executor)
+
+    @property
+    def signer(self) -> Signer:
+        """The :class:`Signer` for the :attr:`device_private_key`.
+
+        The PEM encoded key is only parsed on first access. The signer is
+        reused for all signed requests until :attr:`device_private_key` is
+        reassigned.
+
+        Raises:
+            Exception: If no device private key is found.
+
+        .. versionadded:: v0.10.1
+        """
+        if self._signer is None:
+            if self.device_private_key is None:
+                raise Exception("No device private key found.")
+            signer = get_signer(self.device_private_key)
+            object.__setattr__(self, "_signer", signer)
+            logger.debug("loaded device private key with %s signer", signer.backend)
+        return cast(Signer, self._signer)
+
     def _apply_signing_auth_flow(self, request: httpx.Request) -> None:
         if self.adp_token is None or self.device_private_key is None:
             raise Exception("No signing data found.")
@@ -526,12 +842,45 @@ class Authenticator(httpx.Auth):
             path=request.url.raw_path.decode(),
             body=request.content,
             adp_token=self.adp_token,
-            private_key=self.device_private_key,
+            private_key=self.signer,
         )
 
         request.headers.update(headers)
         logger.info("signing auth flow applied to request")
 
+    async def _async_apply_signing_auth_flow(self, request: httpx.Request) -> None:
+        executor = self.signing_executor
+        if executor is None:
+            self._apply_signing_auth_flow(request)
+            return
+
+        if self.adp_token is None or self.device_private_key is None:
+            raise Exception("No signing data found.")
+
+        method = request.method
+        path = request.url.raw_path.decode()
+        body = request.content
+        func: Callable[[], dict[str, str]]
+        if isinstance(executor, ProcessPoolExecutor):
+            func = partial(
+                _sign_request_in_worker,
+                method,
+                path,
+                body,
+                self.adp_token,
+                self.device_private_key,
+            )
+        else:
+            func = partial(
+                sign_request, method, path, body, self.adp_token, self.signer
+            )
+
+        loop = asyncio.get_running_loop()
+        headers = await loop.run_in_executor(executor, func)
+
+        request.headers.update(headers)
+        logger.info("signing auth flow applied to request")
+
     def _apply_bearer_auth_flow(self, request: httpx.Request) -> None:
         if self.access_token_expired:
             self.refresh_access_token()
@@ -543,6 +892,17 @@ class Authenticator(httpx.Auth):
         request.headers.update(headers)
         logger.info("bearer auth flow applied to request")
 
+    async def _async_apply_bearer_auth_flow(self, request: httpx.Request) -> None:
+        if self.access_token_expired:
+            await self.async_refresh_access_token()
+
+        if self.access_token is None:
+            raise Exception("No access token found.")
+
+        headers = {"Authorization": "Bearer " + self.access_token, "client-id": "0"}
+        request.headers.update(headers)
+        logger.info("bearer auth flow applied to request")
+
     def _apply_cookies_auth_flow(self, request: httpx.Request) -> None:
         if self.website_cookies is None:
             raise Exception("No website cookies found.")
@@ -675,27 +1035,236 @@ class Authenticator(httpx.Auth):
             with_username=self.with_username or False,
         )
 
+    def _check_refresh_data(self) -> tuple[str, "Locale"]:
+        if self.refresh_token is None:
+            message = "No refresh token found. Can't refresh access token."
+            logger.critical(message)
+            raise NoRefreshToken(message)
+        if self.locale is None:
+            raise Exception("No locale found.")
+        return self.refresh_token, self.locale
+
     def refresh_access_token(self, force: bool = False) -> None:
-        if force or self.access_token_expired:
-            if self.refresh_token is None:
-                message = "No refresh token found. Can't refresh access token."
-                logger.critical(message)
-                raise NoRefreshToken(message)
-            if self.locale is None:
-                raise Exception("No locale found.")
+        """Refreshes the access token.
+
+        Concurrent calls from multiple threads are coalesced. Threads waiting
+        for a running refresh reuse the new access token.
+
+        Args:
+            force: If ``True``, refresh the access token even if it is not
+                expired.
+
+        .. versionchanged:: v0.10.1
+           Concurrent refreshes are coalesced.
+        """
+        if not (force or self.access_token_expired):
+            logger.info(
+                "Access Token not expired. No refresh necessary. "
+                "To force refresh please use force=True"
+            )
+            return
+
+        expires = self.expires
+        with self._refresh_lock:
+            if self.expires != expires and not self.access_token_expired:
+                logger.debug("Access token was refreshed by a concurrent thread.")
+                return
+
+            refresh_token, locale = self._check_refresh_data()
 
             refresh_data = refresh_access_token(
-                refresh_token=self.refresh_token,
-                domain=self.locale.domain,
+                refresh_token=refresh_token,
+                domain=locale.domain,
                 with_username=self.with_username or False,
             )
 
+            # access_token is set before expires, so a reader never sees
+            # the new expiration time together with the old access token
             self._update_attrs(**refresh_data)
-        else:
+
+    def _get_async_refresh_lock(self) -> asyncio.Lock:
+        # an asyncio.Lock is bound to the event loop where it is used first
+        loop = asyncio.get_running_loop()
+        loop_lock = self._async_refresh_lock
+        if loop_lock is None or loop_lock[0] is not loop:
+            loop_lock = (loop, asyncio.Lock())
+            object.__setattr__(self, "_async_refresh_lock", loop_lock)
+        return loop_lock[1]
+
+    async def async_refresh_access_token(self, force: bool = False) -> None:
+        """Refreshes the access token without blocking the event loop.
+
+        Concurrent calls are coalesced. If many coroutines find an expired
+        access token at the same time, only one refresh request is made. The
+        other coroutines wait for it and reuse the new access token.
+
+        Args:
+            force: If ``True``, refresh the access token even if it is not
+                expired.
+
+        .. versionadded:: v0.10.1
+        """
+        if not (force or self.access_token_expired):
             logger.info(
                 "Access Token not expired. No refresh necessary. "
                 "To force refresh please use force=True"
             )
+            return
+
+        expires = self.expires
+        async with self._get_async_refresh_lock():
+            if self.expires != expires and not self.access_token_expired:
+                logger.debug("Access token was refreshed by a concurrent task.")
+                return
+
+            refresh_token, locale = self._check_refresh_data()
+
+            refresh_data = await async_refresh_access_token(
+                refresh_token=refresh_token,
+                domain=locale.domain,
+                with_username=self.with_username or False,
+            )
+
+            self._update_attrs(**refresh_data)
+
+    def _next_refresh_delay(self, margin: float, refreshed: bool = False) -> float:
+        delay = self.access_token_expires.total_seconds() - margin
+        if refreshed and delay < MIN_REFRESH_INTERVAL:
+            # the margin exceeds the lifetime of a new token, don't refresh
+            # the token back-to-back
+            logger.warning(
+                "Refresh margin of %s seconds exceeds the access token lifetime.",
+                margin,
+            )
+            return MIN_REFRESH_INTERVAL
+        return max(delay, 0)
+
+    def _check_token_refresher(self, margin: float, retry_interval: float) -> None:
+        if margin < 0:
+            raise ValueError("margin must not be negative.")
+        if retry_interval <= 0:
+            raise ValueError("retry_interval must be greater than 0.")
+        self._check_refresh_data()
+        if self.expires is None:
+            raise Exception("No expires timestamp found.")
+
+    def start_token_refresher(
+        self, margin: float = 300, retry_interval: float = 30
+    ) -> None:
+        """Starts a background thread which refreshes the access token.
+
+        The access token is refreshed `margin` seconds before it expires. So
+        requests made with a :class:`audible.Client` don't have to wait for a
+        token refresh when the access token expires.
+
+        Args:
+            margin: Seconds before expiration to refresh the access token.
+                If a new token expires within `margin`, the next refresh
+                waits :data:`MIN_REFRESH_INTERVAL` seconds.
+            retry_interval: Seconds to wait before retrying a failed refresh.
+
+        Raises:
+            RuntimeError: If a token refresher is already running.
+            ValueError: If `margin` is negative or `retry_interval` is not
+                positive.
+
+        .. versionadded:: v0.10.1
+        """
+        if self._refresher_thread is not None:
+            raise RuntimeError("Token refresher is already running.")
+        self._check_token_refresher(margin, retry_interval)
+
+        stopped = threading.Event()
+
+        def run() -> None:
+            delay = self._next_refresh_delay(margin)
+            while not stopped.wait(delay):
+                try:
+                    self.refresh_access_token(force=True)
+                except Exception:
+                    logger.exception("Background refresh of access token failed.")
+                    delay = retry_interval
+                else:
+                    logger.info("Access token refreshed in background.")
+                    delay = self._next_refresh_delay(margin, refreshed=True)
+
+        thread = threading.Thread(
+            target=run, name="audible-token-refresher", daemon=True
+        )
+        object.__setattr__(self, "_refresher_thread", (thread, stopped))
+        thread.start()
+
+    def stop_token_refresher(self) -> None:
+        """Stops the token refresher thread started with :meth:`start_token_refresher`.
+
+        .. versionadded:: v0.10.1
+        """
+        if self._refresher_thread is None:
+            return
+        thread, stopped = self._refresher_thread
+        stopped.set()
+        thread.join()
+        object.__setattr__(self, "_refresher_thread", None)
+
+    def start_async_token_refresher(
+        self, margin: float = 300, retry_interval: float = 30
+    ) -> "asyncio.Task[None]":
+        """Starts a task which refreshes the access token in the background.
+
+        The async counterpart of :meth:`start_token_refresher` for use with an
+        :class:`audible.AsyncClient`. Must be called from a running event loop.
+
+        Args:
+            margin: Seconds before expiration to refresh the access token.
+                If a new token expires within `margin`, the next refresh
+                waits :data:`MIN_REFRESH_INTERVAL` seconds.
+            retry_interval: Seconds to wait before retrying a failed refresh.
+
+        Returns:
+            The refresher task.
+
+        Raises:
+            RuntimeError: If a token refresher task is already running.
+            ValueError: If `margin` is negative or `retry_interval` is not
+                positive.
+
+        .. versionadded:: v0.10.1
+        """
+        if self._refresher_task is not None and not self._refresher_task.done():
+            raise RuntimeError("Token refresher task is already running.")
+        self._check_token_refresher(margin, retry_interval)
+
+        async def run() -> None:
+            delay = self._next_refresh_delay(margin)
+            while True:
+                await asyncio.sleep(delay)
+                try:
+                    await self.async_refresh_access_token(force=True)
+                except Exception:
+                    logger.exception("Background refresh of access token failed.")
+                    delay = retry_interval
+                else:
+                    logger.info("Access token refreshed in background.")
+                    delay = self._next_refresh_delay(margin, refreshed=True)
+
+        task = asyncio.create_task(run(), name="audible-token-refresher")
+        object.__setattr__(self, "_refresher_task", task)
+        return task
+
+    async def stop_async_token_refresher(self) -> None:
+        """Stops the task started with :meth:`start_async_token_refresher`.
+
+        .. versionadded:: v0.10.1
+        """
+        task = self._refresher_task
+        if task is None:
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        object.__setattr__(self, "_refresher_task", None)
 
     def set_website_cookies_for_country(self, country_code: str) -> None:
         cookies_domain = test_convert("locale", country_code).domain
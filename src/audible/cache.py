@@ -0,0 +1,196 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable, Mapping
+from typing import Any
+
+import httpx
+
+
+logger = logging.getLogger("audible.cache")
+
+CacheKey = tuple[Hashable, ...]
+
+#: Default TTL rules (in seconds) for rarely changing catalog data.
+DEFAULT_TTL_RULES: dict[str, float] = {
+    "/1.0/catalog/categories": 24 * 3600,
+    "/1.0/catalog/products": 3600,
+}
+
+
+class CacheEntry:
+    __slots__ = ("etag", "expires", "last_modified", "response")
+
+    def __init__(self, response: httpx.Response, expires: float) -> None:
+        self.response = response
+        self.expires = expires
+        self.etag = response.headers.get("ETag")
+        self.last_modified = response.headers.get("Last-Modified")
+
+    @property
+    def is_fresh(self) -> bool:
+        return time.monotonic() < self.expires
+
+    @property
+    def validators(self) -> dict[str, str]:
+        """Headers for a conditional request to revalidate the response."""
+        headers = {}
+        if self.etag is not None:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified is not None:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """A size bounded LRU cache for API responses.
+
+    The cache is used by :class:`audible.Client` and :class:`audible.AsyncClient`
+    for ``GET`` requests. Cached responses are returned without sending a
+    request, so the auth flow (and request signing) is skipped too. The
+    response callback is applied to the cached response on every hit.
+
+    Only responses with status code 200 for paths with a TTL greater than 0
+    are stored. The TTL for a path is taken from the rule with the longest
+    matching path prefix or `default_ttl` if no rule matches.
+
+    If `revalidate` is ``True``, responses with an ``ETag`` or
+    ``Last-Modified`` header are stored for all paths. When they are stale,
+    the client sends a conditional request with ``If-None-Match`` or
+    ``If-Modified-Since``. If the server answers with ``304 Not Modified``,
+    the cached response is used again. If the cached response was evicted
+    before the 304 response arrived, the request is sent again without
+    validators. Revalidation is disabled by default, because it keeps every
+    response with validators, including large library pages.
+
+    Args:
+        maxsize: The maximum number of cached responses. If exceeded, the
+            least recently used response is evicted.
+        ttl_rules: A mapping of API path prefixes to TTLs in seconds. If
+            ``None``, :data:`DEFAULT_TTL_RULES` is used.
+        default_ttl: The TTL in seconds for paths without a matching rule.
+        revalidate: If ``True``, store validators of responses and revalidate
+            stale responses with conditional requests. Defaults to ``False``.
+
+    .. versionadded:: v0.10.1
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 512,
+        ttl_rules: Mapping[str, float] | None = None,
+        default_ttl: float = 0,
+        revalidate: bool = False,
+    ) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be greater than 0.")
+        self.maxsize = maxsize
+        self.ttl_rules = dict(DEFAULT_TTL_RULES if ttl_rules is None else ttl_rules)
+        self.default_ttl = default_ttl
+        self.revalidate = revalidate
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.revalidations = 0
+        self._entries: OrderedDict[CacheKey, CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return (
+            f"<{type(self).__name__} size={len(self)}/{self.maxsize} "
+            f"hits={self.hits} misses={self.misses}>"
+        )
+
+    @staticmethod
+    def make_key(
+        method: str, url: httpx.URL, params: Any, marketplace: str, user: str
+    ) -> CacheKey:
+        """Builds a cache key with a normalized url.
+
+        Query parameters from `url` and `params` are merged and sorted.
+        """
+        url = url.copy_merge_params(params) if params else url
+        query = tuple(sorted(url.params.multi_items()))
+        return method.upper(), url.host, url.path, query, marketplace, user
+
+    def get_ttl(self, path: str) -> float:
+        """Returns the TTL in seconds for the API `path`."""
+        ttl = self.default_ttl
+        match_len = -1
+        for prefix, rule_ttl in self.ttl_rules.items():
+            if path.startswith(prefix) and len(prefix) > match_len:
+                ttl, match_len = rule_ttl, len(prefix)
+        return ttl
+
+    def is_cacheable(self, path: str) -> bool:
+        """Returns ``True`` if responses for the API `path` may be stored."""
+        return self.revalidate or self.get_ttl(path) > 0
+
+    def get(self, key: CacheKey) -> httpx.Response | None:
+        """Returns a fresh cached response for `key` or ``None``."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or not entry.is_fresh:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        logger.debug("cache hit for %s", key[2])
+        return entry.response
+
+    def get_validators(self, key: CacheKey) -> dict[str, str]:
+        """Returns the headers for a conditional request for `key`."""
+        if not self.revalidate:
+            return {}
+        with self._lock:
+            entry = self._entries.get(key)
+        return entry.validators if entry is not None else {}
+
+    def set(self, key: CacheKey, response: httpx.Response) -> None:
+        """Stores `response` for `key` if it is cacheable."""
+        if response.status_code != 200:
+            return
+        ttl = self.get_ttl(response.url.path)
+        entry = CacheEntry(response, time.monotonic() + ttl)
+        if ttl <= 0 and not (self.revalidate and entry.validators):
+            return
+
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def revalidated(
+        self, key: CacheKey, response: httpx.Response
+    ) -> httpx.Response | None:
+        """Handles a ``304 Not Modified`` response for a conditional request.
+
+        Args:
+            key: The cache key of the request.
+            response: The 304 response.
+
+        Returns:
+            The cached response or ``None`` if it was evicted meanwhile.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            ttl = self.get_ttl(response.url.path)
+            entry.expires = time.monotonic() + ttl
+            self._entries.move_to_end(key)
+            self.revalidations += 1
+        logger.debug("cached response revalidated for %s", key[2])
+        return entry.response
+
+    def clear(self) -> None:
+        """Removes all cached responses and resets the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = self.revalidations = 0
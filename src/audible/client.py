@@ -1,15 +1,33 @@
+import asyncio
 import inspect
 import json
 import logging
+import math
+import time
 from abc import ABCMeta, abstractmethod
-from collections.abc import Callable, Coroutine
-from contextlib import AbstractAsyncContextManager, AbstractContextManager
+from collections import deque
+from collections.abc import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Coroutine,
+    Iterable,
+    Iterator,
+)
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import (
+    AbstractAsyncContextManager,
+    AbstractContextManager,
+    contextmanager,
+)
+from functools import partial
 from types import TracebackType
 from typing import (
     Any,
     Generic,
     Literal,
     TypeVar,
+    cast,
     overload,
 )
 
@@ -17,8 +35,11 @@ import httpx
 from httpx import URL
 from httpx._models import HeaderTypes  # type: ignore[attr-defined]
 
+from ._json import ItemSplitter
 from ._types import TrueFalseT
 from .auth import Authenticator
+from .cache import CacheKey, ResponseCache
+from .concurrency import AdaptiveLimiter, report_overload
 from .exceptions import (
     BadRequest,
     NetworkError,
@@ -31,23 +52,52 @@ from .exceptions import (
     UnexpectedError,
 )
 from .localization import LOCALE_TEMPLATES, Locale
+from .pool import PoolConfig
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy
 
 
 logger = logging.getLogger("audible.client")
 
 ClientT = TypeVar("ClientT", httpx.AsyncClient, httpx.Client)
+_T = TypeVar("_T")
+_R = TypeVar("_R")
 
 httpx_client_request_args = list(
     inspect.signature(httpx.Client.request).parameters.keys()
 )
 
+# requests with other httpx args (e.g. ``timeout``, ``auth``) are not coalesced,
+# the response of an identical request could differ
+_COALESCE_REQUEST_ARGS = frozenset(("params", "headers"))
+
+
+JSONDecoderT = Callable[[bytes], Any]
+
+
+def _get_default_json_decoder() -> JSONDecoderT:
+    try:
+        import orjson  # type: ignore[import-not-found, unused-ignore]  # noqa: PLC0415
+    except ImportError:
+        return json.loads
+    return cast(JSONDecoderT, orjson.loads)
+
+
+#: The JSON decoder used if no decoder is passed to a client. This is
+#: :func:`orjson.loads` if `orjson` is installed, otherwise :func:`json.loads`.
+default_json_decoder = _get_default_json_decoder()
 
-def default_response_callback(resp: httpx.Response) -> Any:
+
+def default_response_callback(
+    resp: httpx.Response, json_decoder: JSONDecoderT | None = None
+) -> Any:
     raise_for_status(resp)
-    return convert_response_content(resp)
+    return convert_response_content(resp, json_decoder)
 
 
 def raise_for_status(resp: httpx.Response) -> None:
+    if resp.status_code == 304:  # Not Modified - response to a conditional request
+        return
     try:
         resp.raise_for_status()
     except httpx.HTTPStatusError as e:
@@ -67,17 +117,75 @@ def raise_for_status(resp: httpx.Response) -> None:
             raise UnexpectedError(resp, data) from e
 
 
-def convert_response_content(resp: httpx.Response) -> Any:
+def _without_validators(kwargs: dict[str, Any]) -> dict[str, Any]:
+    # removes the headers of a conditional request added by the cache
+    headers = httpx.Headers(kwargs.get("headers"))
+    for name in ("If-None-Match", "If-Modified-Since"):
+        if name in headers:
+            del headers[name]
+    return {**kwargs, "headers": headers}
+
+
+@contextmanager
+def _convert_request_errors() -> Iterator[None]:
+    # maps httpx transport errors to the exceptions of this package
     try:
-        return resp.json()
-    except json.JSONDecodeError:
+        yield
+    except (
+        httpx.ConnectTimeout,
+        httpx.ReadTimeout,
+        httpx.WriteTimeout,
+        httpx.PoolTimeout,
+    ):
+        raise NotResponding from None
+    except httpx.NetworkError:
+        raise NetworkError from None
+    except httpx.RequestError as exc:
+        raise RequestError(exc) from None
+
+
+def _is_json_response(resp: httpx.Response) -> bool:
+    content_type = resp.headers.get("Content-Type", "")
+    if "json" in content_type:
+        return True
+    # some responses have no or a wrong content type, look at the body instead
+    return resp.content.lstrip()[:1] in (b"{", b"[")
+
+
+def convert_response_content(
+    resp: httpx.Response, json_decoder: JSONDecoderT | None = None
+) -> Any:
+    """Converts the response content.
+
+    The raw bytes of a JSON response are decoded with `json_decoder` in a
+    single pass. If the response is not JSON, the text is returned.
+
+    Args:
+        resp: The response.
+        json_decoder: A callable to decode JSON from bytes. If ``None``,
+            :data:`default_json_decoder` is used.
+
+    Returns:
+        The decoded JSON content or the response text.
+
+    .. versionchanged:: v0.10.1
+       The json_decoder argument. Responses which are not JSON are no longer
+       tried to decode.
+    """
+    if not _is_json_response(resp):
+        return resp.text
+
+    decoder = json_decoder or default_json_decoder
+    try:
+        return decoder(resp.content)
+    except ValueError:  # includes json.JSONDecodeError and errors of other decoders
         return resp.text
 
 
 class BaseClient(Generic[ClientT], metaclass=ABCMeta):
     _API_URL_TEMP = "https://api.audible."
     _API_VERSION = "1.0"
-    _REQUEST_LOG = "{method} {url} has received {text}, has returned {status}"
+    _LOG_BODY_LIMIT = 500
 
     def __init__(
         self,
@@ -86,6 +194,12 @@ class BaseClient(Generic[ClientT], metaclass=ABCMeta):
         headers: HeaderTypes | None = None,
         timeout: int = 10,
         response_callback: Callable[[httpx.Response], Any] | None = None,
+        *,
+        cache: ResponseCache | None = None,
+        json_decoder: JSONDecoderT | None = None,
+        retry: RetryPolicy | None = None,
+        rate_limiter: RateLimiter | None = None,
+        pool: PoolConfig | None = None,
         **session_kwargs: Any,
     ):
         locale = Locale(country_code.lower()) if country_code else auth.locale
@@ -103,14 +217,28 @@ class BaseClient(Generic[ClientT], metaclass=ABCMeta):
         if headers is not None:
             default_headers.update(headers)
 
+        if pool is not None:
+            session_kwargs.setdefault("limits", pool.limits)
+            session_kwargs.setdefault("http2", pool.http2)
+
         self.session: ClientT = self._get_session(
             headers=default_headers, timeout=timeout, auth=auth, **session_kwargs
         )
 
+        self._json_decoder = json_decoder or default_json_decoder
         if response_callback is None:
-            response_callback = default_response_callback
+            response_callback = partial(
+                default_response_callback, json_decoder=self._json_decoder
+            )
         self._response_callback = response_callback
 
+        self.cache = cache
+        self.retry = retry
+        self.rate_limiter = rate_limiter
+        # in-flight GET requests of an AsyncClient, identical requests wait for them
+        self._in_flight_requests: dict[CacheKey, asyncio.Future[httpx.Response]] = {}
+        self.coalesced_requests = 0
+
     @abstractmethod
     def _get_session(self, *args: Any, **kwargs: Any) -> ClientT: ...
 
@@ -148,6 +276,17 @@ class BaseClient(Generic[ClientT], metaclass=ABCMeta):
             )
         return self.session.auth
 
+    @property
+    def json_decoder(self) -> JSONDecoderT:
+        """The callable used to decode JSON responses.
+
+        Pass it to response callbacks which decode the response themselves,
+        e.g. ``partial(LibraryPage.from_response, json_decoder=client.json_decoder)``.
+
+        .. versionadded:: v0.10.1
+        """
+        return self._json_decoder
+
     def switch_user(
         self, auth: Authenticator, switch_to_default_marketplace: bool = False
     ) -> None:
@@ -157,6 +296,87 @@ class BaseClient(Generic[ClientT], metaclass=ABCMeta):
             self.switch_marketplace(auth.locale.country_code)
         self.session.auth = auth
 
+    def _log_response(self, method: str, resp: httpx.Response, latency: float) -> None:
+        # building the message is skipped entirely if debug logging is disabled
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+
+        fields = {
+            "method": method,
+            "path": resp.url.path,
+            "status_code": resp.status_code,
+            "response_bytes": len(resp.content),
+            "latency": latency,
+        }
+        body = ""
+        if self._LOG_BODY_LIMIT > 0:
+            body = resp.content[: self._LOG_BODY_LIMIT].decode("utf-8", "replace")
+            if len(resp.content) > self._LOG_BODY_LIMIT:
+                body += "..."
+
+        logger.debug(
+            "%s %s returned %s (%s bytes in %.3fs) %s",
+            method,
+            fields["path"],
+            fields["status_code"],
+            fields["response_bytes"],
+            latency,
+            body,
+            extra=fields,
+        )
+
+    def _user_key(self) -> str:
+        # identifies the user of the current auth, used to not share cached
+        # responses between users
+        auth = self.auth
+        if auth.customer_info and "user_id" in auth.customer_info:
+            return str(auth.customer_info["user_id"])
+        return str(id(auth))
+
+    def _cache_lookup(
+        self, method: str, url: httpx.URL, kwargs: dict[str, Any]
+    ) -> tuple[CacheKey | None, httpx.Response | None]:
+        if self.cache is None or method != "GET" or "auth" in kwargs:
+            return None, None
+        if not self.cache.is_cacheable(url.path):
+            return None, None
+        key = self.cache.make_key(
+            method, url, kwargs.get("params"), self.marketplace, self._user_key()
+        )
+        cached_resp = self.cache.get(key)
+        if cached_resp is None:
+            validators = self.cache.get_validators(key)
+            if validators:
+                headers = httpx.Headers(kwargs.get("headers"))
+                headers.update(validators)
+                kwargs["headers"] = headers
+        return key, cached_resp
+
+    def _cache_store(
+        self, key: CacheKey | None, resp: httpx.Response
+    ) -> httpx.Response | None:
+        # Returns the cached response if `resp` is a 304 Not Modified. If the
+        # cached response was evicted meanwhile, None is returned and the
+        # request must be sent again without validators.
+        if key is None or self.cache is None:
+            return resp
+        if resp.status_code == 304:
+            return self.cache.revalidated(key, resp)
+        self.cache.set(key, resp)
+        return resp
+
+    def _get_retry_delay(
+        self, method: str, attempt: int, exc: RequestError
+    ) -> float | None:
+        if self.retry is None:
+            return None
+        return self.retry.get_delay(method, attempt, exc)
+
+    def _reserve_rate_limit(self, url: httpx.URL) -> float:
+        if self.rate_limiter is None:
+            return 0.0
+        return self.rate_limiter.reserve(self.marketplace, url.path)
+
     def get_user_profile(self) -> dict[str, Any]:
         self.auth.refresh_access_token()
         return self.auth.user_profile()
@@ -292,10 +512,82 @@ class BaseClient(Generic[ClientT], metaclass=ABCMeta):
     def _prepare_params(kwargs: dict[str, Any]) -> None:
         params = kwargs.pop("params", {})
         for key in list(kwargs.keys()):
-            if key not in httpx_client_request_args:
+            # ``coalesce`` is an option of the client, not a query parameter
+            if key not in httpx_client_request_args and key != "coalesce":
                 params[key] = kwargs.pop(key)
         kwargs["params"] = params
 
+    @classmethod
+    def _prepare_page_kwargs(
+        cls, kwargs: dict[str, Any], page: int, num_results: int
+    ) -> dict[str, Any]:
+        page_kwargs = kwargs.copy()
+        page_kwargs["params"] = dict(kwargs.get("params", {}))
+        cls._prepare_params(page_kwargs)
+        page_kwargs["params"].update(num_results=num_results, page=page)
+        return page_kwargs
+
+    def _page_response_callback(
+        self, resp: httpx.Response, items_key: str
+    ) -> tuple[list[Any], int | None]:
+        data = default_response_callback(resp, self._json_decoder)
+        items: list[Any] = data[items_key]
+
+        # the library returns the total count as header, the catalog in body
+        total_count = resp.headers.get("Total-Count", data.get("total_results"))
+        total = int(total_count) if total_count is not None else None
+
+        return items, total
+
+    @staticmethod
+    def _last_page(total: int | None, num_results: int) -> float:
+        # if total is unknown, pages are requested until a page is not full
+        if total is None:
+            return math.inf
+        return math.ceil(total / num_results)
+
+    @staticmethod
+    def _chunk_asins(asins: Iterable[str], chunk_size: int) -> list[list[str]]:
+        if not 0 < chunk_size <= 50:
+            raise ValueError("chunk_size must be between 1 and 50.")
+        unique_asins = list(dict.fromkeys(asins))
+        return [
+            unique_asins[i : i + chunk_size]
+            for i in range(0, len(unique_asins), chunk_size)
+        ]
+
+    @classmethod
+    def _prepare_products_kwargs(
+        cls, kwargs: dict[str, Any], asins: list[str], response_groups: str | None
+    ) -> dict[str, Any]:
+        chunk_kwargs = kwargs.copy()
+        chunk_kwargs["params"] = dict(kwargs.get("params", {}))
+        cls._prepare_params(chunk_kwargs)
+        chunk_kwargs["params"]["asins"] = ",".join(asins)
+        if response_groups is not None:
+            chunk_kwargs["params"]["response_groups"] = response_groups
+        return chunk_kwargs
+
+    @staticmethod
+    def _products_by_asin(
+        chunks: Iterable[dict[str, Any]],
+    ) -> dict[str, dict[str, Any]]:
+        return {
+            product["asin"]: product
+            for chunk in chunks
+            for product in chunk.get("products", [])
+        }
+
+    @abstractmethod
+    def paginate(
+        self,
+        path: str,
+        num_results: int,
+        max_in_flight: int = 4,
+        items_key: str = "items",
+        **kwargs: Any,
+    ) -> Iterator[Any] | AsyncIterator[Any]: ...
+
     @abstractmethod
     def get(
         self,
@@ -359,33 +651,62 @@ class Client(BaseClient[httpx.Client]):
         response_callback: Callable[[httpx.Response], Any] | None = None,
         **kwargs: Any,
     ) -> Any:
+        kwargs.pop("coalesce", None)  # only used by the AsyncClient
         url = self._prepare_api_path(path)
 
         if response_callback is None:
             response_callback = self._response_callback
 
-        try:
-            resp = self.session.request(method, url, **kwargs)
+        cache_key, cached_resp = self._cache_lookup(method, url, kwargs)
+        if cached_resp is not None:
+            return response_callback(cached_resp)
 
-            logger.debug(
-                self._REQUEST_LOG.format(
-                    method=method, url=resp.url, text=resp.text, status=resp.status_code
-                )
-            )
+        attempt = 1
+        while True:
+            try:
+                return self._send(method, url, response_callback, cache_key, kwargs)
+            except RequestError as exc:
+                delay = self._get_retry_delay(method, attempt, exc)
+                if delay is None:
+                    raise
+            time.sleep(delay)
+            attempt += 1
+
+    def _wait_for_rate_limit(self, url: httpx.URL) -> None:
+        delay = self._reserve_rate_limit(url)
+        if delay > 0:
+            time.sleep(delay)
+
+    def _send(
+        self,
+        method: str,
+        url: httpx.URL,
+        response_callback: Callable[[httpx.Response], Any],
+        cache_key: CacheKey | None,
+        kwargs: dict[str, Any],
+    ) -> Any:
+        self._wait_for_rate_limit(url)
 
-            return response_callback(resp)
-
-        except (
-            httpx.ConnectTimeout,
-            httpx.ReadTimeout,
-            httpx.WriteTimeout,
-            httpx.PoolTimeout,
-        ):
-            raise NotResponding from None
-        except httpx.NetworkError:
-            raise NetworkError from None
-        except httpx.RequestError as exc:
-            raise RequestError(exc) from None
+        try:
+            with _convert_request_errors():
+                start = time.perf_counter()
+                resp = self.session.request(method, url, **kwargs)
+            self._log_response(method, resp, time.perf_counter() - start)
+
+            stored_resp = self._cache_store(cache_key, resp)
+            if stored_resp is None:
+                logger.debug("cached response evicted, request %s again", url.path)
+                resp.close()
+                self._wait_for_rate_limit(url)
+                with _convert_request_errors():
+                    start = time.perf_counter()
+                    resp = self.session.request(
+                        method, url, **_without_validators(kwargs)
+                    )
+                self._log_response(method, resp, time.perf_counter() - start)
+                stored_resp = self._cache_store(cache_key, resp) or resp
+
+            return response_callback(stored_resp)
         finally:
             try:
                 resp.close()
@@ -446,6 +767,216 @@ class Client(BaseClient[httpx.Client]):
             **kwargs,
         )
 
+    def paginate(
+        self,
+        path: str,
+        num_results: int,
+        max_in_flight: int = 4,
+        items_key: str = "items",
+        **kwargs: Any,
+    ) -> Iterator[Any]:
+        """Iterates over the items of all pages from a paginated endpoint.
+
+        After the first page is received, the total number of pages is taken
+        from the ``Total-Count`` header or the ``total_results`` key. Up to
+        `max_in_flight` of the remaining pages are then requested
+        concurrently in a thread pool. Items are yielded in page order.
+
+        Args:
+            path: The API path (e.g. ``library`` or ``catalog/products``).
+            num_results: The number of items per page. Must not exceed the
+                maximum of the endpoint.
+            max_in_flight: The maximum number of pages requested at the same
+                time and held in memory.
+            items_key: The key of the items list in the response.
+            **kwargs: Query parameters and keyword args supported by
+                :meth:`get`.
+
+        Yields:
+            The items of all pages.
+
+        .. versionadded:: v0.10.1
+        """
+        callback = partial(self._page_response_callback, items_key=items_key)
+
+        def get_page(page: int) -> tuple[list[Any], int | None]:
+            page_kwargs = self._prepare_page_kwargs(kwargs, page, num_results)
+            result: tuple[list[Any], int | None] = self._request(
+                method="GET", path=path, response_callback=callback, **page_kwargs
+            )
+            return result
+
+        items, total = get_page(1)
+        if len(items) < num_results:
+            yield from items
+            return
+
+        last_page = self._last_page(total, num_results)
+        next_page = 2
+        last_page_reached = False
+        pending: deque[Future[tuple[list[Any], int | None]]] = deque()
+        executor = ThreadPoolExecutor(max_in_flight, thread_name_prefix="audible")
+
+        def fill() -> None:
+            # called before the items of a page are yielded, so the next
+            # pages are requested while the consumer processes them
+            nonlocal next_page
+            while (
+                not last_page_reached
+                and len(pending) < max_in_flight
+                and next_page <= last_page
+            ):
+                pending.append(executor.submit(get_page, next_page))
+                next_page += 1
+
+        try:
+            fill()
+            yield from items
+            while pending:
+                items, _ = pending.popleft().result()
+                if len(items) < num_results:
+                    last_page_reached = True
+                fill()
+                yield from items
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def iter_library(
+        self, num_results: int = 1000, max_in_flight: int = 1, **kwargs: Any
+    ) -> Iterator[dict[str, Any]]:
+        """Iterates over all items in the library.
+
+        While the items of a page are consumed, the next page is already
+        requested in background. See :meth:`paginate` for details.
+
+        Args:
+            num_results: The number of items per page (max 1000).
+            max_in_flight: The maximum number of pages requested at the same
+                time and held in memory.
+            **kwargs: Query parameters and keyword args supported by
+                :meth:`get` (e.g. ``response_groups``).
+
+        Returns:
+            An iterator over the library items.
+
+        .. versionadded:: v0.10.1
+        """
+        return self.paginate(
+            "library",
+            num_results=num_results,
+            max_in_flight=max_in_flight,
+            **kwargs,
+        )
+
+    def get_products(
+        self,
+        asins: Iterable[str],
+        response_groups: str | None = None,
+        chunk_size: int = 50,
+        max_in_flight: int = 4,
+        **kwargs: Any,
+    ) -> dict[str, dict[str, Any]]:
+        """Requests the catalog products for many ASINs.
+
+        The ASINs are requested in chunks with the ``asins`` query parameter
+        of the ``/1.0/catalog/products`` endpoint. Up to `max_in_flight`
+        chunks are requested concurrently in a thread pool.
+
+        Args:
+            asins: The ASINs to request. Duplicates are requested once.
+            response_groups: The response groups to request.
+            chunk_size: The number of ASINs per request (max 50).
+            max_in_flight: The maximum number of concurrent requests.
+            **kwargs: Query parameters and keyword args supported by
+                :meth:`get`.
+
+        Returns:
+            The products keyed by ASIN. ASINs which are not found in the
+            catalog are missing.
+
+        .. versionadded:: v0.10.1
+        """
+        chunks = self._chunk_asins(asins, chunk_size)
+
+        def get_chunk(chunk: list[str]) -> dict[str, Any]:
+            chunk_kwargs = self._prepare_products_kwargs(kwargs, chunk, response_groups)
+            result: dict[str, Any] = self._request(
+                method="GET",
+                path="catalog/products",
+                response_callback=partial(
+                    default_response_callback, json_decoder=self._json_decoder
+                ),
+                **chunk_kwargs,
+            )
+            return result
+
+        if len(chunks) <= 1:
+            return self._products_by_asin(get_chunk(chunk) for chunk in chunks)
+
+        with ThreadPoolExecutor(
+            min(max_in_flight, len(chunks)), thread_name_prefix="audible"
+        ) as executor:
+            return self._products_by_asin(executor.map(get_chunk, chunks))
+
+    def stream_items(
+        self,
+        path: str,
+        items_key: str = "items",
+        item_factory: Callable[[bytes], Any] | None = None,
+        **kwargs: Any,
+    ) -> Iterator[Any]:
+        """Streams the items of a ``GET`` response while it is received.
+
+        The response is not buffered. Items of the array stored under
+        `items_key` are yielded as soon as they are completely received, so
+        the memory usage is proportional to one item instead of the whole
+        response. The response cache and the response callback are not used.
+        The rate limiter and the retry policy of the client are applied. A
+        failed request is only retried if no item was yielded yet.
+
+        Args:
+            path: The API path (e.g. ``library``).
+            items_key: The key of the items array in the response.
+            item_factory: A callable which creates an item from its raw JSON
+                bytes (e.g. :class:`audible.models.LibraryItem`). If ``None``,
+                items are decoded with the JSON decoder of the client.
+            **kwargs: Query parameters and keyword args supported by
+                :meth:`get`.
+
+        Yields:
+            The items of the response.
+
+        .. versionadded:: v0.10.1
+        """
+        self._prepare_params(kwargs)
+        kwargs.pop("coalesce", None)  # streamed requests are never coalesced
+        url = self._prepare_api_path(path)
+        make_item = item_factory or self._json_decoder
+
+        attempt = 1
+        while True:
+            splitter = ItemSplitter(items_key)
+            yielded = False
+            try:
+                self._wait_for_rate_limit(url)
+                with _convert_request_errors():
+                    with self.session.stream("GET", url, **kwargs) as resp:
+                        if not resp.is_success:
+                            resp.read()
+                            raise_for_status(resp)
+                        for chunk in resp.iter_bytes():
+                            for raw in splitter.feed(chunk):
+                                yielded = True
+                                yield make_item(raw)
+                return
+            except RequestError as exc:
+                # the consumer already got items, a retry would repeat them
+                delay = None if yielded else self._get_retry_delay("GET", attempt, exc)
+                if delay is None:
+                    raise
+            time.sleep(delay)
+            attempt += 1
+
 
 class AsyncClient(BaseClient[httpx.AsyncClient]):
     def _get_session(self, *args: Any, **kwargs: Any) -> httpx.AsyncClient:
@@ -475,45 +1006,151 @@ class AsyncClient(BaseClient[httpx.AsyncClient]):
         response_callback: Callable[[httpx.Response], Any] | None = None,
         **kwargs: Any,
     ) -> Any:
+        coalesce = bool(kwargs.pop("coalesce", True))
         url = self._prepare_api_path(path)
 
         if response_callback is None:
             response_callback = self._response_callback
 
-        try:
-            resp = await self.session.request(method, url, **kwargs)
+        cache_key, cached_resp = self._cache_lookup(method, url, kwargs)
+        if cached_resp is not None:
+            return response_callback(cached_resp)
 
-            logger.debug(
-                self._REQUEST_LOG.format(
-                    method=method, url=resp.url, text=resp.text, status=resp.status_code
+        attempt = 1
+        while True:
+            try:
+                return await self._send(
+                    method, url, response_callback, cache_key, kwargs, coalesce=coalesce
                 )
-            )
+            except RequestError as exc:
+                delay = self._get_retry_delay(method, attempt, exc)
+                if delay is None:
+                    raise
+                report_overload(exc)
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _send(
+        self,
+        method: str,
+        url: httpx.URL,
+        response_callback: Callable[[httpx.Response], Any],
+        cache_key: CacheKey | None,
+        kwargs: dict[str, Any],
+        *,
+        coalesce: bool = True,
+    ) -> Any:
+        try:
+            if (
+                coalesce
+                and method == "GET"
+                and _COALESCE_REQUEST_ARGS.issuperset(kwargs)
+            ):
+                resp = await self._coalesced_fetch(method, url, kwargs)
+            else:
+                resp = await self._fetch(method, url, kwargs)
+
+            stored_resp = self._cache_store(cache_key, resp)
+            if stored_resp is None:
+                logger.debug("cached response evicted, request %s again", url.path)
+                await resp.aclose()
+                resp = await self._fetch(method, url, _without_validators(kwargs))
+                stored_resp = self._cache_store(cache_key, resp) or resp
 
-            return response_callback(resp)
-
-        except (
-            httpx.ConnectTimeout,
-            httpx.ReadTimeout,
-            httpx.WriteTimeout,
-            httpx.PoolTimeout,
-        ):
-            raise NotResponding from None
-        except httpx.NetworkError:
-            raise NetworkError from None
-        except httpx.RequestError as exc:
-            raise RequestError(exc) from None
+            return response_callback(stored_resp)
         finally:
             try:
                 await resp.aclose()
             except UnboundLocalError:
                 pass
 
+    async def _wait_for_rate_limit(self, url: httpx.URL) -> None:
+        if self.rate_limiter is not None and self.rate_limiter.directory is not None:
+            # file based buckets block while the file is locked by another
+            # process, don't block the event loop
+            delay = await asyncio.to_thread(self._reserve_rate_limit, url)
+        else:
+            delay = self._reserve_rate_limit(url)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    async def _fetch(
+        self, method: str, url: httpx.URL, kwargs: dict[str, Any]
+    ) -> httpx.Response:
+        await self._wait_for_rate_limit(url)
+
+        with _convert_request_errors():
+            start = time.perf_counter()
+            resp = await self.session.request(method, url, **kwargs)
+        self._log_response(method, resp, time.perf_counter() - start)
+        return resp
+
+    async def _coalesced_fetch(
+        self, method: str, url: httpx.URL, kwargs: dict[str, Any]
+    ) -> httpx.Response:
+        # identical requests wait for the response of the first one
+        key = (
+            *ResponseCache.make_key(
+                method, url, kwargs.get("params"), self.marketplace, self._user_key()
+            ),
+            tuple(sorted(httpx.Headers(kwargs.get("headers")).multi_items())),
+        )
+        leader = self._in_flight_requests.get(key)
+        if leader is not None:
+            self.coalesced_requests += 1
+            try:
+                return await asyncio.shield(leader)
+            except asyncio.CancelledError:
+                if not leader.cancelled():
+                    raise
+            # the first request was cancelled, send an own request
+            return await self._coalesced_fetch(method, url, kwargs)
+
+        future: asyncio.Future[httpx.Response] = (
+            asyncio.get_running_loop().create_future()
+        )
+        self._in_flight_requests[key] = future
+        try:
+            resp = await self._fetch(method, url, kwargs)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as exc:
+            future.set_exception(exc)
+            future.exception()  # mark as retrieved if there are no followers
+            raise
+        else:
+            future.set_result(resp)
+            return resp
+        finally:
+            del self._in_flight_requests[key]
+
     async def get(
         self,
         path: str,
         response_callback: Callable[[httpx.Response], Any] | None = None,
         **kwargs: dict[str, Any],
     ) -> Any:
+        """Sends a ``GET`` request.
+
+        Identical ``GET`` requests (same URL, query parameters, headers,
+        marketplace and user) which are sent while another one is in flight
+        don't send a request. They wait for the response of the first one
+        instead. The response callback is applied to the shared response
+        for every request.
+
+        Args:
+            path: The API path.
+            response_callback: A custom response callback for this request.
+            **kwargs: Query parameters and keyword args supported by
+                :meth:`httpx.AsyncClient.request`. Pass ``coalesce=False`` to
+                always send a request. Requests with other httpx args than
+                ``params`` and ``headers`` (e.g. ``timeout``) are not
+                coalesced.
+
+        .. versionchanged:: v0.10.1
+           Identical in-flight requests are coalesced.
+        """
         self._prepare_params(kwargs)
         return await self._request(
             method="GET", path=path, response_callback=response_callback, **kwargs
@@ -561,3 +1198,263 @@ class AsyncClient(BaseClient[httpx.AsyncClient]):
             json=body,
             **kwargs,
         )
+
+    async def paginate(
+        self,
+        path: str,
+        num_results: int,
+        max_in_flight: int = 4,
+        items_key: str = "items",
+        **kwargs: Any,
+    ) -> AsyncIterator[Any]:
+        """Iterates over the items of all pages from a paginated endpoint.
+
+        After the first page is received, the total number of pages is taken
+        from the ``Total-Count`` header or the ``total_results`` key. Up to
+        `max_in_flight` of the remaining pages are then requested
+        concurrently as tasks. Items are yielded in page order.
+
+        Args:
+            path: The API path (e.g. ``library`` or ``catalog/products``).
+            num_results: The number of items per page. Must not exceed the
+                maximum of the endpoint.
+            max_in_flight: The maximum number of pages requested at the same
+                time and held in memory.
+            items_key: The key of the items list in the response.
+            **kwargs: Query parameters and keyword args supported by
+                :meth:`get`.
+
+        Yields:
+            The items of all pages.
+
+        .. versionadded:: v0.10.1
+        """
+        callback = partial(self._page_response_callback, items_key=items_key)
+
+        async def get_page(page: int) -> tuple[list[Any], int | None]:
+            page_kwargs = self._prepare_page_kwargs(kwargs, page, num_results)
+            result: tuple[list[Any], int | None] = await self._request(
+                method="GET", path=path, response_callback=callback, **page_kwargs
+            )
+            return result
+
+        items, total = await get_page(1)
+        if len(items) < num_results:
+            for item in items:
+                yield item
+            return
+
+        last_page = self._last_page(total, num_results)
+        next_page = 2
+        last_page_reached = False
+        pending: deque[asyncio.Task[tuple[list[Any], int | None]]] = deque()
+
+        def fill() -> None:
+            # called before the items of a page are yielded, so the next
+            # pages are requested while the consumer processes them
+            nonlocal next_page
+            while (
+                not last_page_reached
+                and len(pending) < max_in_flight
+                and next_page <= last_page
+            ):
+                pending.append(asyncio.create_task(get_page(next_page)))
+                next_page += 1
+
+        try:
+            fill()
+            for item in items:
+                yield item
+            while pending:
+                items, _ = await pending.popleft()
+                if len(items) < num_results:
+                    last_page_reached = True
+                fill()
+                for item in items:
+                    yield item
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def iter_library(
+        self, num_results: int = 1000, max_in_flight: int = 1, **kwargs: Any
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Iterates over all items in the library.
+
+        While the items of a page are consumed, the next page is already
+        requested in background. See :meth:`paginate` for details.
+
+        Args:
+            num_results: The number of items per page (max 1000).
+            max_in_flight: The maximum number of pages requested at the same
+                time and held in memory.
+            **kwargs: Query parameters and keyword args supported by
+                :meth:`get` (e.g. ``response_groups``).
+
+        Returns:
+            An async iterator over the library items.
+
+        .. versionadded:: v0.10.1
+        """
+        return self.paginate(
+            "library",
+            num_results=num_results,
+            max_in_flight=max_in_flight,
+            **kwargs,
+        )
+
+    async def get_products(
+        self,
+        asins: Iterable[str],
+        response_groups: str | None = None,
+        chunk_size: int = 50,
+        max_in_flight: int = 4,
+        **kwargs: Any,
+    ) -> dict[str, dict[str, Any]]:
+        """Requests the catalog products for many ASINs.
+
+        Same as :meth:`audible.Client.get_products` but the chunks are
+        requested concurrently on the event loop.
+
+        Args:
+            asins: The ASINs to request. Duplicates are requested once.
+            response_groups: The response groups to request.
+            chunk_size: The number of ASINs per request (max 50).
+            max_in_flight: The maximum number of concurrent requests.
+            **kwargs: Query parameters and keyword args supported by
+                :meth:`get`.
+
+        Returns:
+            The products keyed by ASIN. ASINs which are not found in the
+            catalog are missing.
+
+        .. versionadded:: v0.10.1
+        """
+        chunks = self._chunk_asins(asins, chunk_size)
+        semaphore = asyncio.Semaphore(max_in_flight)
+
+        async def get_chunk(chunk: list[str]) -> dict[str, Any]:
+            chunk_kwargs = self._prepare_products_kwargs(kwargs, chunk, response_groups)
+            async with semaphore:
+                result: dict[str, Any] = await self._request(
+                    method="GET",
+                    path="catalog/products",
+                    response_callback=partial(
+                        default_response_callback, json_decoder=self._json_decoder
+                    ),
+                    **chunk_kwargs,
+                )
+            return result
+
+        tasks = [asyncio.ensure_future(get_chunk(chunk)) for chunk in chunks]
+        try:
+            results = await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+        return self._products_by_asin(results)
+
+    async def stream_items(
+        self,
+        path: str,
+        items_key: str = "items",
+        item_factory: Callable[[bytes], Any] | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[Any]:
+        """Streams the items of a ``GET`` response while it is received.
+
+        Same as :meth:`audible.Client.stream_items` but asynchronous.
+        Requests are not coalesced.
+
+        Args:
+            path: The API path (e.g. ``library``).
+            items_key: The key of the items array in the response.
+            item_factory: A callable which creates an item from its raw JSON
+                bytes (e.g. :class:`audible.models.LibraryItem`). If ``None``,
+                items are decoded with the JSON decoder of the client.
+            **kwargs: Query parameters and keyword args supported by
+                :meth:`get`.
+
+        Yields:
+            The items of the response.
+
+        .. versionadded:: v0.10.1
+        """
+        self._prepare_params(kwargs)
+        kwargs.pop("coalesce", None)  # streamed requests are never coalesced
+        url = self._prepare_api_path(path)
+        make_item = item_factory or self._json_decoder
+
+        attempt = 1
+        while True:
+            splitter = ItemSplitter(items_key)
+            yielded = False
+            try:
+                await self._wait_for_rate_limit(url)
+                with _convert_request_errors():
+                    async with self.session.stream("GET", url, **kwargs) as resp:
+                        if not resp.is_success:
+                            await resp.aread()
+                            raise_for_status(resp)
+                        async for chunk in resp.aiter_bytes():
+                            for raw in splitter.feed(chunk):
+                                yielded = True
+                                yield make_item(raw)
+                return
+            except RequestError as exc:
+                # the consumer already got items, a retry would repeat them
+                delay = None if yielded else self._get_retry_delay("GET", attempt, exc)
+                if delay is None:
+                    raise
+                report_overload(exc)
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def map(
+        self,
+        func: Callable[[_T], Awaitable[_R]],
+        iterable: Iterable[_T],
+        limiter: AdaptiveLimiter | None = None,
+        return_exceptions: bool = False,
+    ) -> list[_R | BaseException]:
+        """Applies `func` concurrently to all items with an adaptive limit.
+
+        The number of concurrent calls is controlled by an
+        :class:`audible.concurrency.AdaptiveLimiter`. It increases while the
+        API answers fast and decreases when it responds with rate limit or
+        server errors or times out.
+
+        Example::
+
+            items = await client.map(
+                lambda asin: client.get(f"library/{asin}"), asins
+            )
+
+        Args:
+            func: A coroutine function which is called with every item.
+            iterable: The items.
+            limiter: The limiter to use. Pass the same limiter to multiple
+                calls to keep the learned limit. If ``None``, a new limiter
+                with default settings is used.
+            return_exceptions: If ``True``, exceptions are returned as
+                results. Otherwise, if a call raises, all pending calls are
+                cancelled and the exception is raised.
+
+        Returns:
+            The results in the order of the items.
+
+        .. versionadded:: v0.10.1
+        """
+        if limiter is None:
+            limiter = AdaptiveLimiter()
+
+        async def run(item: _T) -> _R:
+            async with limiter.slot():
+                return await func(item)
+
+        tasks = [asyncio.ensure_future(run(item)) for item in iterable]
+        try:
+            return await asyncio.gather(*tasks, return_exceptions=return_exceptions)
+        finally:
+            for task in tasks:
+                task.cancel()
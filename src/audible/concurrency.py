@@ -0,0 +1,182 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+
+from .exceptions import NotResponding, RatelimitError, ServerError
+
+
+logger = logging.getLogger("audible.concurrency")
+
+#: Exceptions which show that the API is overloaded.
+OVERLOAD_EXCEPTIONS: tuple[type[Exception], ...] = (
+    RatelimitError,
+    ServerError,
+    NotResponding,
+)
+
+_active_slot: ContextVar[tuple["AdaptiveLimiter", float] | None] = ContextVar(
+    "audible_active_slot", default=None
+)
+
+
+def report_overload(exc: Exception) -> None:
+    """Reports an overload to the limiter of the active slot.
+
+    Used by :class:`audible.AsyncClient` for errors which are retried and
+    therefore never reach the slot.
+    """
+    slot = _active_slot.get()
+    if slot is not None and isinstance(exc, OVERLOAD_EXCEPTIONS):
+        limiter, started = slot
+        limiter._on_overload(started)
+
+
+class AdaptiveLimiter:
+    """An adaptive concurrency limit for asyncio tasks.
+
+    The limit is adjusted with additive increase/multiplicative decrease
+    (AIMD). After every successful operation, the limit is increased by
+    ``1 / limit``, so it grows by about one per round trip of all slots. It
+    is only increased while the latency stays below `latency_tolerance`
+    times the lowest observed latency. If an operation raises one of the
+    :data:`OVERLOAD_EXCEPTIONS`, the limit is multiplied with `backoff`.
+    Operations started before the last decrease don't decrease the limit
+    again. Waiting operations get a slot in FIFO order.
+
+    Use :meth:`slot` like a semaphore::
+
+        limiter = AdaptiveLimiter()
+
+        async def get_item(asin):
+            async with limiter.slot():
+                return await client.get(f"library/{asin}")
+
+    Args:
+        initial_limit: The limit to start with.
+        min_limit: The lowest limit.
+        max_limit: The highest limit.
+        backoff: The factor to decrease the limit with on overload.
+        latency_tolerance: The limit is not increased if the latency is
+            higher than the lowest observed latency times this factor.
+
+    Attributes:
+        limit: The current limit. The number of concurrent operations is the
+            integer part of it.
+        successes: The number of successful operations.
+        overloads: The number of operations which failed with an overload.
+
+    .. versionadded:: v0.10.1
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        backoff: float = 0.5,
+        latency_tolerance: float = 2.0,
+    ) -> None:
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError("min_limit <= initial_limit <= max_limit required.")
+        if not 0 < backoff < 1:
+            raise ValueError("backoff must be between 0 and 1.")
+        self.limit = float(initial_limit)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff = backoff
+        self.latency_tolerance = latency_tolerance
+        self.successes = 0
+        self.overloads = 0
+        self._in_flight = 0
+        self._min_latency: float | None = None
+        self._last_decrease = 0.0
+        # every waiter has an own future, so the limiter is not bound to an
+        # event loop and a release only wakes as many waiters as slots are free
+        self._waiters: deque[asyncio.Future[None]] = deque()
+
+    def __repr__(self) -> str:
+        return (
+            f"<{type(self).__name__} limit={int(self.limit)} "
+            f"in_flight={self._in_flight}>"
+        )
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def _has_capacity(self) -> bool:
+        return self._in_flight < int(self.limit)
+
+    async def _acquire(self) -> None:
+        # waiters of cancelled tasks are dropped when they reach the front
+        while self._waiters and self._waiters[0].done():
+            self._waiters.popleft()
+        if not self._waiters and self._has_capacity():
+            self._in_flight += 1
+            return
+
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if not waiter.cancelled():
+                # the slot was handed over before the task was cancelled
+                self._release()
+            raise
+
+    def _release(self) -> None:
+        self._in_flight -= 1
+        self._wake_waiters()
+
+    def _wake_waiters(self) -> None:
+        # hands the free slots over to the first waiters
+        while self._waiters and self._has_capacity():
+            waiter = self._waiters.popleft()
+            if waiter.done() or waiter.get_loop().is_closed():
+                continue
+            self._in_flight += 1
+            waiter.set_result(None)
+
+    def _on_success(self, latency: float) -> None:
+        self.successes += 1
+        if self._min_latency is None or latency < self._min_latency:
+            self._min_latency = latency
+        if latency > self._min_latency * self.latency_tolerance:
+            return
+        self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+
+    def _on_overload(self, started: float) -> None:
+        self.overloads += 1
+        if started < self._last_decrease:
+            return
+        self.limit = max(self.min_limit, self.limit * self.backoff)
+        self._last_decrease = time.monotonic()
+        logger.debug("overload detected, limit decreased to %s", int(self.limit))
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Waits for a free slot and holds it while the context is active."""
+        await self._acquire()
+        started = time.monotonic()
+        token = _active_slot.set((self, started))
+        # other errors (e.g. NotFoundError) neither increase nor decrease the limit
+        outcome = None
+        try:
+            yield
+        except OVERLOAD_EXCEPTIONS:
+            outcome = "overload"
+            raise
+        else:
+            outcome = "success"
+        finally:
+            _active_slot.reset(token)
+            if outcome == "overload":
+                self._on_overload(started)
+            elif outcome == "success":
+                self._on_success(time.monotonic() - started)
+            self._release()
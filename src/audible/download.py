@@ -0,0 +1,633 @@
+import hashlib
+import json
+import logging
+import os
+import pathlib
+import re
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from types import TracebackType
+from typing import Any
+
+import httpx
+
+from .client import _convert_request_errors
+from .exceptions import DownloadError
+from .ratelimit import TokenBucket
+
+
+logger = logging.getLogger("audible.download")
+
+#: The size of a segment which is requested with one range request.
+DEFAULT_SEGMENT_SIZE = 16 * 1024 * 1024
+#: The size of the chunks read from a response.
+DEFAULT_CHUNK_SIZE = 64 * 1024
+#: The default headers for download requests, the CDN expects an app user agent.
+DEFAULT_HEADERS = {"User-Agent": "Audible/671 CFNetwork/1240.0.4 Darwin/20.6.0"}
+
+_CONTENT_RANGE = re.compile(r"bytes (\d+)-(\d+)/(\d+|\*)")
+
+ProgressCallback = Callable[[int, int], Any]
+
+#: The suffix of the manifest file next to a downloaded file.
+MANIFEST_SUFFIX = ".manifest.json"
+#: The hash algorithm for the segments of a download.
+HASH_ALGORITHM = "sha256"
+
+_HAS_PWRITE = hasattr(os, "pwrite")
+
+
+def _check_status(resp: httpx.Response) -> None:
+    if not resp.is_success:
+        raise DownloadError(
+            f"Download request failed with {resp.status_code} {resp.reason_phrase}."
+        )
+
+
+def combine_hashes(hashes: list[str], algorithm: str = HASH_ALGORITHM) -> str:
+    """Returns the hash of a file from the hashes of its segments.
+
+    The file hash is the hash of the concatenated segment digests. It
+    depends on the segment size.
+
+    .. versionadded:: v0.10.1
+    """
+    hasher = hashlib.new(algorithm)
+    for segment_hash in hashes:
+        hasher.update(bytes.fromhex(segment_hash))
+    return hasher.hexdigest()
+
+
+class DownloadManifest:
+    """The manifest of a downloaded file.
+
+    The manifest is stored as JSON next to the file (``book.aaxc`` has the
+    manifest ``book.aaxc.manifest.json``). It contains the size, the hashes
+    of the segments, which are computed while the file is downloaded, and
+    optional metadata like the license of the file.
+
+    Args:
+        size: The size of the file.
+        segment_size: The size of the hashed segments.
+        segment_hashes: The hex digests of the segments.
+        metadata: Additional JSON serializable data.
+        algorithm: The hash algorithm.
+
+    .. versionadded:: v0.10.1
+    """
+
+    def __init__(
+        self,
+        size: int,
+        segment_size: int,
+        segment_hashes: list[str],
+        metadata: dict[str, Any] | None = None,
+        algorithm: str = HASH_ALGORITHM,
+    ) -> None:
+        self.size = size
+        self.segment_size = segment_size
+        self.segment_hashes = segment_hashes
+        self.metadata = metadata
+        self.algorithm = algorithm
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} size={self.size} hash={self.hash}>"
+
+    @property
+    def hash(self) -> str:
+        """The hash of the file, see :func:`combine_hashes`."""
+        return combine_hashes(self.segment_hashes, self.algorithm)
+
+    @staticmethod
+    def path_for(filename: str | pathlib.Path) -> pathlib.Path:
+        """Returns the manifest file of the downloaded `filename`."""
+        filename = pathlib.Path(filename)
+        return filename.with_name(filename.name + MANIFEST_SUFFIX)
+
+    @classmethod
+    def load(cls, filename: str | pathlib.Path) -> "DownloadManifest":
+        """Loads the manifest of the downloaded `filename`.
+
+        Raises:
+            DownloadError: If the manifest is missing or invalid.
+        """
+        path = cls.path_for(filename)
+        try:
+            data = json.loads(path.read_text())
+            manifest = cls(
+                size=data["size"],
+                segment_size=data["segment_size"],
+                segment_hashes=data["segment_hashes"],
+                metadata=data.get("metadata"),
+                algorithm=data["algorithm"],
+            )
+        except (OSError, ValueError, KeyError, TypeError) as exc:
+            raise DownloadError(f"Can't load manifest {path}: {exc}") from exc
+        if data.get("hash") != manifest.hash:
+            raise DownloadError(f"Manifest {path} is corrupted.")
+        return manifest
+
+    def save(self, filename: str | pathlib.Path) -> None:
+        """Saves the manifest for the downloaded `filename`."""
+        data = {
+            "size": self.size,
+            "algorithm": self.algorithm,
+            "hash": self.hash,
+            "segment_size": self.segment_size,
+            "segment_hashes": self.segment_hashes,
+            "metadata": self.metadata,
+        }
+        path = self.path_for(filename)
+        tmp = path.with_name(path.name + ".tmp")
+        with open(tmp, "w") as f:
+            json.dump(data, f, indent=4)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+
+
+def verify_download(filename: str | pathlib.Path, *, full: bool = False) -> bool:
+    """Verifies a downloaded file with its manifest.
+
+    By default, only the manifest and the file size are checked, the file is
+    not read. With `full`, the file is read and the hashes of all segments
+    are compared.
+
+    Returns:
+        ``True`` if the file matches its manifest.
+
+    .. versionadded:: v0.10.1
+    """
+    filename = pathlib.Path(filename)
+    try:
+        manifest = DownloadManifest.load(filename)
+        size = filename.stat().st_size
+    except (DownloadError, OSError) as exc:
+        logger.info("can't verify %s: %s", filename, exc)
+        return False
+
+    if size != manifest.size:
+        logger.info("%s has %s bytes, expected %s", filename, size, manifest.size)
+        return False
+    if not full:
+        return True
+
+    with filename.open("rb") as f:
+        for index, expected in enumerate(manifest.segment_hashes):
+            hasher = hashlib.new(manifest.algorithm)
+            remaining = manifest.segment_size
+            while remaining > 0:
+                data = f.read(min(remaining, DEFAULT_CHUNK_SIZE))
+                if not data:
+                    break
+                hasher.update(data)
+                remaining -= len(data)
+            if hasher.hexdigest() != expected:
+                logger.info("segment %s of %s does not match", index, filename)
+                return False
+    return True
+
+
+class DownloadProgress:
+    """The persisted progress of a segmented download.
+
+    The hashes of the finished segments are stored as JSON in `filename`
+    after every segment, so an interrupted download can be resumed.
+
+    Args:
+        filename: The progress file.
+        size: The size of the downloaded file.
+        segment_size: The size of the segments.
+        hashes: The hex digests of the finished segments by index.
+
+    .. versionadded:: v0.10.1
+    """
+
+    def __init__(
+        self,
+        filename: pathlib.Path,
+        size: int,
+        segment_size: int,
+        hashes: dict[int, str] | None = None,
+    ) -> None:
+        self.filename = filename
+        self.size = size
+        self.segment_size = segment_size
+        self.hashes = hashes or {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(
+        cls, filename: pathlib.Path, size: int, segment_size: int
+    ) -> "DownloadProgress":
+        """Loads the progress from `filename`.
+
+        If the file does not exist or belongs to a download with another size
+        or segment size, a new progress is returned.
+        """
+        try:
+            data = json.loads(filename.read_text())
+        except (OSError, ValueError):
+            return cls(filename, size, segment_size)
+
+        if (
+            "hashes" not in data
+            or data.get("size") != size
+            or data.get("segment_size") != segment_size
+        ):
+            logger.info("progress file %s does not match, start again", filename)
+            return cls(filename, size, segment_size)
+        hashes = {int(index): value for index, value in data["hashes"].items()}
+        return cls(filename, size, segment_size, hashes)
+
+    @property
+    def done(self) -> set[int]:
+        """The indices of the finished segments."""
+        return set(self.hashes)
+
+    @property
+    def segments(self) -> list[tuple[int, int, int]]:
+        """All segments as ``(index, first byte, last byte)``."""
+        return [
+            (index, start, min(start + self.segment_size, self.size) - 1)
+            for index, start in enumerate(range(0, self.size, self.segment_size))
+        ]
+
+    @property
+    def pending(self) -> list[tuple[int, int, int]]:
+        """The segments which are not finished."""
+        return [segment for segment in self.segments if segment[0] not in self.done]
+
+    @property
+    def downloaded(self) -> int:
+        """The number of bytes of the finished segments."""
+        return sum(end - start + 1 for i, start, end in self.segments if i in self.done)
+
+    def mark_done(self, index: int, segment_hash: str) -> None:
+        """Marks the segment `index` as finished and saves the progress."""
+        with self._lock:
+            self.hashes[index] = segment_hash
+            self.save()
+
+    def save(self) -> None:
+        data = {
+            "size": self.size,
+            "segment_size": self.segment_size,
+            "hashes": {str(index): value for index, value in self.hashes.items()},
+        }
+        tmp = self.filename.with_name(self.filename.name + ".tmp")
+        tmp.write_text(json.dumps(data))
+        os.replace(tmp, self.filename)
+
+    def remove(self) -> None:
+        self.filename.unlink(missing_ok=True)
+
+
+class Downloader:
+    """Downloads files with parallel range requests.
+
+    A file is split into segments of `segment_size` bytes. Up to
+    `max_connections` segments are requested in parallel with HTTP ``Range``
+    requests and written into a preallocated ``.part`` file at their offsets.
+    Finished segments are recorded in a ``.progress`` file next to it, so an
+    interrupted download continues with the missing segments. When all
+    segments are written, the size is verified and the ``.part`` file is
+    renamed to the target filename.
+
+    If the server does not support range requests, the file is downloaded
+    with a single request.
+
+    A downloader can be used from multiple threads to download several files
+    at once. `max_connections` and `bandwidth_limit` apply to all downloads
+    of the downloader together.
+
+    Example::
+
+        with Downloader(max_connections=8) as downloader:
+            downloader.download(offline_url, "book.aaxc")
+
+    Args:
+        max_connections: The maximum number of parallel requests.
+        segment_size: The size of a segment in bytes.
+        session: The httpx client for the requests. If ``None``, a client is
+            created and closed together with the downloader.
+        timeout: The timeout for requests of the created client.
+        bandwidth_limit: The maximum download rate in bytes per second.
+
+    .. versionadded:: v0.10.1
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 4,
+        segment_size: int = DEFAULT_SEGMENT_SIZE,
+        *,
+        session: httpx.Client | None = None,
+        timeout: float = 30,
+        bandwidth_limit: float | None = None,
+    ) -> None:
+        if max_connections < 1:
+            raise ValueError("max_connections must be greater than 0.")
+        if segment_size < 1:
+            raise ValueError("segment_size must be greater than 0.")
+        self.max_connections = max_connections
+        self.segment_size = segment_size
+        self._connections = threading.Semaphore(max_connections)
+        self._bandwidth = (
+            TokenBucket(bandwidth_limit, max(bandwidth_limit, DEFAULT_CHUNK_SIZE))
+            if bandwidth_limit is not None
+            else None
+        )
+        self._owns_session = session is None
+        if session is None:
+            session = httpx.Client(
+                headers=DEFAULT_HEADERS,
+                timeout=timeout,
+                follow_redirects=True,
+                limits=httpx.Limits(max_connections=max_connections),
+            )
+        self.session = session
+
+    def __enter__(self) -> "Downloader":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None = None,
+        exc_value: BaseException | None = None,
+        traceback: TracebackType | None = None,
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._owns_session:
+            self.session.close()
+
+    def _throttle(self, num_bytes: int) -> None:
+        if self._bandwidth is not None:
+            delay = self._bandwidth.reserve(num_bytes)
+            if delay > 0:
+                time.sleep(delay)
+
+    def _probe(self, url: str) -> tuple[int, bool]:
+        # returns the file size and if the server supports range requests
+        with (
+            self._connections,
+            self.session.stream("GET", url, headers={"Range": "bytes=0-0"}) as resp,
+        ):
+            _check_status(resp)
+            if resp.status_code == 206:
+                match = _CONTENT_RANGE.fullmatch(resp.headers.get("Content-Range", ""))
+                if match is None or match.group(3) == "*":
+                    raise DownloadError(f"Can't determine the size of {url}.")
+                return int(match.group(3)), True
+            content_length = resp.headers.get("Content-Length")
+            if content_length is None:
+                raise DownloadError(f"Can't determine the size of {url}.")
+            return int(content_length), False
+
+    def download(
+        self,
+        url: str,
+        filename: str | pathlib.Path,
+        size: int | None = None,
+        progress_callback: ProgressCallback | None = None,
+        *,
+        metadata: dict[str, Any] | None = None,
+    ) -> pathlib.Path:
+        """Downloads `url` to `filename`.
+
+        The file is hashed while it is downloaded. The hashes are stored
+        together with the size and `metadata` in a
+        :class:`DownloadManifest` next to the file.
+
+        Args:
+            url: The url of the file (e.g. the ``offline_url`` of a license).
+            filename: The target file.
+            size: The expected size of the file. If given, a different size
+                reported by the server raises a :class:`DownloadError`.
+            progress_callback: Called with the downloaded and the total
+                number of bytes after every chunk. It is called from worker
+                threads.
+            metadata: Stored in the manifest (e.g. the license metadata).
+
+        Returns:
+            The path of the downloaded file.
+
+        Raises:
+            DownloadError: If the download failed or the file is incomplete.
+        """
+        target = pathlib.Path(filename)
+        part = target.with_name(target.name + ".part")
+        target.parent.mkdir(parents=True, exist_ok=True)
+
+        with _convert_request_errors():
+            total, supports_range = self._probe(url)
+        if size is not None and size != total:
+            raise DownloadError(
+                f"Server reports {total} bytes for {target.name}, expected {size}."
+            )
+
+        counter = _ProgressCounter(total, progress_callback)
+        if supports_range:
+            segment_size = self.segment_size
+            hashes = self._download_segments(url, part, total, counter)
+        else:
+            logger.info("server does not support range requests, use one request")
+            segment_size = total
+            hashes = [self._download_single(url, part, total, counter)]
+
+        # the manifest is written after the rename, so it never describes a
+        # missing file or the file of an earlier download
+        manifest = DownloadManifest(total, segment_size, hashes, metadata)
+        DownloadManifest.path_for(target).unlink(missing_ok=True)
+        os.replace(part, target)
+        manifest.save(target)
+        logger.info("downloaded %s (%s bytes)", target, total)
+        return target
+
+    def _download_segments(
+        self, url: str, part: pathlib.Path, total: int, counter: "_ProgressCounter"
+    ) -> list[str]:
+        progress_file = part.with_name(part.name.removesuffix(".part") + ".progress")
+        progress = DownloadProgress.load(progress_file, total, self.segment_size)
+        resume = part.exists() and part.stat().st_size == total
+        if not resume:
+            progress = DownloadProgress(progress_file, total, self.segment_size)
+        elif progress.done:
+            logger.info("resume download of %s", part)
+
+        counter.add(progress.downloaded)
+
+        with _PartFile(part, truncate=not resume) as part_file:
+            if not resume:
+                part_file.preallocate(total)
+
+            def download_segment(segment: tuple[int, int, int]) -> None:
+                index, start, end = segment
+                segment_hash = self._download_range(url, part_file, start, end, counter)
+                # a segment is only marked as done once its data is on disk
+                part_file.sync()
+                progress.mark_done(index, segment_hash)
+
+            pending = progress.pending
+            workers = min(self.max_connections, len(pending)) or 1
+            with ThreadPoolExecutor(
+                workers, thread_name_prefix="audible-dl"
+            ) as executor:
+                futures = [executor.submit(download_segment, seg) for seg in pending]
+                try:
+                    for future in futures:
+                        future.result()
+                except BaseException:
+                    for future in futures:
+                        future.cancel()
+                    raise
+
+        # the part file is preallocated, its size says nothing about the
+        # downloaded data
+        if progress.pending:
+            raise DownloadError(
+                f"{len(progress.pending)} segments of {part.name} are missing."
+            )
+        progress.remove()
+        return [progress.hashes[index] for index, _, _ in progress.segments]
+
+    def _write_response(
+        self,
+        resp: httpx.Response,
+        part_file: "_PartFile",
+        offset: int,
+        counter: "_ProgressCounter",
+        hasher: "hashlib._Hash",
+    ) -> int:
+        # Hashes the received chunks and writes them at the file offset.
+        # The chunks of httpx are written as they are, without copying them
+        # into a buffer. Returns the number of bytes.
+        written = 0
+        for chunk in resp.iter_bytes():
+            hasher.update(chunk)
+            part_file.write_at(memoryview(chunk), offset + written)
+            written += len(chunk)
+            counter.add(len(chunk))
+            self._throttle(len(chunk))
+        return written
+
+    def _download_range(
+        self,
+        url: str,
+        part_file: "_PartFile",
+        start: int,
+        end: int,
+        counter: "_ProgressCounter",
+    ) -> str:
+        # returns the hex digest of the range
+        headers = {"Range": f"bytes={start}-{end}"}
+        hasher = hashlib.new(HASH_ALGORITHM)
+        with (
+            _convert_request_errors(),
+            self._connections,
+            self.session.stream("GET", url, headers=headers) as resp,
+        ):
+            _check_status(resp)
+            if resp.status_code != 206:
+                raise DownloadError(f"Range request for bytes {start}-{end} failed.")
+            written = self._write_response(resp, part_file, start, counter, hasher)
+
+        if written != end - start + 1:
+            raise DownloadError(
+                f"Received {written} bytes for range {start}-{end}, "
+                f"expected {end - start + 1}."
+            )
+        return hasher.hexdigest()
+
+    def _download_single(
+        self, url: str, part: pathlib.Path, total: int, counter: "_ProgressCounter"
+    ) -> str:
+        hasher = hashlib.new(HASH_ALGORITHM)
+        with (
+            _convert_request_errors(),
+            self._connections,
+            self.session.stream("GET", url) as resp,
+            _PartFile(part, truncate=True) as part_file,
+        ):
+            _check_status(resp)
+            part_file.preallocate(total)
+            written = self._write_response(resp, part_file, 0, counter, hasher)
+            part_file.sync()
+
+        if written != total:
+            raise DownloadError(f"Received {written} bytes, expected {total}.")
+        return hasher.hexdigest()
+
+
+class _PartFile:
+    # A file which is written at offsets from multiple threads. Uses
+    # os.pwrite where available, otherwise seek and write under a lock.
+    def __init__(self, filename: pathlib.Path, *, truncate: bool) -> None:
+        flags = os.O_RDWR | os.O_CREAT | getattr(os, "O_BINARY", 0)
+        if truncate:
+            flags |= os.O_TRUNC
+        self.filename = filename
+        self.fd = os.open(filename, flags, 0o644)
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "_PartFile":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None = None,
+        exc_value: BaseException | None = None,
+        traceback: TracebackType | None = None,
+    ) -> None:
+        os.close(self.fd)
+
+    def preallocate(self, size: int) -> None:
+        # reserves the blocks at once, which avoids fragmentation of large files
+        if hasattr(os, "posix_fallocate"):
+            try:
+                os.posix_fallocate(self.fd, 0, size)
+            except OSError as exc:
+                # e.g. not supported by the filesystem
+                logger.debug("posix_fallocate failed for %s: %s", self.filename, exc)
+            else:
+                return
+        os.ftruncate(self.fd, size)
+
+    def sync(self) -> None:
+        # flushes the written data to the disk
+        if hasattr(os, "fdatasync"):
+            os.fdatasync(self.fd)
+        else:
+            os.fsync(self.fd)
+
+    def write_at(self, data: memoryview, offset: int) -> None:
+        if _HAS_PWRITE:
+            while data:
+                num_bytes = os.pwrite(self.fd, data, offset)
+                data = data[num_bytes:]
+                offset += num_bytes
+            return
+        with self._lock:
+            os.lseek(self.fd, offset, os.SEEK_SET)
+            while data:
+                num_bytes = os.write(self.fd, data)
+                data = data[num_bytes:]
+
+
+class _ProgressCounter:
+    def __init__(self, total: int, callback: ProgressCallback | None) -> None:
+        self.total = total
+        self.downloaded = 0
+        self._callback = callback
+        self._lock = threading.Lock()
+
+    def add(self, num_bytes: int) -> None:
+        with self._lock:
+            self.downloaded += num_bytes
+            downloaded = self.downloaded
+        if self._callback is not None:
+            self._callback(downloaded, self.total)
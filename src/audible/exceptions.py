@@ -86,3 +86,7 @@ class NoRefreshToken(AudibleError):
 
 class FileEncryptionError(AudibleError):
     """Raised if something is wrong with file encryption."""
+
+
+class DownloadError(AudibleError):
+    """Raised if a download failed or the downloaded file is incomplete."""
@@ -0,0 +1,215 @@
+import json
+import logging
+import pathlib
+import sqlite3
+from collections.abc import Iterable, Iterator
+from datetime import datetime, timedelta, timezone
+from types import TracebackType
+from typing import TYPE_CHECKING, Any
+
+
+if TYPE_CHECKING:
+    from .client import AsyncClient, Client
+
+
+logger = logging.getLogger("audible.library")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    asin TEXT PRIMARY KEY,
+    purchase_date TEXT,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+# purchases made shortly before a sync may not be visible to the library
+# endpoint yet, so each delta request overlaps the previous sync
+SYNC_OVERLAP = timedelta(minutes=10)
+
+
+def _to_rfc3339(dt: datetime) -> str:
+    return dt.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+class LibrarySnapshot:
+    """A local SQLite snapshot of the Audible library.
+
+    The first :meth:`sync` requests the whole library. Subsequent syncs only
+    request items purchased since the last sync (with the ``purchased_after``
+    query parameter of the library endpoint) and merge them into the
+    snapshot.
+
+    Note:
+        A delta sync only finds new purchases. Changes to existing items
+        (e.g. ``percent_complete``) or returned items are only picked up by
+        a full sync with ``full=True``.
+
+    Args:
+        filename: The SQLite database file. Use ``:memory:`` for an
+            in-memory snapshot.
+        response_groups: The default response groups requested for library
+            items. ``response_groups`` passed to :meth:`sync` take precedence.
+            If the requested response groups differ from the ones of the
+            stored snapshot, the sync is a full sync.
+
+    .. versionadded:: v0.10.1
+    """
+
+    def __init__(
+        self, filename: str | pathlib.Path, response_groups: str | None = None
+    ) -> None:
+        self.filename = filename
+        self.response_groups = response_groups
+        self._conn = sqlite3.connect(filename)
+        self._conn.executescript(_SCHEMA)
+
+    def __enter__(self) -> "LibrarySnapshot":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None = None,
+        exc_value: BaseException | None = None,
+        traceback: TracebackType | None = None,
+    ) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        row = self._conn.execute("SELECT COUNT(*) FROM items").fetchone()
+        return int(row[0])
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        for (data,) in self._conn.execute("SELECT data FROM items ORDER BY asin"):
+            yield json.loads(data)
+
+    def __contains__(self, asin: object) -> bool:
+        return self.get(asin) is not None if isinstance(asin, str) else False
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} {self.filename} with {len(self)} items>"
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def get(self, asin: str) -> dict[str, Any] | None:
+        """Returns the stored library item for `asin` or ``None``."""
+        row = self._conn.execute(
+            "SELECT data FROM items WHERE asin = ?", (asin,)
+        ).fetchone()
+        if row is None:
+            return None
+        item: dict[str, Any] = json.loads(row[0])
+        return item
+
+    def _get_meta(self, key: str) -> str | None:
+        row = self._conn.execute(
+            "SELECT value FROM meta WHERE key = ?", (key,)
+        ).fetchone()
+        return row[0] if row is not None else None
+
+    def _set_meta(self, key: str, value: str) -> None:
+        self._conn.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value)
+        )
+
+    @property
+    def last_sync(self) -> datetime | None:
+        """The start time of the last successful sync."""
+        value = self._get_meta("last_sync")
+        return datetime.fromisoformat(value) if value is not None else None
+
+    def _prepare_sync(
+        self, marketplace: str, full: bool, kwargs: dict[str, Any]
+    ) -> tuple[bool, datetime]:
+        stored_marketplace = self._get_meta("marketplace")
+        if stored_marketplace is not None and stored_marketplace != marketplace:
+            raise ValueError(
+                f"Snapshot was created for marketplace {stored_marketplace}, "
+                f"client uses {marketplace}."
+            )
+
+        if self.response_groups is not None:
+            kwargs.setdefault("response_groups", self.response_groups)
+        response_groups = kwargs.get("response_groups") or ""
+        if response_groups != (self._get_meta("response_groups") or ""):
+            full = True
+
+        last_sync = self.last_sync
+        if last_sync is None:
+            full = True
+        elif not full:
+            kwargs["purchased_after"] = _to_rfc3339(last_sync - SYNC_OVERLAP)
+
+        logger.info("start %s library sync", "full" if full else "delta")
+        return full, datetime.now(timezone.utc)
+
+    def _store(
+        self,
+        items: Iterable[dict[str, Any]],
+        full: bool,
+        marketplace: str,
+        response_groups: str,
+        started: datetime,
+    ) -> int:
+        count = 0
+        with self._conn:
+            if full:
+                self._conn.execute("DELETE FROM items")
+            for item in items:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO items (asin, purchase_date, data) "
+                    "VALUES (?, ?, ?)",
+                    (item["asin"], item.get("purchase_date"), json.dumps(item)),
+                )
+                count += 1
+            self._set_meta("last_sync", started.isoformat())
+            self._set_meta("marketplace", marketplace)
+            self._set_meta("response_groups", response_groups)
+
+        logger.info("stored %s library items", count)
+        return count
+
+    def sync(self, client: "Client", full: bool = False, **kwargs: Any) -> int:
+        """Synchronizes the snapshot with the library.
+
+        The snapshot is only changed if all pages were received.
+
+        Args:
+            client: The client used to request the library.
+            full: If ``True``, request the whole library and replace the
+                snapshot.
+            **kwargs: Keyword args passed to :meth:`audible.Client.iter_library`.
+
+        Returns:
+            The number of received items.
+        """
+        full, started = self._prepare_sync(client.marketplace, full, kwargs)
+        items = client.iter_library(**kwargs)
+        response_groups = kwargs.get("response_groups") or ""
+        return self._store(items, full, client.marketplace, response_groups, started)
+
+    async def async_sync(
+        self, client: "AsyncClient", full: bool = False, **kwargs: Any
+    ) -> int:
+        """Synchronizes the snapshot with the library.
+
+        Same as :meth:`sync` but with an :class:`audible.AsyncClient`.
+
+        Args:
+            client: The client used to request the library.
+            full: If ``True``, request the whole library and replace the
+                snapshot.
+            **kwargs: Keyword args passed to
+                :meth:`audible.AsyncClient.iter_library`.
+
+        Returns:
+            The number of received items.
+        """
+        full, started = self._prepare_sync(client.marketplace, full, kwargs)
+        items = [item async for item in client.iter_library(**kwargs)]
+        response_groups = kwargs.get("response_groups") or ""
+        return self._store(items, full, client.marketplace, response_groups, started)
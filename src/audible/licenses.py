@@ -0,0 +1,382 @@
+import asyncio
+import json
+import logging
+import pathlib
+import threading
+import time
+from collections.abc import Iterable
+from concurrent.futures import Executor, Future, ThreadPoolExecutor, as_completed
+from datetime import datetime
+from functools import partial
+from typing import TYPE_CHECKING, Any
+
+from .aescipher import decrypt_voucher, get_voucher_device_data
+from .exceptions import DownloadError
+from .utils import _write_private_file
+
+
+if TYPE_CHECKING:
+    from .client import AsyncClient, Client
+
+
+logger = logging.getLogger("audible.licenses")
+
+
+class License:
+    """A granted license with its decrypted voucher.
+
+    Args:
+        asin: The ASIN of the title.
+        response: The response of the license request.
+        voucher: The decrypted voucher with ``key`` and ``iv``.
+
+    .. versionadded:: v0.10.1
+    """
+
+    __slots__ = ("asin", "response", "voucher")
+
+    def __init__(
+        self, asin: str, response: dict[str, Any], voucher: dict[str, Any]
+    ) -> None:
+        self.asin = asin
+        self.response = response
+        self.voucher = voucher
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} {self.asin} expires={self.expires}>"
+
+    @property
+    def content_metadata(self) -> dict[str, Any]:
+        metadata: dict[str, Any] = self.response["content_license"]["content_metadata"]
+        return metadata
+
+    @property
+    def offline_url(self) -> str:
+        """The download url of the file."""
+        url: str = self.content_metadata["content_url"]["offline_url"]
+        return url
+
+    @property
+    def expires(self) -> float | None:
+        """The expiry of the voucher, see :func:`get_voucher_expiry`."""
+        return get_voucher_expiry(self.voucher)
+
+
+def _parse_date(value: Any) -> float | None:
+    try:
+        return datetime.fromisoformat(str(value).replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return None
+
+
+def get_voucher_expiry(voucher: dict[str, Any]) -> float | None:
+    """Returns the earliest refresh or expire date of a voucher.
+
+    The dates are read from ``refreshDate`` and the ``EXPIRES`` parameters of
+    the voucher rules.
+
+    Returns:
+        The date as timestamp or ``None`` if the voucher has no dates.
+
+    .. versionadded:: v0.10.1
+    """
+    dates = [voucher.get("refreshDate")]
+    for rule in voucher.get("rules", []):
+        for parameter in rule.get("parameters", []):
+            if parameter.get("type") == "EXPIRES":
+                dates.append(parameter.get("expireDate"))
+
+    timestamps = [_parse_date(date) for date in dates if date is not None]
+    valid = [timestamp for timestamp in timestamps if timestamp is not None]
+    return min(valid) if valid else None
+
+
+class VoucherCache:
+    """An on-disk cache for licenses with decrypted vouchers.
+
+    Every license is stored as JSON file in `directory`, named by ASIN and
+    quality. A cached license is used until its voucher expires (see
+    :func:`get_voucher_expiry`) minus `margin`. Vouchers without dates are
+    used for `default_ttl` seconds.
+
+    Note:
+        The ``offline_url`` of a cached license can expire earlier than the
+        voucher. A :class:`audible.download.Downloader` resumes a download
+        with the url of a new license.
+
+    Args:
+        directory: The cache directory.
+        default_ttl: The lifetime in seconds of vouchers without dates.
+        margin: Licenses expiring within this number of seconds are not
+            returned.
+
+    .. versionadded:: v0.10.1
+    """
+
+    def __init__(
+        self,
+        directory: str | pathlib.Path,
+        default_ttl: float = 24 * 3600,
+        margin: float = 3600,
+    ) -> None:
+        self.directory = pathlib.Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.default_ttl = default_ttl
+        self.margin = margin
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return (
+            f"<{type(self).__name__} {self.directory} "
+            f"hits={self.hits} misses={self.misses}>"
+        )
+
+    def _path(self, asin: str, quality: str) -> pathlib.Path:
+        return self.directory / f"{asin}.{quality.lower()}.json"
+
+    def get(self, asin: str, quality: str = "High") -> License | None:
+        """Returns the cached license or ``None`` if missing or expired."""
+        path = self._path(asin, quality)
+        try:
+            data = json.loads(path.read_text())
+            expires = data["expires"]
+            license_ = License(asin, data["response"], data["voucher"])
+        except (OSError, ValueError, KeyError):
+            with self._lock:
+                self.misses += 1
+            return None
+
+        if expires - self.margin <= time.time():
+            logger.debug("cached license for %s expired", asin)
+            path.unlink(missing_ok=True)
+            with self._lock:
+                self.misses += 1
+            return None
+
+        with self._lock:
+            self.hits += 1
+        return license_
+
+    def set(self, license_: License, quality: str = "High") -> None:
+        """Stores `license_` until its voucher expires."""
+        expires = license_.expires
+        if expires is None:
+            expires = time.time() + self.default_ttl
+        data = {
+            "asin": license_.asin,
+            "expires": expires,
+            "response": license_.response,
+            "voucher": license_.voucher,
+        }
+        # the voucher contains the key of the file
+        _write_private_file(self._path(license_.asin, quality), json.dumps(data))
+
+    def remove(self, asin: str, quality: str = "High") -> None:
+        self._path(asin, quality).unlink(missing_ok=True)
+
+
+def _license_body(quality: str) -> dict[str, str]:
+    return {"drm_type": "Adrm", "consumption_type": "Download", "quality": quality}
+
+
+def _voucher_args(license_response: dict[str, Any]) -> tuple[str, str]:
+    # the key is derived from the ASIN of the license, like
+    # decrypt_voucher_from_licenserequest does
+    content_license = license_response["content_license"]
+    return content_license["asin"], content_license["license_response"]
+
+
+def _check_license(asin: str, license_response: dict[str, Any]) -> dict[str, Any]:
+    status = license_response["content_license"].get("status_code")
+    if status != "Granted":
+        raise DownloadError(f"License for {asin} not granted: {status}.")
+    return license_response
+
+
+def request_license(
+    client: "Client", asin: str, quality: str = "High"
+) -> dict[str, Any]:
+    """Requests a download license for `asin`.
+
+    Raises:
+        DownloadError: If the license is not granted.
+
+    .. versionadded:: v0.10.1
+    """
+    license_response = client.post(
+        f"content/{asin}/licenserequest", body=_license_body(quality)
+    )
+    return _check_license(asin, license_response)
+
+
+async def async_request_license(
+    client: "AsyncClient", asin: str, quality: str = "High"
+) -> dict[str, Any]:
+    """Requests a download license for `asin` with an async client.
+
+    Raises:
+        DownloadError: If the license is not granted.
+
+    .. versionadded:: v0.10.1
+    """
+    license_response = await client.post(
+        f"content/{asin}/licenserequest", body=_license_body(quality)
+    )
+    return _check_license(asin, license_response)
+
+
+def _collect(
+    asins: list[str],
+    results: dict[str, License | BaseException],
+    return_exceptions: bool,
+) -> dict[str, License | BaseException]:
+    ordered = {asin: results[asin] for asin in asins}
+    if not return_exceptions:
+        for result in ordered.values():
+            if isinstance(result, BaseException):
+                raise result
+    return ordered
+
+
+def request_licenses(
+    client: "Client",
+    asins: Iterable[str],
+    quality: str = "High",
+    *,
+    max_in_flight: int = 4,
+    cache: VoucherCache | None = None,
+    executor: Executor | None = None,
+    return_exceptions: bool = False,
+) -> dict[str, License | BaseException]:
+    """Requests the licenses for many titles and decrypts their vouchers.
+
+    Up to `max_in_flight` license requests are sent at the same time. The
+    vouchers are decrypted in `executor` while further licenses are
+    requested. The decryption is CPU bound, use a
+    :class:`concurrent.futures.ProcessPoolExecutor` to decrypt vouchers in
+    parallel. Licenses found in `cache` are not requested again, new
+    licenses are stored in it.
+
+    Example::
+
+        cache = VoucherCache("vouchers")
+        with audible.Client(auth=auth) as client:
+            licenses = request_licenses(client, asins, cache=cache)
+
+    Args:
+        client: The client for the license requests. Its authenticator needs
+            device and customer info.
+        asins: The ASINs of the titles. Duplicates are requested once.
+        quality: The requested quality (``High`` or ``Normal``).
+        max_in_flight: The maximum number of concurrent license requests.
+        cache: A cache for the licenses.
+        executor: The executor for the decryption. If ``None``, a thread is
+            used.
+        return_exceptions: If ``True``, errors are returned in place of the
+            licenses. Otherwise, the first error is raised after all
+            requests are done.
+
+    Returns:
+        The licenses by ASIN in the order of `asins`.
+
+    .. versionadded:: v0.10.1
+    """
+    device_data = get_voucher_device_data(client.auth)
+    unique = list(dict.fromkeys(asins))
+    results: dict[str, License | BaseException] = {}
+    todo = []
+    for asin in unique:
+        cached = cache.get(asin, quality) if cache is not None else None
+        if cached is not None:
+            results[asin] = cached
+        else:
+            todo.append(asin)
+
+    own_executor = executor is None
+    decrypt_executor = executor or ThreadPoolExecutor(
+        1, thread_name_prefix="audible-voucher"
+    )
+    decryptions: dict[str, tuple[dict[str, Any], Future[dict[str, Any]]]] = {}
+    try:
+        with ThreadPoolExecutor(
+            min(max_in_flight, len(todo)) or 1, thread_name_prefix="audible-license"
+        ) as pool:
+            requests = {
+                pool.submit(request_license, client, asin, quality): asin
+                for asin in todo
+            }
+            for request in as_completed(requests):
+                asin = requests[request]
+                try:
+                    license_response = request.result()
+                    voucher_args = _voucher_args(license_response)
+                except Exception as exc:
+                    results[asin] = exc
+                    continue
+                decryptions[asin] = (
+                    license_response,
+                    decrypt_executor.submit(
+                        decrypt_voucher, *device_data, *voucher_args
+                    ),
+                )
+
+        for asin, (license_response, decryption) in decryptions.items():
+            try:
+                license_ = License(asin, license_response, decryption.result())
+            except Exception as exc:
+                results[asin] = exc
+                continue
+            if cache is not None:
+                cache.set(license_, quality)
+            results[asin] = license_
+    finally:
+        if own_executor:
+            decrypt_executor.shutdown()
+
+    return _collect(unique, results, return_exceptions)
+
+
+async def async_request_licenses(
+    client: "AsyncClient",
+    asins: Iterable[str],
+    quality: str = "High",
+    *,
+    max_in_flight: int = 4,
+    cache: VoucherCache | None = None,
+    executor: Executor | None = None,
+    return_exceptions: bool = False,
+) -> dict[str, License | BaseException]:
+    """Async version of :func:`request_licenses`.
+
+    The vouchers are decrypted with :meth:`asyncio.loop.run_in_executor`.
+    If `executor` is ``None``, the default executor of the loop is used.
+
+    .. versionadded:: v0.10.1
+    """
+    device_data = get_voucher_device_data(client.auth)
+    unique = list(dict.fromkeys(asins))
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(max_in_flight)
+
+    async def get_license(asin: str) -> License:
+        if cache is not None:
+            cached = cache.get(asin, quality)
+            if cached is not None:
+                return cached
+        async with semaphore:
+            license_response = await async_request_license(client, asin, quality)
+        decrypted = await loop.run_in_executor(
+            executor,
+            partial(decrypt_voucher, *device_data, *_voucher_args(license_response)),
+        )
+        license_ = License(asin, license_response, decrypted)
+        if cache is not None:
+            cache.set(license_, quality)
+        return license_
+
+    licenses = await asyncio.gather(
+        *(get_license(asin) for asin in unique), return_exceptions=True
+    )
+    return _collect(unique, dict(zip(unique, licenses, strict=True)), return_exceptions)
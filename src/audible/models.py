@@ -0,0 +1,274 @@
+import json
+from collections.abc import Iterator
+from typing import Any, ClassVar, Generic, TypeVar, cast
+
+import httpx
+
+from ._json import ItemSplitter
+from .client import JSONDecoderT, default_json_decoder, raise_for_status
+
+
+ItemT = TypeVar("ItemT", bound="LazyItem")
+
+
+class LazyItem:
+    """An item of an API response which is decoded on first access.
+
+    The item holds the raw JSON bytes until a field is accessed. Then the
+    whole item is decoded once and the raw bytes are released. Items which
+    are only passed through (e.g. stored to disk with :attr:`raw`) are never
+    decoded.
+
+    Fields can be accessed like a dict (``item["asin"]``) or with the typed
+    properties of the subclasses.
+
+    Args:
+        raw: The raw JSON bytes of the item.
+        json_decoder: A callable to decode JSON from bytes. If ``None``,
+            :data:`audible.client.default_json_decoder` is used.
+
+    .. versionadded:: v0.10.1
+    """
+
+    __slots__ = ("_data", "_json_decoder", "_raw")
+
+    #: The key of the item in the response of the single item endpoint.
+    response_key: ClassVar[str] = "item"
+
+    def __init__(self, raw: bytes, json_decoder: JSONDecoderT | None = None) -> None:
+        self._raw: bytes | None = raw
+        self._data: dict[str, Any] | None = None
+        self._json_decoder = json_decoder
+
+    @classmethod
+    def from_dict(cls: type[ItemT], data: dict[str, Any]) -> ItemT:
+        """Creates an item from already decoded data."""
+        item = cls.__new__(cls)
+        item._raw = None
+        item._data = data
+        item._json_decoder = None
+        return item
+
+    @classmethod
+    def from_response(
+        cls: type[ItemT],
+        resp: httpx.Response,
+        json_decoder: JSONDecoderT | None = None,
+    ) -> ItemT:
+        """Creates an item from the response of a single item endpoint.
+
+        Can be used as `response_callback` for requests like
+        ``client.get("library/ASIN", response_callback=LibraryItem.from_response)``.
+
+        Args:
+            resp: The response to decode.
+            json_decoder: A callable to decode JSON from bytes. Pass
+                :attr:`audible.Client.json_decoder` to decode the response
+                like the client. If ``None``,
+                :data:`audible.client.default_json_decoder` is used.
+        """
+        raise_for_status(resp)
+        decoder = json_decoder or default_json_decoder
+        data = decoder(resp.content)
+        return cls.from_dict(data[cls.response_key])
+
+    @property
+    def is_decoded(self) -> bool:
+        return self._data is not None
+
+    @property
+    def raw(self) -> bytes:
+        """The raw JSON bytes of the item."""
+        if self._raw is not None:
+            return self._raw
+        return json.dumps(self.data).encode("utf-8")
+
+    @property
+    def data(self) -> dict[str, Any]:
+        """The decoded item."""
+        if self._data is None:
+            decoder = self._json_decoder or default_json_decoder
+            self._data = cast(dict[str, Any], decoder(cast(bytes, self._raw)))
+            self._raw = None
+        return self._data
+
+    def __getitem__(self, key: str) -> Any:
+        return self.data[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.data
+
+    def __repr__(self) -> str:
+        state = "decoded" if self.is_decoded else "raw"
+        return f"<{type(self).__name__} ({state})>"
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self.data.get(key, default)
+
+    def to_dict(self) -> dict[str, Any]:
+        return self.data
+
+    @property
+    def asin(self) -> str:
+        return cast(str, self.data["asin"])
+
+    @property
+    def title(self) -> str | None:
+        return cast(str | None, self.data.get("title"))
+
+    @property
+    def subtitle(self) -> str | None:
+        return cast(str | None, self.data.get("subtitle"))
+
+    @property
+    def authors(self) -> list[dict[str, Any]]:
+        return cast(list[dict[str, Any]], self.data.get("authors") or [])
+
+    @property
+    def narrators(self) -> list[dict[str, Any]]:
+        return cast(list[dict[str, Any]], self.data.get("narrators") or [])
+
+    @property
+    def runtime_length_min(self) -> int | None:
+        return cast(int | None, self.data.get("runtime_length_min"))
+
+
+class LibraryItem(LazyItem):
+    """An item of the ``/1.0/library`` endpoints.
+
+    .. versionadded:: v0.10.1
+    """
+
+    __slots__ = ()
+
+    response_key = "item"
+
+    @property
+    def purchase_date(self) -> str | None:
+        return cast(str | None, self.data.get("purchase_date"))
+
+    @property
+    def percent_complete(self) -> float | None:
+        return cast(float | None, self.data.get("percent_complete"))
+
+    @property
+    def is_finished(self) -> bool | None:
+        return cast(bool | None, self.data.get("is_finished"))
+
+
+class Product(LazyItem):
+    """A product of the ``/1.0/catalog/products`` endpoints.
+
+    .. versionadded:: v0.10.1
+    """
+
+    __slots__ = ()
+
+    response_key = "product"
+
+    @property
+    def publisher_name(self) -> str | None:
+        return cast(str | None, self.data.get("publisher_name"))
+
+    @property
+    def release_date(self) -> str | None:
+        return cast(str | None, self.data.get("release_date"))
+
+    @property
+    def language(self) -> str | None:
+        return cast(str | None, self.data.get("language"))
+
+
+class ItemPage(Generic[ItemT]):
+    """A page of a paginated endpoint with lazily decoded items.
+
+    Only the top-level fields of the response (e.g. ``response_groups``) are
+    decoded when the page is created. The items are split from the response
+    without decoding them.
+
+    Attributes:
+        items: The items of the page.
+        data: The remaining top-level fields of the response.
+        total: The total number of items of all pages, if provided by the
+            endpoint.
+
+    .. versionadded:: v0.10.1
+    """
+
+    __slots__ = ("data", "items", "total")
+
+    item_class: ClassVar[type[LazyItem]] = LazyItem
+    items_key: ClassVar[str] = "items"
+
+    def __init__(
+        self, items: list[ItemT], data: dict[str, Any], total: int | None = None
+    ) -> None:
+        self.items = items
+        self.data = data
+        self.total = total
+
+    @classmethod
+    def from_response(
+        cls, resp: httpx.Response, json_decoder: JSONDecoderT | None = None
+    ) -> "ItemPage[ItemT]":
+        """Creates a page from a response.
+
+        Can be used as `response_callback` for requests like
+        ``client.get("library", response_callback=LibraryPage.from_response)``.
+
+        Args:
+            resp: The response to decode.
+            json_decoder: A callable to decode JSON from bytes. It is used for
+                the page and its items. Pass :attr:`audible.Client.json_decoder`
+                to decode the response like the client. If ``None``,
+                :data:`audible.client.default_json_decoder` is used.
+        """
+        raise_for_status(resp)
+        decoder = json_decoder or default_json_decoder
+        splitter = ItemSplitter(cls.items_key)
+        raw_items = splitter.feed(resp.content)
+        data: dict[str, Any] = decoder(splitter.rest())
+        data.pop(cls.items_key, None)
+
+        items = [cast(ItemT, cls.item_class(raw, decoder)) for raw in raw_items]
+
+        # the library returns the total count as header, the catalog in body
+        total_count = resp.headers.get("Total-Count", data.get("total_results"))
+        total = int(total_count) if total_count is not None else None
+
+        return cls(items, data, total)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __iter__(self) -> Iterator[ItemT]:
+        return iter(self.items)
+
+    def __getitem__(self, index: int) -> ItemT:
+        return self.items[index]
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} with {len(self)} items>"
+
+
+class LibraryPage(ItemPage[LibraryItem]):
+    """A page of the ``/1.0/library`` endpoint.
+
+    .. versionadded:: v0.10.1
+    """
+
+    __slots__ = ()
+
+    item_class = LibraryItem
+
+
+class ProductsPage(ItemPage[Product]):
+    """A page of the ``/1.0/catalog/products`` endpoint.
+
+    .. versionadded:: v0.10.1
+    """
+
+    __slots__ = ()
+
+    item_class = Product
+    items_key = "products"
@@ -0,0 +1,245 @@
+import asyncio
+import logging
+import threading
+import weakref
+
+import httpx
+
+# the proxies of the environment, as used by httpx clients without an explicit
+# transport, so NO_PROXY and ``all://`` patterns behave the same
+from httpx._utils import get_environment_proxies as _get_environment_proxies
+
+
+logger = logging.getLogger("audible.pool")
+
+
+class PoolConfig:
+    """Connection pool settings for httpx clients and transports.
+
+    Args:
+        max_connections: The maximum number of concurrent connections.
+        max_keepalive_connections: The maximum number of idle connections
+            kept open.
+        keepalive_expiry: The time in seconds an idle connection is kept
+            open.
+        http2: If ``True``, use HTTP/2 if the server supports it. Needs the
+            `h2` package (``pip install httpx[http2]``).
+
+    .. versionadded:: v0.10.1
+    """
+
+    def __init__(
+        self,
+        max_connections: int | None = 100,
+        max_keepalive_connections: int | None = 20,
+        keepalive_expiry: float | None = 30.0,
+        http2: bool = False,
+    ) -> None:
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.keepalive_expiry = keepalive_expiry
+        self.http2 = http2
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(max_connections={self.max_connections}, "
+            f"max_keepalive_connections={self.max_keepalive_connections}, "
+            f"keepalive_expiry={self.keepalive_expiry}, http2={self.http2})"
+        )
+
+    @property
+    def limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+
+class _SharedTransport(httpx.BaseTransport):
+    # a shared transport which is not closed by the clients using it
+    def __init__(self, transport: httpx.HTTPTransport) -> None:
+        self.transport = transport
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        return self.transport.handle_request(request)
+
+    def close(self) -> None:
+        pass
+
+
+class _SharedAsyncTransport(httpx.AsyncBaseTransport):
+    def __init__(self, transport: httpx.AsyncHTTPTransport) -> None:
+        self.transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self.transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        pass
+
+
+class _SharedPool:
+    def __init__(self) -> None:
+        self.config = PoolConfig()
+        self.lock = threading.Lock()
+        self.transport: _SharedTransport | None = None
+        self.proxy_transports: dict[str, _SharedTransport] = {}
+        # async connections are bound to an event loop, every loop has its own pool
+        self.async_transports: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, _SharedAsyncTransport
+        ] = weakref.WeakKeyDictionary()
+        self.async_proxy_transports: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, dict[str, _SharedAsyncTransport]
+        ] = weakref.WeakKeyDictionary()
+
+
+_shared = _SharedPool()
+
+
+def configure_shared_pool(config: PoolConfig) -> None:
+    """Sets the settings of the shared transports.
+
+    Existing shared transports are closed, new ones are created with
+    `config` on next use.
+
+    .. versionadded:: v0.10.1
+    """
+    close_shared_transports()
+    with _shared.lock:
+        _shared.config = config
+
+
+def get_shared_transport() -> httpx.BaseTransport:
+    """Returns the transport shared by the helper functions of this package.
+
+    The token refresh, device registration and activation bytes helpers send
+    their requests with this transport, so the connections to Amazon and
+    Audible servers are reused. Clients which use it don't close it.
+
+    .. versionadded:: v0.10.1
+    """
+    with _shared.lock:
+        if _shared.transport is None:
+            config = _shared.config
+            logger.debug("create shared transport with %r", config)
+            _shared.transport = _SharedTransport(
+                httpx.HTTPTransport(limits=config.limits, http2=config.http2)
+            )
+        return _shared.transport
+
+
+def get_shared_mounts() -> dict[str, httpx.BaseTransport | None]:
+    """Returns the shared transports for the proxies set in the environment.
+
+    A client with an explicit transport ignores the ``HTTP_PROXY``,
+    ``HTTPS_PROXY``, ``ALL_PROXY`` and ``NO_PROXY`` environment variables.
+    Pass the result as `mounts` together with :func:`get_shared_transport`
+    to keep them::
+
+        httpx.Client(transport=get_shared_transport(), mounts=get_shared_mounts())
+
+    .. versionadded:: v0.10.1
+    """
+    mounts: dict[str, httpx.BaseTransport | None] = {}
+    proxies = _get_environment_proxies()
+    with _shared.lock:
+        config = _shared.config
+        for pattern, proxy in proxies.items():
+            if proxy is None:
+                mounts[pattern] = None
+                continue
+            transport = _shared.proxy_transports.get(proxy)
+            if transport is None:
+                transport = _SharedTransport(
+                    httpx.HTTPTransport(
+                        limits=config.limits,
+                        http2=config.http2,
+                        proxy=httpx.Proxy(proxy),
+                    )
+                )
+                _shared.proxy_transports[proxy] = transport
+            mounts[pattern] = transport
+    return mounts
+
+
+def get_shared_async_transport() -> httpx.AsyncBaseTransport:
+    """Returns the shared async transport for the running event loop.
+
+    .. versionadded:: v0.10.1
+    """
+    loop = asyncio.get_running_loop()
+    with _shared.lock:
+        transport = _shared.async_transports.get(loop)
+        if transport is None:
+            config = _shared.config
+            transport = _SharedAsyncTransport(
+                httpx.AsyncHTTPTransport(limits=config.limits, http2=config.http2)
+            )
+            _shared.async_transports[loop] = transport
+        return transport
+
+
+def get_shared_async_mounts() -> dict[str, httpx.AsyncBaseTransport | None]:
+    """Returns the shared async proxy transports for the running event loop.
+
+    The async counterpart of :func:`get_shared_mounts`.
+
+    .. versionadded:: v0.10.1
+    """
+    loop = asyncio.get_running_loop()
+    mounts: dict[str, httpx.AsyncBaseTransport | None] = {}
+    proxies = _get_environment_proxies()
+    with _shared.lock:
+        config = _shared.config
+        transports = _shared.async_proxy_transports.setdefault(loop, {})
+        for pattern, proxy in proxies.items():
+            if proxy is None:
+                mounts[pattern] = None
+                continue
+            transport = transports.get(proxy)
+            if transport is None:
+                transport = _SharedAsyncTransport(
+                    httpx.AsyncHTTPTransport(
+                        limits=config.limits,
+                        http2=config.http2,
+                        proxy=httpx.Proxy(proxy),
+                    )
+                )
+                transports[proxy] = transport
+            mounts[pattern] = transport
+    return mounts
+
+
+def close_shared_transports() -> None:
+    """Closes the shared sync transport and releases the async transports.
+
+    Use :func:`aclose_shared_async_transport` to close the async transport of
+    the running event loop.
+
+    .. versionadded:: v0.10.1
+    """
+    with _shared.lock:
+        if _shared.transport is not None:
+            _shared.transport.transport.close()
+            _shared.transport = None
+        for transport in _shared.proxy_transports.values():
+            transport.transport.close()
+        _shared.proxy_transports.clear()
+        _shared.async_transports.clear()
+        _shared.async_proxy_transports.clear()
+
+
+async def aclose_shared_async_transport() -> None:
+    """Closes the shared async transport of the running event loop.
+
+    .. versionadded:: v0.10.1
+    """
+    loop = asyncio.get_running_loop()
+    with _shared.lock:
+        transport = _shared.async_transports.pop(loop, None)
+        proxy_transports = _shared.async_proxy_transports.pop(loop, {})
+    if transport is not None:
+        await transport.transport.aclose()
+    for proxy_transport in proxy_transports.values():
+        await proxy_transport.transport.aclose()
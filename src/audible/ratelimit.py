@@ -0,0 +1,212 @@
+import logging
+import os
+import pathlib
+import struct
+import threading
+import time
+from collections.abc import Mapping
+
+
+logger = logging.getLogger("audible.ratelimit")
+
+_STATE = struct.Struct("<dd")  # tokens, timestamp
+
+
+class TokenBucket:
+    """A thread-safe token bucket.
+
+    The bucket holds up to `capacity` tokens and is refilled with `rate`
+    tokens per second. Every request takes one token by default. If the
+    bucket is empty, the tokens are reserved and the caller has to wait until
+    it is refilled.
+
+    Args:
+        rate: The number of tokens added per second.
+        capacity: The maximum number of tokens (the burst size).
+
+    .. versionadded:: v0.10.1
+    """
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be greater than 0.")
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1.")
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._timestamp = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _take(
+        self, tokens: float, timestamp: float, now: float, amount: float
+    ) -> tuple[float, float]:
+        # returns the new number of tokens and the time to wait for the token
+        tokens = min(self.capacity, tokens + (now - timestamp) * self.rate)
+        tokens -= amount
+        delay = -tokens / self.rate if tokens < 0 else 0.0
+        return tokens, delay
+
+    def reserve(self, amount: float = 1) -> float:
+        """Takes `amount` tokens and returns the time in seconds to wait for them."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens, delay = self._take(self._tokens, self._timestamp, now, amount)
+            self._timestamp = now
+        return delay
+
+
+class FileTokenBucket(TokenBucket):
+    """A token bucket shared by all processes on a host.
+
+    The bucket state is stored in `filename` and locked with :func:`fcntl.flock`
+    while it is updated. This is only available on POSIX systems.
+
+    Args:
+        filename: The file which holds the bucket state. It is created if it
+            does not exist.
+        rate: The number of tokens added per second.
+        capacity: The maximum number of tokens (the burst size).
+
+    .. versionadded:: v0.10.1
+    """
+
+    def __init__(
+        self, filename: str | pathlib.Path, rate: float, capacity: float
+    ) -> None:
+        super().__init__(rate, capacity)
+        self.filename = pathlib.Path(filename)
+        self.filename.parent.mkdir(parents=True, exist_ok=True)
+
+    def reserve(self, amount: float = 1) -> float:
+        import fcntl  # noqa: PLC0415
+
+        with self._lock:
+            fd = os.open(self.filename, os.O_RDWR | os.O_CREAT, 0o600)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+                now = time.time()  # monotonic clocks are not shared by processes
+                data = os.pread(fd, _STATE.size, 0)
+                if len(data) == _STATE.size:
+                    tokens, timestamp = _STATE.unpack(data)
+                else:
+                    tokens, timestamp = self.capacity, now
+                tokens, delay = self._take(tokens, timestamp, now, amount)
+                os.pwrite(fd, _STATE.pack(tokens, now), 0)
+            finally:
+                os.close(fd)  # releases the lock
+        return delay
+
+
+class RateLimiter:
+    """A client-side rate limiter for API requests.
+
+    The limiter is used by :class:`audible.Client` and
+    :class:`audible.AsyncClient`. Before a request is sent, a token is taken
+    from the bucket for the marketplace and API path of the request. If no
+    token is available, the client waits.
+
+    Every marketplace has its own buckets. The bucket for a path is selected
+    by the rule with the longest matching path prefix. Paths without a
+    matching rule share the bucket with the default `rate` and `capacity`.
+    A rule for a single marketplace is keyed by ``(marketplace, prefix)``
+    and wins over a rule with the same prefix for all marketplaces. Use an
+    empty prefix to change the default limits of a marketplace.
+
+    If `directory` is given, the bucket states are stored in files in this
+    directory, so all processes which use the same directory share the
+    limits (POSIX only). Otherwise, the limits are shared by all clients
+    which use this limiter in the current process.
+
+    Args:
+        rate: The default number of requests per second.
+        capacity: The default burst size. Defaults to `rate`.
+        rules: A mapping of API path prefixes or ``(marketplace, prefix)``
+            tuples to ``(rate, capacity)``.
+        directory: A directory for the bucket states to share the limits
+            across processes.
+
+    Attributes:
+        waits: The number of requests which had to wait for a token.
+        wait_time: The total time in seconds requests waited for tokens.
+
+    .. versionadded:: v0.10.1
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float | None = None,
+        rules: Mapping[str | tuple[str, str], tuple[float, float]] | None = None,
+        directory: str | pathlib.Path | None = None,
+    ) -> None:
+        self.rate = rate
+        self.capacity = max(1.0, rate) if capacity is None else capacity
+        self.rules = dict(rules or {})
+        self.directory = pathlib.Path(directory) if directory is not None else None
+        self.waits = 0
+        self.wait_time = 0.0
+        self._buckets: dict[tuple[str, str], TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return (
+            f"<{type(self).__name__} rate={self.rate}/s waits={self.waits} "
+            f"wait_time={self.wait_time:.1f}s>"
+        )
+
+    def _get_rule(self, marketplace: str, path: str) -> tuple[str, float, float]:
+        prefix, rate, capacity = "", self.rate, self.capacity
+        best = (-1, False)  # prefix length, marketplace specific
+        for key, (rule_rate, rule_capacity) in self.rules.items():
+            if isinstance(key, tuple):
+                rule_marketplace, rule_prefix = key
+                if rule_marketplace != marketplace:
+                    continue
+            else:
+                rule_prefix = key
+            rank = (len(rule_prefix), isinstance(key, tuple))
+            if path.startswith(rule_prefix) and rank > best:
+                best = rank
+                prefix, rate, capacity = rule_prefix, rule_rate, rule_capacity
+        return prefix, rate, capacity
+
+    def _create_bucket(
+        self, marketplace: str, prefix: str, rate: float, capacity: float
+    ) -> TokenBucket:
+        if self.directory is None:
+            return TokenBucket(rate, capacity)
+        name = f"{marketplace}{prefix or '/'}".replace("/", "_").strip("_")
+        return FileTokenBucket(self.directory / f"{name}.bucket", rate, capacity)
+
+    def get_bucket(self, marketplace: str, path: str) -> TokenBucket:
+        """Returns the bucket for the `marketplace` and API `path`."""
+        prefix, rate, capacity = self._get_rule(marketplace, path)
+        key = (marketplace, prefix)
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._create_bucket(marketplace, prefix, rate, capacity)
+                self._buckets[key] = bucket
+        return bucket
+
+    def reserve(self, marketplace: str, path: str) -> float:
+        """Takes a token and returns the time in seconds to wait for it.
+
+        Args:
+            marketplace: The marketplace of the request.
+            path: The API path of the request (e.g. ``/1.0/library``).
+        """
+        delay = self.get_bucket(marketplace, path).reserve()
+        if delay > 0:
+            with self._lock:
+                self.waits += 1
+                self.wait_time += delay
+            logger.debug("rate limit reached for %s, wait %.2fs", path, delay)
+        return delay
+
+    def reset(self) -> None:
+        """Resets the counters."""
+        with self._lock:
+            self.waits = 0
+            self.wait_time = 0.0
@@ -4,6 +4,7 @@ from typing import Any
 import httpx
 
 from .login import build_client_id
+from .pool import get_shared_mounts, get_shared_transport
 
 
 def register(
@@ -65,7 +66,12 @@ def register(
 
     target_domain = "audible" if with_username else "amazon"
 
-    resp = httpx.post(f"https://api.{target_domain}.{domain}/auth/register", json=body)
+    with httpx.Client(
+        transport=get_shared_transport(), mounts=get_shared_mounts()
+    ) as session:
+        resp = session.post(
+            f"https://api.{target_domain}.{domain}/auth/register", json=body
+        )
 
     resp_json = resp.json()
     if resp.status_code != 200:
@@ -136,11 +142,14 @@ def deregister(
 
     target_domain = "audible" if with_username else "amazon"
 
-    resp = httpx.post(
-        f"https://api.{target_domain}.{domain}/auth/deregister",
-        json=body,
-        headers=headers,
-    )
+    with httpx.Client(
+        transport=get_shared_transport(), mounts=get_shared_mounts()
+    ) as session:
+        resp = session.post(
+            f"https://api.{target_domain}.{domain}/auth/deregister",
+            json=body,
+            headers=headers,
+        )
 
     resp_json = resp.json()
     if resp.status_code != 200:
@@ -0,0 +1,164 @@
+import logging
+import random
+import threading
+from collections.abc import Iterable
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+from .exceptions import NetworkError, NotResponding, RatelimitError, ServerError
+
+
+logger = logging.getLogger("audible.retry")
+
+#: Methods which are retried by default. Retrying them can't apply a change twice.
+DEFAULT_RETRY_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+#: Exceptions which are retried by default.
+DEFAULT_RETRY_EXCEPTIONS: tuple[type[Exception], ...] = (
+    RatelimitError,
+    ServerError,
+    NotResponding,
+    NetworkError,
+)
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parses a ``Retry-After`` header value into seconds.
+
+    The value can be a number of seconds or a HTTP date.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+    return max(0.0, (date - datetime.now(timezone.utc)).total_seconds())
+
+
+class RetryPolicy:
+    """A policy to retry failed API requests with exponential backoff.
+
+    The policy is used by :class:`audible.Client` and
+    :class:`audible.AsyncClient`. A request is retried if it raises one of
+    the `retry_on` exceptions, its method is in `methods` and less than
+    `max_attempts` attempts were made.
+
+    The delay before the n-th retry is ``backoff_factor * 2 ** (n - 1)``,
+    limited to `max_backoff`. With `jitter`, a random delay between 0 and
+    this value is used, so concurrent clients don't retry at the same time.
+    If the response has a ``Retry-After`` header, the client waits at least
+    that long. If the server asks to wait longer than `max_retry_after`, the
+    request is not retried.
+
+    Note:
+        Errors are raised by the response callback. Requests with a custom
+        response callback, which does not call
+        :func:`audible.client.raise_for_status`, are only retried on
+        timeouts and network errors.
+
+    Args:
+        max_attempts: The maximum number of attempts including the first one.
+        backoff_factor: The base delay in seconds.
+        max_backoff: The maximum delay in seconds without ``Retry-After``.
+        jitter: If ``True``, use a random delay up to the backoff delay.
+        methods: The HTTP methods which are retried. Only idempotent methods
+            by default.
+        retry_on: The exceptions which are retried.
+        max_retry_after: The maximum accepted ``Retry-After`` in seconds.
+
+    Attributes:
+        retries: The number of retries made.
+        retry_time: The total time in seconds spent waiting before retries.
+        failures: The number of requests which failed after all attempts.
+
+    .. versionadded:: v0.10.1
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 30.0,
+        *,
+        jitter: bool = True,
+        methods: Iterable[str] = DEFAULT_RETRY_METHODS,
+        retry_on: tuple[type[Exception], ...] = DEFAULT_RETRY_EXCEPTIONS,
+        max_retry_after: float = 120.0,
+    ) -> None:
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be greater than 0.")
+        self.max_attempts = max_attempts
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.methods = frozenset(method.upper() for method in methods)
+        self.retry_on = retry_on
+        self.max_retry_after = max_retry_after
+        self.retries = 0
+        self.retry_time = 0.0
+        self.failures = 0
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return (
+            f"<{type(self).__name__} max_attempts={self.max_attempts} "
+            f"retries={self.retries} retry_time={self.retry_time:.1f}s>"
+        )
+
+    def get_backoff(self, attempt: int) -> float:
+        """Returns the backoff delay in seconds after the failed `attempt`."""
+        delay = min(self.max_backoff, self.backoff_factor * 2.0 ** (attempt - 1))
+        if self.jitter:
+            delay = random.uniform(0, delay)  # noqa: S311
+        return delay
+
+    def get_delay(self, method: str, attempt: int, exc: Exception) -> float | None:
+        """Returns the delay before the next attempt or ``None`` to give up.
+
+        Args:
+            method: The HTTP method of the request.
+            attempt: The number of the failed attempt, starting with 1.
+            exc: The exception raised by the failed attempt.
+        """
+        if method.upper() not in self.methods or not isinstance(exc, self.retry_on):
+            return None
+
+        if attempt >= self.max_attempts:
+            with self._lock:
+                self.failures += 1
+            return None
+
+        delay = self.get_backoff(attempt)
+        response = getattr(exc, "response", None)
+        if response is not None:
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is not None:
+                if retry_after > self.max_retry_after:
+                    with self._lock:
+                        self.failures += 1
+                    return None
+                delay = max(delay, retry_after)
+
+        with self._lock:
+            self.retries += 1
+            self.retry_time += delay
+        logger.debug(
+            "attempt %s of %s failed with %r, retry in %.2fs",
+            attempt,
+            self.max_attempts,
+            exc,
+            delay,
+        )
+        return delay
+
+    def reset(self) -> None:
+        """Resets the counters."""
+        with self._lock:
+            self.retries = self.failures = 0
+            self.retry_time = 0.0
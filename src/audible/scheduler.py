@@ -0,0 +1,406 @@
+import json
+import logging
+import pathlib
+import queue
+import sqlite3
+import threading
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from types import TracebackType
+from typing import TYPE_CHECKING, Any
+
+from .aescipher import decrypt_voucher_from_licenserequest
+from .download import Downloader
+from .licenses import request_license
+from .utils import _write_private_file
+
+
+if TYPE_CHECKING:
+    from .client import Client
+
+
+logger = logging.getLogger("audible.scheduler")
+
+PENDING = "pending"
+LICENSED = "licensed"
+DOWNLOADED = "downloaded"
+DONE = "done"
+FAILED = "failed"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    position INTEGER PRIMARY KEY AUTOINCREMENT,
+    asin TEXT NOT NULL UNIQUE,
+    state TEXT NOT NULL,
+    license TEXT,
+    filename TEXT,
+    error TEXT
+);
+"""
+
+
+class DownloadJob:
+    """A title in the :class:`DownloadQueue`.
+
+    .. versionadded:: v0.10.1
+    """
+
+    __slots__ = ("asin", "error", "filename", "license", "state")
+
+    def __init__(
+        self,
+        asin: str,
+        state: str,
+        license: dict[str, Any] | None = None,  # noqa: A002
+        filename: str | None = None,
+        error: str | None = None,
+    ) -> None:
+        self.asin = asin
+        self.state = state
+        self.license = license
+        self.filename = filename
+        self.error = error
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} {self.asin} ({self.state})>"
+
+
+class DownloadQueue:
+    """A persistent queue of titles to download.
+
+    The queue is stored in a SQLite database. Every title has a state:
+    ``pending``, ``licensed``, ``downloaded``, ``done`` or ``failed``. The
+    state is updated after every stage, so an interrupted run continues
+    where it stopped.
+
+    Args:
+        filename: The SQLite database file.
+
+    .. versionadded:: v0.10.1
+    """
+
+    def __init__(self, filename: str | pathlib.Path) -> None:
+        self.filename = filename
+        self._conn = sqlite3.connect(filename, check_same_thread=False)
+        self._conn.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "DownloadQueue":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None = None,
+        exc_value: BaseException | None = None,
+        traceback: TracebackType | None = None,
+    ) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            row = self._conn.execute("SELECT COUNT(*) FROM jobs").fetchone()
+        return int(row[0])
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def add(self, asins: Iterable[str]) -> int:
+        """Adds titles to the queue. Titles already in the queue are skipped.
+
+        Returns:
+            The number of added titles.
+        """
+        with self._lock, self._conn:
+            cursor = self._conn.executemany(
+                "INSERT OR IGNORE INTO jobs (asin, state) VALUES (?, ?)",
+                ((asin, PENDING) for asin in asins),
+            )
+        return cursor.rowcount
+
+    def jobs(self, states: Iterable[str] | None = None) -> list[DownloadJob]:
+        """Returns the jobs with one of `states` (all if ``None``) in order."""
+        query = "SELECT asin, state, license, filename, error FROM jobs"
+        params: list[str] = []
+        if states is not None:
+            params = list(states)
+            query += f" WHERE state IN ({', '.join('?' * len(params))})"
+        query += " ORDER BY position"
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        return [
+            DownloadJob(
+                asin,
+                state,
+                json.loads(license_) if license_ is not None else None,
+                filename,
+                error,
+            )
+            for asin, state, license_, filename, error in rows
+        ]
+
+    def update(self, job: DownloadJob) -> None:
+        """Stores the state of `job`."""
+        license_ = json.dumps(job.license) if job.license is not None else None
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE jobs SET state = ?, license = ?, filename = ?, error = ? "
+                "WHERE asin = ?",
+                (job.state, license_, job.filename, job.error, job.asin),
+            )
+
+    def counts(self) -> dict[str, int]:
+        """Returns the number of jobs per state."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT state, COUNT(*) FROM jobs GROUP BY state"
+            ).fetchall()
+        return dict(rows)
+
+    def retry_failed(self) -> None:
+        """Sets all failed jobs back to pending."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE jobs SET state = ?, error = NULL WHERE state = ?",
+                (PENDING, FAILED),
+            )
+
+
+class DownloadScheduler:
+    """Downloads titles of the library in a pipeline.
+
+    Each title passes three stages:
+
+    1. A license is requested. License requests run up to `prefetch` titles
+       ahead of the downloads.
+    2. The file is downloaded with a :class:`audible.download.Downloader`.
+       Up to `max_files` files are downloaded at the same time. All
+       downloads share `max_connections` and `bandwidth_limit`.
+    3. The voucher of the license is decrypted in a separate thread and
+       stored next to the file as JSON.
+
+    The progress is stored in a :class:`DownloadQueue`. If a run is
+    interrupted, the next run continues with the unfinished titles. Partial
+    downloads are resumed with a new license.
+
+    Example::
+
+        with DownloadScheduler(client, "audiobooks") as scheduler:
+            scheduler.add(item["asin"] for item in client.iter_library())
+            scheduler.run()
+
+    Args:
+        client: The client used for license requests.
+        directory: The directory for the downloaded files.
+        queue_file: The SQLite file of the queue. Defaults to
+            ``download_queue.sqlite`` in `directory`.
+        quality: The requested quality (``High`` or ``Normal``).
+        max_files: The maximum number of files downloaded at the same time.
+        max_connections: The maximum number of connections of all downloads.
+        bandwidth_limit: The maximum download rate of all downloads in
+            bytes per second.
+        prefetch: The number of licensed titles waiting for a download.
+        downloader: The downloader for the files. If given, `max_connections`
+            and `bandwidth_limit` are not used.
+
+    .. versionadded:: v0.10.1
+    """
+
+    def __init__(
+        self,
+        client: "Client",
+        directory: str | pathlib.Path,
+        queue_file: str | pathlib.Path | None = None,
+        *,
+        quality: str = "High",
+        max_files: int = 2,
+        max_connections: int = 8,
+        bandwidth_limit: float | None = None,
+        prefetch: int = 2,
+        downloader: Downloader | None = None,
+    ) -> None:
+        self.client = client
+        self.directory = pathlib.Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        if queue_file is None:
+            queue_file = self.directory / "download_queue.sqlite"
+        self.queue = DownloadQueue(queue_file)
+        self.quality = quality
+        self.max_files = max_files
+        self.prefetch = prefetch
+        self._owns_downloader = downloader is None
+        if downloader is None:
+            downloader = Downloader(
+                max_connections=max_connections, bandwidth_limit=bandwidth_limit
+            )
+        self.downloader = downloader
+
+    def __enter__(self) -> "DownloadScheduler":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None = None,
+        exc_value: BaseException | None = None,
+        traceback: TracebackType | None = None,
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._owns_downloader:
+            self.downloader.close()
+        self.queue.close()
+
+    def add(self, asins: Iterable[str]) -> int:
+        """Adds titles to the queue.
+
+        Returns:
+            The number of added titles.
+        """
+        return self.queue.add(asins)
+
+    def request_license(self, asin: str) -> dict[str, Any]:
+        """Requests a download license for `asin`."""
+        return request_license(self.client, asin, self.quality)
+
+    def get_filename(self, job: DownloadJob) -> pathlib.Path:
+        """Returns the target file for `job`."""
+        return self.directory / f"{job.asin}.aaxc"
+
+    def _fail(self, job: DownloadJob, exc: Exception) -> None:
+        logger.error("download of %s failed: %s", job.asin, exc)
+        job.state = FAILED
+        job.error = str(exc)
+        self.queue.update(job)
+
+    def _license_stage(
+        self,
+        jobs: list[DownloadJob],
+        ready: "queue.Queue[DownloadJob | None]",
+        stop: threading.Event,
+    ) -> None:
+        try:
+            for job in jobs:
+                if stop.is_set():
+                    break
+                try:
+                    job.license = self.request_license(job.asin)
+                except Exception as exc:
+                    self._fail(job, exc)
+                    continue
+                job.state = LICENSED
+                self.queue.update(job)
+                ready.put(job)
+        finally:
+            for _ in range(self.max_files):
+                ready.put(None)
+
+    def _download(
+        self, job: DownloadJob, progress_callback: Callable[[str, int, int], Any] | None
+    ) -> None:
+        assert job.license is not None  # noqa: S101
+        content_metadata = job.license["content_license"]["content_metadata"]
+        url = content_metadata["content_url"]["offline_url"]
+        size = content_metadata.get("content_reference", {}).get("content_size")
+        callback = None
+        if progress_callback is not None:
+
+            def callback(downloaded: int, total: int) -> None:
+                progress_callback(job.asin, downloaded, total)
+
+        # the manifest gets the license without the encrypted voucher
+        metadata = {
+            key: value
+            for key, value in job.license["content_license"].items()
+            if key != "license_response"
+        }
+        filename = self.downloader.download(
+            url,
+            self.get_filename(job),
+            size=size,
+            progress_callback=callback,
+            metadata=metadata,
+        )
+        job.state = DOWNLOADED
+        job.filename = str(filename)
+        self.queue.update(job)
+
+    def _decrypt(self, job: DownloadJob) -> None:
+        assert job.license is not None and job.filename is not None  # noqa: S101
+        try:
+            voucher = decrypt_voucher_from_licenserequest(self.client.auth, job.license)
+            voucher_file = pathlib.Path(job.filename).with_suffix(".json")
+            # the voucher contains the key of the file
+            _write_private_file(voucher_file, json.dumps(voucher, indent=4))
+        except Exception as exc:
+            self._fail(job, exc)
+            return
+        job.state = DONE
+        job.license = None  # the voucher is stored, the license is not needed anymore
+        self.queue.update(job)
+        logger.info("%s done", job.asin)
+
+    def run(
+        self, progress_callback: Callable[[str, int, int], Any] | None = None
+    ) -> dict[str, int]:
+        """Processes all unfinished titles of the queue.
+
+        Args:
+            progress_callback: Called with the ASIN, the downloaded and the
+                total number of bytes during downloads. It is called from
+                worker threads.
+
+        Returns:
+            The number of titles per state after the run.
+        """
+        decrypt_executor = ThreadPoolExecutor(1, thread_name_prefix="audible-decrypt")
+        decrypt_futures: list[Future[None]] = []
+
+        # downloaded titles only need the voucher decryption
+        for job in self.queue.jobs([DOWNLOADED]):
+            decrypt_futures.append(decrypt_executor.submit(self._decrypt, job))
+
+        # licenses of interrupted runs may be expired, request new ones
+        jobs = self.queue.jobs([PENDING, LICENSED])
+        ready: queue.Queue[DownloadJob | None] = queue.Queue(maxsize=self.prefetch)
+        stop = threading.Event()
+
+        def download_worker() -> None:
+            while (job := ready.get()) is not None:
+                if stop.is_set():
+                    continue
+                try:
+                    self._download(job, progress_callback)
+                except Exception as exc:
+                    self._fail(job, exc)
+                    continue
+                decrypt_futures.append(decrypt_executor.submit(self._decrypt, job))
+
+        threads = [
+            threading.Thread(
+                target=self._license_stage,
+                args=(jobs, ready, stop),
+                name="audible-license",
+                daemon=True,
+            )
+        ]
+        threads.extend(
+            threading.Thread(
+                target=download_worker, name=f"audible-download-{i}", daemon=True
+            )
+            for i in range(self.max_files)
+        )
+        for thread in threads:
+            thread.start()
+        try:
+            for thread in threads:
+                thread.join()
+        finally:
+            # on interrupt, stop after the running downloads
+            stop.set()
+            for thread in threads:
+                thread.join()
+            decrypt_executor.shutdown(wait=True)
+
+        for future in decrypt_futures:
+            future.result()
+        return self.queue.counts()
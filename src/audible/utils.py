@@ -1,4 +1,5 @@
 import logging
+import os
 import pathlib
 import re
 import time
@@ -141,6 +142,18 @@ def test_convert(key: str, value: Any) -> Any:
     return value
 
 
+def _write_private_file(filename: pathlib.Path, data: str) -> None:
+    # Writes `data` atomically to a file which only the owner can read. The
+    # temporary file is created exclusively, so an existing file or symlink
+    # at its path is never written to.
+    tmp = filename.with_name(filename.name + ".tmp")
+    tmp.unlink(missing_ok=True)
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    with open(fd, "w") as f:
+        f.write(data)
+    os.replace(tmp, filename)
+
+
 class ElapsedTime:
     def __init__(self) -> None:
         self.start_time = time.time()
@@ -0,0 +1,19 @@
+"""Shared fixtures for the test suite."""
+
+import time
+
+import pytest
+
+import audible
+
+
+@pytest.fixture
+def auth() -> audible.Authenticator:
+    """An authenticator with a valid access token and device data."""
+    auth = audible.Authenticator()
+    auth.locale = "us"
+    auth.access_token = "Atna|token"  # noqa: S105
+    auth.expires = time.time() + 3600
+    auth.device_info = {"device_serial_number": "SERIAL", "device_type": "TYPE"}
+    auth.customer_info = {"user_id": "CUSTOMER"}
+    return auth
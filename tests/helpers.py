@@ -0,0 +1,17 @@
+"""Helpers shared by the test modules."""
+
+import base64
+import hashlib
+import json
+from typing import Any
+
+from audible.aescipher import aes_cbc_encrypt
+
+
+def encrypt_voucher(asin: str, voucher: dict[str, Any]) -> str:
+    """Encrypts a voucher for the device data of the ``auth`` fixture."""
+    digest = hashlib.sha256(f"TYPESERIALCUSTOMER{asin}".encode()).digest()
+    plaintext = json.dumps(voucher)
+    plaintext += "\x00" * (-len(plaintext) % 16)
+    encrypted = aes_cbc_encrypt(digest[:16], digest[16:], plaintext, padding="none")
+    return base64.b64encode(encrypted).decode()
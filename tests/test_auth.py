@@ -0,0 +1,206 @@
+"""Test cases for the auth module."""
+
+import asyncio
+import base64
+import copy
+import pickle
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime, timezone
+
+import httpx
+import pytest
+import rsa
+from pytest_mock import MockerFixture
+
+from audible.auth import Authenticator, RsaSigner, get_signer, sign_request
+
+
+ADP_TOKEN = "{enc:abc}{key:def}{iv:ghi}{name:jkl}{serial:Mg==}"  # noqa: S105
+
+
+@pytest.fixture(scope="module")
+def rsa_keys() -> tuple[rsa.PublicKey, str]:
+    public_key, private_key = rsa.newkeys(1024)
+    return public_key, private_key.save_pkcs1().decode("utf-8")
+
+
+def test_rsa_signer_signature_is_valid(rsa_keys: tuple[rsa.PublicKey, str]) -> None:
+    public_key, private_key = rsa_keys
+    signature = RsaSigner(private_key).sign(b"data")
+    assert rsa.verify(b"data", signature, public_key) == "SHA-256"
+
+
+def test_cryptography_signer_equals_rsa_signer(
+    rsa_keys: tuple[rsa.PublicKey, str],
+) -> None:
+    pytest.importorskip("cryptography")
+    _, private_key = rsa_keys
+    signer = get_signer(private_key)
+    assert signer.backend == "cryptography"
+    assert signer.sign(b"data") == RsaSigner(private_key).sign(b"data")
+
+
+@pytest.mark.parametrize("backend", ["rsa", "cryptography"])
+def test_sign_request_signature_per_backend(
+    backend: str, rsa_keys: tuple[rsa.PublicKey, str], mocker: MockerFixture
+) -> None:
+    if backend == "cryptography":
+        pytest.importorskip("cryptography")
+    public_key, private_key = rsa_keys
+    now = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    mocker.patch("audible.auth.datetime").now.return_value = now
+
+    expected = sign_request("GET", "/1.0/library", b"", "token", private_key)
+    headers = sign_request(
+        "GET", "/1.0/library", b"", "token", get_signer(private_key, backend)
+    )
+    assert headers == expected
+
+    signature, date = headers["x-adp-signature"].split(":", 1)
+    data = f"GET\n/1.0/library\n{date}\n\ntoken".encode()
+    rsa.verify(data, base64.b64decode(signature), public_key)
+
+
+def test_get_signer_unknown_backend(rsa_keys: tuple[rsa.PublicKey, str]) -> None:
+    with pytest.raises(ValueError):
+        get_signer(rsa_keys[1], "unknown")
+
+
+def test_authenticator_reloads_signer_on_new_key(
+    rsa_keys: tuple[rsa.PublicKey, str],
+) -> None:
+    auth = Authenticator()
+    auth.device_private_key = rsa_keys[1]
+    signer = auth.signer
+    assert auth.signer is signer
+
+    auth.device_private_key = rsa_keys[1]
+    assert auth.signer is not signer
+
+
+def test_authenticator_state_drops_signer(
+    rsa_keys: tuple[rsa.PublicKey, str],
+) -> None:
+    auth = Authenticator()
+    auth.device_private_key = rsa_keys[1]
+    assert auth.signer is auth._signer
+
+    auth.signing_executor = ProcessPoolExecutor(1)
+    state = auth.__getstate__()
+    assert "_signer" not in state
+    assert "_signing_executor" not in state
+    auth.signing_executor.shutdown()
+    assert state["device_private_key"] == rsa_keys[1]
+
+
+def test_authenticator_pickle_and_deepcopy(
+    rsa_keys: tuple[rsa.PublicKey, str],
+) -> None:
+    auth = Authenticator()
+    auth.device_private_key = rsa_keys[1]
+    auth.access_token = "Atna|token"  # noqa: S105
+    auth.signing_executor = ThreadPoolExecutor(1)
+    signature = auth.signer.sign(b"data")
+
+    for copied in (pickle.loads(pickle.dumps(auth)), copy.deepcopy(auth)):  # noqa: S301
+        assert dict(copied.to_dict()) == dict(auth.to_dict())
+        assert copied.signing_executor is None
+        assert copied._refresh_lock is not auth._refresh_lock
+        assert copied.signer.sign(b"data") == signature
+    auth.signing_executor.shutdown()
+
+
+def sign_with_auth_flow(auth: Authenticator) -> dict[str, str]:
+    request = httpx.Request(
+        "POST", "https://api.audible.com/1.0/library?x=1", content=b'{"a": 1}'
+    )
+
+    async def main() -> httpx.Request:
+        return await auth.async_auth_flow(request).__anext__()
+
+    headers = asyncio.run(main()).headers
+    return {
+        name: headers[name] for name in ("x-adp-token", "x-adp-alg", "x-adp-signature")
+    }
+
+
+@pytest.mark.parametrize(
+    "executor_class", [None, ThreadPoolExecutor, ProcessPoolExecutor]
+)
+def test_async_auth_flow_signs_in_executor(
+    executor_class: type[Executor] | None,
+    rsa_keys: tuple[rsa.PublicKey, str],
+    mocker: MockerFixture,
+) -> None:
+    auth = Authenticator()
+    auth.adp_token = ADP_TOKEN
+    auth.device_private_key = rsa_keys[1]
+    executor = executor_class(1) if executor_class is not None else None
+    auth.signing_executor = executor
+    if executor is not None:
+        # the signature must not be created on the event loop
+        mocker.patch.object(
+            auth, "_apply_signing_auth_flow", side_effect=AssertionError
+        )
+    try:
+        headers = sign_with_auth_flow(auth)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    # the same headers as inline signing at the date of the signature
+    date = headers["x-adp-signature"].split(":", 1)[1]
+    mocker.patch(
+        "audible.auth.datetime"
+    ).now.return_value.isoformat.return_value = date.removesuffix("Z")
+    expected = sign_request(
+        "POST", "/1.0/library?x=1", b'{"a": 1}', ADP_TOKEN, rsa_keys[1]
+    )
+    assert headers == expected
+
+
+def test_token_refresher_margin_exceeding_lifetime(mocker: MockerFixture) -> None:
+    mocker.patch("audible.auth.MIN_REFRESH_INTERVAL", 0.2)
+    auth = Authenticator()
+    auth.refresh_token = "Atnr|token"  # noqa: S105
+    auth.locale = "us"
+    auth.expires = time.time() + 3600
+
+    def refresh(force: bool = False) -> None:
+        auth.expires = time.time() + 3600
+
+    refresh_mock = mocker.patch.object(
+        auth, "refresh_access_token", side_effect=refresh
+    )
+    with pytest.raises(ValueError):
+        auth.start_token_refresher(margin=300, retry_interval=0)
+    auth.start_token_refresher(margin=7200)
+    time.sleep(0.5)
+    auth.stop_token_refresher()
+    # immediately and then every MIN_REFRESH_INTERVAL, not back-to-back
+    assert 2 <= refresh_mock.call_count <= 4
+
+
+def test_async_refresh_access_token_single_flight(mocker: MockerFixture) -> None:
+    auth = Authenticator()
+    auth.refresh_token = "Atnr|token"  # noqa: S105
+    auth.locale = "us"
+    auth.access_token = "Atna|old"  # noqa: S105
+    auth.expires = time.time() - 1
+
+    async def refresh(**kwargs: object) -> dict[str, object]:
+        await asyncio.sleep(0.05)
+        return {"access_token": "Atna|new", "expires": time.time() + 3600}
+
+    refresh_mock = mocker.patch(
+        "audible.auth.async_refresh_access_token", side_effect=refresh
+    )
+
+    async def main() -> None:
+        await asyncio.gather(*(auth.async_refresh_access_token() for _ in range(200)))
+
+    asyncio.run(main())
+    assert refresh_mock.call_count == 1
+    assert auth.access_token == "Atna|new"  # noqa: S105
+    assert not auth.access_token_expired
@@ -0,0 +1,166 @@
+"""Test cases for the cache module."""
+
+import asyncio
+
+import httpx
+from pytest_mock import MockerFixture
+
+import audible
+from audible.cache import ResponseCache
+
+
+def test_revalidation_of_evicted_response(auth: audible.Authenticator) -> None:
+    cache = ResponseCache(revalidate=True)
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if "If-None-Match" in request.headers:
+            # the cached response is evicted while the request is in flight
+            cache.clear()
+            return httpx.Response(304)
+        return httpx.Response(200, json={"item": "A"}, headers={"ETag": '"a"'})
+
+    with audible.Client(
+        auth, cache=cache, transport=httpx.MockTransport(handler)
+    ) as client:
+        assert client.get("library/A") == {"item": "A"}
+        assert client.get("library/A") == {"item": "A"}
+
+    assert [r.headers.get("If-None-Match") for r in requests] == [None, '"a"', None]
+
+
+def test_request_after_eviction_is_rate_limited(
+    auth: audible.Authenticator, mocker: MockerFixture
+) -> None:
+    cache = ResponseCache(revalidate=True)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if "If-None-Match" in request.headers:
+            cache.clear()
+            return httpx.Response(304)
+        return httpx.Response(200, json={"item": "A"}, headers={"ETag": '"a"'})
+
+    with audible.Client(
+        auth, cache=cache, transport=httpx.MockTransport(handler)
+    ) as client:
+        wait = mocker.spy(client, "_wait_for_rate_limit")
+        client.get("library/A")
+        client.get("library/A")
+        assert wait.call_count == 3
+
+    async def main() -> int:
+        cache.clear()
+        async with audible.AsyncClient(
+            auth, cache=cache, transport=httpx.MockTransport(handler)
+        ) as client:
+            wait = mocker.spy(client, "_wait_for_rate_limit")
+            await client.get("library/A")
+            await client.get("library/A")
+            return wait.call_count
+
+    assert asyncio.run(main()) == 3
+
+
+def test_revalidation_is_opt_in() -> None:
+    cache = ResponseCache()
+    assert not cache.is_cacheable("/1.0/library")
+    assert ResponseCache(revalidate=True).is_cacheable("/1.0/library")
+
+
+def response(path: str, status_code: int = 200) -> httpx.Response:
+    request = httpx.Request("GET", f"https://api.audible.com{path}")
+    return httpx.Response(status_code, json={}, request=request)
+
+
+def key(name: str) -> tuple[object, ...]:
+    url = httpx.URL(f"https://api.audible.com/1.0/catalog/products/{name}")
+    return ResponseCache.make_key("GET", url, None, "us", "user")
+
+
+def test_make_key_normalizes_query() -> None:
+    url = httpx.URL("https://api.audible.com/1.0/catalog/products?b=2&a=1")
+    first = ResponseCache.make_key("get", url, None, "us", "user")
+    other = ResponseCache.make_key(
+        "GET",
+        httpx.URL("https://api.audible.com/1.0/catalog/products"),
+        {"a": "1", "b": "2"},
+        "us",
+        "user",
+    )
+    assert first == other
+    assert first != ResponseCache.make_key("GET", url, None, "de", "user")
+    assert first != ResponseCache.make_key("GET", url, None, "us", "other")
+
+
+def test_ttl_rules() -> None:
+    cache = ResponseCache()
+    assert cache.get_ttl("/1.0/catalog/products/B00") == 3600
+    assert cache.get_ttl("/1.0/catalog/categories") == 24 * 3600
+    assert cache.get_ttl("/1.0/library") == 0
+    assert not cache.is_cacheable("/1.0/library")
+
+    cache = ResponseCache(
+        ttl_rules={"/1.0/catalog": 10, "/1.0/catalog/products": 20}, default_ttl=5
+    )
+    # the longest matching prefix wins
+    assert cache.get_ttl("/1.0/catalog/products") == 20
+    assert cache.get_ttl("/1.0/catalog/categories") == 10
+    assert cache.get_ttl("/1.0/library") == 5
+
+
+def test_only_cacheable_responses_are_stored() -> None:
+    cache = ResponseCache()
+    cache.set(key("library"), response("/1.0/library"))
+    cache.set(key("error"), response("/1.0/catalog/products", 404))
+    assert len(cache) == 0
+
+
+def test_expired_responses_are_not_returned(mocker: MockerFixture) -> None:
+    monotonic = mocker.patch("audible.cache.time.monotonic", return_value=100.0)
+    cache = ResponseCache()
+    cache.set(key("B1"), response("/1.0/catalog/products"))
+    assert cache.get(key("B1")) is not None
+    monotonic.return_value = 100.0 + 3600
+    assert cache.get(key("B1")) is None
+
+
+def test_lru_eviction_and_counters() -> None:
+    cache = ResponseCache(maxsize=2)
+    for name in ("a", "b"):
+        cache.set(key(name), response("/1.0/catalog/products"))
+    assert cache.get(key("a")) is not None  # "b" is now least recently used
+    cache.set(key("c"), response("/1.0/catalog/products"))
+
+    assert len(cache) == 2
+    assert cache.get(key("b")) is None
+    assert cache.get(key("a")) is not None
+    assert cache.get(key("c")) is not None
+    assert (cache.hits, cache.misses, cache.evictions) == (3, 1, 1)
+
+    cache.clear()
+    assert len(cache) == 0
+    assert (cache.hits, cache.misses, cache.evictions) == (0, 0, 0)
+
+
+def test_cache_hit_skips_request_and_auth_flow(
+    auth: audible.Authenticator, mocker: MockerFixture
+) -> None:
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={"products": []})
+
+    auth_flow = mocker.spy(audible.Authenticator, "auth_flow")
+    cache = ResponseCache()
+    with audible.Client(
+        auth, cache=cache, transport=httpx.MockTransport(handler)
+    ) as client:
+        for _ in range(3):
+            assert client.get("catalog/products", asins="B1") == {"products": []}
+        client.get("catalog/products", asins="B2")
+
+    assert len(requests) == 2
+    assert auth_flow.call_count == 2
+    assert (cache.hits, cache.misses) == (2, 2)
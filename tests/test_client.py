@@ -0,0 +1,371 @@
+"""Test cases for the client module."""
+
+import asyncio
+import json
+import logging
+import threading
+import time
+from typing import Any
+
+import httpx
+import pytest
+from pytest_mock import MockerFixture
+
+import audible
+from audible.client import convert_response_content
+
+
+PAGE_DELAY = 0.2
+
+
+def library_page(request: httpx.Request) -> httpx.Response:
+    page = int(request.url.params["page"])
+    items = [{"asin": f"B{page}{i}"} for i in range(2)] if page <= 3 else []
+    return httpx.Response(200, json={"items": items}, headers={"Total-Count": "6"})
+
+
+def test_iter_library_prefetches_next_page(auth: audible.Authenticator) -> None:
+    sent: list[float] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(time.monotonic())
+        time.sleep(PAGE_DELAY)
+        return library_page(request)
+
+    with audible.Client(auth, transport=httpx.MockTransport(handler)) as client:
+        items = []
+        for item in client.iter_library(num_results=2):
+            if item["asin"].endswith("0"):
+                time.sleep(PAGE_DELAY)
+            items.append(item["asin"])
+
+    assert items == ["B10", "B11", "B20", "B21", "B30", "B31"]
+    # page 2 is requested while page 1 is consumed
+    assert sent[1] - sent[0] < PAGE_DELAY * 1.5
+    assert sent[2] - sent[1] < PAGE_DELAY * 1.5
+
+
+def test_async_iter_library_prefetches_next_page(
+    auth: audible.Authenticator,
+) -> None:
+    sent: list[float] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(time.monotonic())
+        await asyncio.sleep(PAGE_DELAY)
+        return library_page(request)
+
+    async def main() -> list[Any]:
+        async with audible.AsyncClient(
+            auth, transport=httpx.MockTransport(handler)
+        ) as client:
+            items = []
+            async for item in client.iter_library(num_results=2):
+                if item["asin"].endswith("0"):
+                    await asyncio.sleep(PAGE_DELAY)
+                items.append(item["asin"])
+            return items
+
+    assert asyncio.run(main()) == ["B10", "B11", "B20", "B21", "B30", "B31"]
+    assert sent[1] - sent[0] < PAGE_DELAY * 1.5
+    assert sent[2] - sent[1] < PAGE_DELAY * 1.5
+
+
+def test_async_get_coalesces_identical_requests(
+    auth: audible.Authenticator,
+) -> None:
+    requests: list[httpx.Request] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json={"asin": request.url.params["asin"]})
+
+    async def main() -> tuple[list[Any], int]:
+        async with audible.AsyncClient(
+            auth, transport=httpx.MockTransport(handler)
+        ) as client:
+            results = await asyncio.gather(
+                *(client.get("library/item", asin="B1") for _ in range(10)),
+                client.get("library/item", asin="B2"),
+            )
+            return results, client.coalesced_requests
+
+    results, coalesced = asyncio.run(main())
+    assert results == [{"asin": "B1"}] * 10 + [{"asin": "B2"}]
+    assert len(requests) == 2
+    assert coalesced == 9
+
+
+def test_async_get_without_coalescing(auth: audible.Authenticator) -> None:
+    requests: list[httpx.Request] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json={})
+
+    async def main() -> int:
+        async with audible.AsyncClient(
+            auth, transport=httpx.MockTransport(handler)
+        ) as client:
+            await asyncio.gather(
+                *(client.get("library", coalesce=False) for _ in range(3))
+            )
+            return client.coalesced_requests
+
+    assert asyncio.run(main()) == 0
+    assert len(requests) == 3
+    assert all("coalesce" not in request.url.params for request in requests)
+
+
+@pytest.mark.parametrize(
+    "request_kwargs",
+    [{"timeout": 1}, {"follow_redirects": True}, {"extensions": {"trace": None}}],
+)
+def test_async_get_with_httpx_args_is_not_coalesced(
+    auth: audible.Authenticator, request_kwargs: dict[str, Any]
+) -> None:
+    requests: list[httpx.Request] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json={})
+
+    async def main() -> int:
+        async with audible.AsyncClient(
+            auth, transport=httpx.MockTransport(handler)
+        ) as client:
+            await asyncio.gather(
+                client.get("library"), client.get("library", **request_kwargs)
+            )
+            return client.coalesced_requests
+
+    assert asyncio.run(main()) == 0
+    assert len(requests) == 2
+
+
+def test_async_get_leader_cancelled(auth: audible.Authenticator) -> None:
+    requests: list[httpx.Request] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json={"ok": True})
+
+    async def main() -> Any:
+        async with audible.AsyncClient(
+            auth, transport=httpx.MockTransport(handler)
+        ) as client:
+            leader = asyncio.create_task(client.get("library"))
+            await asyncio.sleep(0.01)
+            follower = asyncio.create_task(client.get("library"))
+            await asyncio.sleep(0.01)
+            leader.cancel()
+            # the follower sends an own request instead of being cancelled
+            result = await follower
+            assert leader.cancelled()
+            return result
+
+    assert asyncio.run(main()) == {"ok": True}
+    assert len(requests) == 2
+
+
+def test_coalesce_is_not_sent_as_query_parameter(
+    auth: audible.Authenticator,
+) -> None:
+    params: list[httpx.QueryParams] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        params.append(request.url.params)
+        return httpx.Response(200, json={"items": [], "products": [{"asin": "B1"}]})
+
+    async def async_requests() -> None:
+        async with audible.AsyncClient(
+            auth, transport=httpx.MockTransport(handler)
+        ) as client:
+            await client.get("library", coalesce=False)
+            _ = [item async for item in client.paginate("library", 10, coalesce=False)]
+            _ = [item async for item in client.iter_library(coalesce=False)]
+            await client.get_products(["B1"], coalesce=False)
+            _ = [item async for item in client.stream_items("library", coalesce=False)]
+
+    with audible.Client(auth, transport=httpx.MockTransport(handler)) as client:
+        client.get("library", coalesce=False)
+        list(client.paginate("library", 10, coalesce=False))
+        list(client.iter_library(coalesce=False))
+        client.get_products(["B1"], coalesce=False)
+        list(client.stream_items("library", coalesce=False))
+    asyncio.run(async_requests())
+
+    assert len(params) == 10
+    assert all("coalesce" not in request_params for request_params in params)
+
+
+def test_responses_are_only_logged_with_debug_logging(
+    auth: audible.Authenticator,
+    caplog: pytest.LogCaptureFixture,
+    mocker: MockerFixture,
+) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"title": "x" * 1000})
+
+    debug = mocker.spy(audible.client.logger, "debug")
+    with audible.Client(auth, transport=httpx.MockTransport(handler)) as client:
+        with caplog.at_level(logging.INFO, logger="audible.client"):
+            client.get("library")
+        debug.assert_not_called()
+
+        with caplog.at_level(logging.DEBUG, logger="audible.client"):
+            client.get("library")
+
+    (record,) = [r for r in caplog.records if r.name == "audible.client"]
+    body = record.getMessage().split(") ", 1)[1]
+    # the body is truncated to _LOG_BODY_LIMIT characters
+    assert body == ('{"title":"' + "x" * 1000)[: client._LOG_BODY_LIMIT] + "..."
+    assert record.path == "/1.0/library"
+    assert record.status_code == 200
+    assert record.response_bytes == 1012
+
+
+def test_log_body_limit_zero(
+    auth: audible.Authenticator,
+    caplog: pytest.LogCaptureFixture,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"title": "x"})
+
+    monkeypatch.setattr(audible.Client, "_LOG_BODY_LIMIT", 0)
+    with (
+        audible.Client(auth, transport=httpx.MockTransport(handler)) as client,
+        caplog.at_level(logging.DEBUG, logger="audible.client"),
+    ):
+        client.get("library")
+
+    (record,) = [r for r in caplog.records if r.name == "audible.client"]
+    assert record.getMessage().endswith("s) ")
+
+
+def test_client_uses_json_decoder(auth: audible.Authenticator) -> None:
+    decoded: list[bytes] = []
+
+    def decoder(data: bytes) -> Any:
+        decoded.append(data)
+        return json.loads(data)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"items": [{"asin": "B1"}]})
+
+    with audible.Client(
+        auth, json_decoder=decoder, transport=httpx.MockTransport(handler)
+    ) as client:
+        assert client.get("library") == {"items": [{"asin": "B1"}]}
+        assert list(client.stream_items("library")) == [{"asin": "B1"}]
+
+    # the raw bytes are decoded once
+    assert decoded == [b'{"items":[{"asin":"B1"}]}', b'{"asin":"B1"}']
+
+
+@pytest.mark.parametrize(
+    ("content_type", "content", "expected"),
+    [
+        ("application/json", b'{"a": 1}', {"a": 1}),
+        ("application/vnd.api+json", b"[1]", [1]),
+        # no or a wrong content type, the body looks like JSON
+        ("", b' {"a": 1}', {"a": 1}),
+        ("text/plain", b"[1, 2]", [1, 2]),
+        # not JSON
+        ("text/html", b"<html></html>", "<html></html>"),
+        ("", b"plain text", "plain text"),
+        ("application/json", b"{invalid", "{invalid"),
+    ],
+)
+def test_convert_response_content(
+    content_type: str, content: bytes, expected: Any
+) -> None:
+    headers = {"Content-Type": content_type} if content_type else {}
+    resp = httpx.Response(200, content=content, headers=headers)
+    assert convert_response_content(resp) == expected
+
+
+def test_non_json_response_is_not_decoded() -> None:
+    def decoder(data: bytes) -> Any:
+        raise AssertionError("decoder called")
+
+    resp = httpx.Response(
+        200, text="<html></html>", headers={"Content-Type": "text/html"}
+    )
+    assert convert_response_content(resp, decoder) == "<html></html>"
+
+
+class ProductsHandler:
+    # a catalog endpoint which records the requested ASINs and the peak of
+    # concurrent requests
+    def __init__(self) -> None:
+        self.requested: list[list[str]] = []
+        self.in_flight = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def _start(self, request: httpx.Request) -> list[str]:
+        asins = request.url.params["asins"].split(",")
+        with self._lock:
+            self.requested.append(asins)
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        return asins
+
+    def _finish(self, asins: list[str]) -> httpx.Response:
+        with self._lock:
+            self.in_flight -= 1
+        # ASINs ending with 9 are not in the catalog
+        products = [{"asin": asin} for asin in asins if not asin.endswith("9")]
+        return httpx.Response(200, json={"products": products})
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        asins = self._start(request)
+        time.sleep(0.02)
+        return self._finish(asins)
+
+    async def handle_async(self, request: httpx.Request) -> httpx.Response:
+        asins = self._start(request)
+        await asyncio.sleep(0.02)
+        return self._finish(asins)
+
+
+ASINS = [f"B{i:03}" for i in range(120)]
+
+
+def check_products(
+    handler: ProductsHandler, products: dict[str, dict[str, Any]]
+) -> None:
+    # duplicates are requested once, in chunks of 50
+    assert sorted(len(chunk) for chunk in handler.requested) == [20, 50, 50]
+    assert sorted(asin for chunk in handler.requested for asin in chunk) == ASINS
+    assert list(products) == [asin for asin in ASINS if not asin.endswith("9")]
+    assert handler.peak == 2
+
+
+def test_get_products(auth: audible.Authenticator) -> None:
+    handler = ProductsHandler()
+    with audible.Client(auth, transport=httpx.MockTransport(handler)) as client:
+        products = client.get_products(ASINS + ASINS[:10], max_in_flight=2)
+        with pytest.raises(ValueError):
+            client.get_products(ASINS, chunk_size=51)
+    check_products(handler, products)
+
+
+def test_async_get_products(auth: audible.Authenticator) -> None:
+    handler = ProductsHandler()
+
+    async def main() -> dict[str, dict[str, Any]]:
+        async with audible.AsyncClient(
+            auth, transport=httpx.MockTransport(handler.handle_async)
+        ) as client:
+            return await client.get_products(
+                ASINS + ASINS[:10], response_groups="media", max_in_flight=2
+            )
+
+    check_products(handler, asyncio.run(main()))
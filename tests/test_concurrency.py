@@ -0,0 +1,201 @@
+"""Test cases for the concurrency module."""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+import audible
+from audible.concurrency import AdaptiveLimiter
+from audible.exceptions import NotFoundError, ServerError
+from audible.retry import RetryPolicy
+
+
+def server_error() -> ServerError:
+    request = httpx.Request("GET", "https://api.audible.com/1.0/library")
+    return ServerError(httpx.Response(503, request=request), {})
+
+
+def test_limiter_validates_arguments() -> None:
+    with pytest.raises(ValueError):
+        AdaptiveLimiter(initial_limit=2, min_limit=3)
+    with pytest.raises(ValueError):
+        AdaptiveLimiter(initial_limit=8, max_limit=4)
+    with pytest.raises(ValueError):
+        AdaptiveLimiter(backoff=1)
+
+
+def test_additive_increase() -> None:
+    limiter = AdaptiveLimiter(initial_limit=4, max_limit=5, latency_tolerance=1e9)
+
+    async def main() -> None:
+        for _ in range(4):
+            async with limiter.slot():
+                pass
+
+    asyncio.run(main())
+    # about one more slot after a round trip of all slots
+    assert int(limiter.limit) == 4
+    assert limiter.limit == pytest.approx(4.92, abs=0.01)
+
+    asyncio.run(main())
+    assert limiter.limit == 5  # max_limit
+    assert limiter.successes == 8
+
+
+def test_no_increase_on_high_latency() -> None:
+    limiter = AdaptiveLimiter(initial_limit=4, latency_tolerance=2)
+    limiter._on_success(0.1)
+    assert limiter.limit == 4.25
+    limiter._on_success(0.3)
+    assert limiter.limit == 4.25
+    assert limiter.successes == 2
+
+
+def test_multiplicative_decrease() -> None:
+    limiter = AdaptiveLimiter(initial_limit=16, min_limit=3, backoff=0.5)
+
+    async def fail(delay: float = 0) -> None:
+        async with limiter.slot():
+            await asyncio.sleep(delay)
+            raise server_error()
+
+    async def concurrent_failures() -> None:
+        # all operations started before the first decrease
+        results = await asyncio.gather(
+            *(fail(0.01) for _ in range(4)), return_exceptions=True
+        )
+        assert all(isinstance(result, ServerError) for result in results)
+
+    asyncio.run(concurrent_failures())
+    assert limiter.limit == 8
+    assert limiter.overloads == 4
+
+    for _ in range(3):
+        time.sleep(0.001)  # the next operation starts after the last decrease
+        with pytest.raises(ServerError):
+            asyncio.run(fail())
+    assert limiter.limit == 3  # min_limit
+
+
+def test_other_errors_do_not_change_the_limit() -> None:
+    limiter = AdaptiveLimiter(initial_limit=4)
+    request = httpx.Request("GET", "https://api.audible.com/1.0/library/B00")
+
+    async def main() -> None:
+        async with limiter.slot():
+            raise NotFoundError(httpx.Response(404, request=request), {})
+
+    with pytest.raises(NotFoundError):
+        asyncio.run(main())
+    assert limiter.limit == 4
+    assert (limiter.successes, limiter.overloads) == (0, 0)
+
+
+def test_slots_respect_the_limit() -> None:
+    limiter = AdaptiveLimiter(initial_limit=3, max_limit=3)
+    peak = 0
+
+    async def work() -> None:
+        nonlocal peak
+        async with limiter.slot():
+            peak = max(peak, limiter.in_flight)
+            await asyncio.sleep(0.01)
+
+    async def main() -> None:
+        await asyncio.gather(*(work() for _ in range(20)))
+
+    asyncio.run(main())
+    assert peak == 3
+    assert limiter.in_flight == 0
+
+
+def test_map_decreases_limit_on_retried_overload(
+    auth: audible.Authenticator,
+) -> None:
+    attempts = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal attempts
+        attempts += 1
+        if attempts == 1:
+            return httpx.Response(503, json={})
+        return httpx.Response(200, json={"asin": request.url.path.rsplit("/")[-1]})
+
+    limiter = AdaptiveLimiter(initial_limit=4, latency_tolerance=1e9)
+
+    async def main() -> list[object]:
+        async with audible.AsyncClient(
+            auth,
+            retry=RetryPolicy(backoff_factor=0, jitter=False),
+            transport=httpx.MockTransport(handler),
+        ) as client:
+            return await client.map(
+                lambda asin: client.get(f"library/{asin}"), ["B1"], limiter=limiter
+            )
+
+    assert asyncio.run(main()) == [{"asin": "B1"}]
+    assert attempts == 2
+    # the retried error is reported, the final success increases the limit
+    assert limiter.overloads == 1
+    assert limiter.successes == 1
+    assert limiter.limit == 2.5
+
+
+def test_many_waiters() -> None:
+    # a release only wakes the waiters which get a slot
+    limiter = AdaptiveLimiter(initial_limit=4)
+
+    async def work() -> None:
+        async with limiter.slot():
+            await asyncio.sleep(0)
+
+    async def main() -> None:
+        await asyncio.gather(*(work() for _ in range(10_000)))
+
+    started = time.perf_counter()
+    asyncio.run(main())
+    assert time.perf_counter() - started < 5
+    assert limiter.successes == 10_000
+    assert limiter.in_flight == 0
+
+
+def test_cancelled_waiters_release_their_slot() -> None:
+    limiter = AdaptiveLimiter(initial_limit=1, max_limit=1)
+    order: list[int] = []
+    tasks: list[asyncio.Task[None]] = []
+
+    async def work(number: int) -> None:
+        async with limiter.slot():
+            order.append(number)
+            await asyncio.sleep(0.01)
+        if number == 0:
+            # the slot is already handed over to task 2
+            tasks[2].cancel()
+
+    async def main() -> None:
+        tasks.extend(asyncio.create_task(work(number)) for number in range(4))
+        await asyncio.sleep(0)
+        tasks[1].cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    asyncio.run(main())
+    assert order == [0, 3]
+    assert limiter.in_flight == 0
+
+
+def test_limiter_is_reused_by_other_loops() -> None:
+    limiter = AdaptiveLimiter(initial_limit=2, max_limit=2)
+
+    async def work() -> None:
+        async with limiter.slot():
+            await asyncio.sleep(0.001)
+
+    async def main() -> None:
+        await asyncio.gather(*(work() for _ in range(10)))
+
+    asyncio.run(main())
+    asyncio.run(main())
+    assert limiter.successes == 20
+    assert limiter.in_flight == 0
@@ -0,0 +1,171 @@
+"""Test cases for the download module."""
+
+import os
+import pathlib
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+from pytest_mock import MockerFixture
+
+from audible.download import (
+    Downloader,
+    DownloadManifest,
+    DownloadProgress,
+    _PartFile,
+    verify_download,
+)
+from audible.exceptions import DownloadError
+
+
+DATA = os.urandom(300_001)
+
+
+def handler(request: httpx.Request) -> httpx.Response:
+    match = re.fullmatch(r"bytes=(\d+)-(\d+)", request.headers["Range"])
+    assert match is not None
+    start, end = map(int, match.groups())
+    return httpx.Response(
+        206,
+        content=DATA[start : end + 1],
+        headers={"Content-Range": f"bytes {start}-{end}/{len(DATA)}"},
+    )
+
+
+def test_download_writes_manifest(tmp_path: pathlib.Path) -> None:
+    session = httpx.Client(transport=httpx.MockTransport(handler))
+    with Downloader(segment_size=65536, session=session) as dl:
+        target = dl.download(
+            "https://cdn/book", tmp_path / "book.aaxc", metadata={"asin": "B00"}
+        )
+
+    assert target.read_bytes() == DATA
+    assert sorted(os.listdir(tmp_path)) == ["book.aaxc", "book.aaxc.manifest.json"]
+    manifest = DownloadManifest.load(target)
+    assert manifest.size == len(DATA)
+    assert len(manifest.segment_hashes) == 5
+    assert manifest.metadata == {"asin": "B00"}
+    assert verify_download(target, full=True)
+
+    corrupted = bytearray(DATA)
+    corrupted[100_000] ^= 1
+    target.write_bytes(corrupted)
+    assert verify_download(target)
+    assert not verify_download(target, full=True)
+
+
+def test_download_resumes_missing_segments(tmp_path: pathlib.Path) -> None:
+    requested: list[str] = []
+    fail = {"bytes=131072-196607"}
+
+    def failing_handler(request: httpx.Request) -> httpx.Response:
+        requested.append(request.headers["Range"])
+        if request.headers["Range"] in fail:
+            return httpx.Response(500)
+        return handler(request)
+
+    session = httpx.Client(transport=httpx.MockTransport(failing_handler))
+    with Downloader(segment_size=65536, session=session) as dl:
+        with pytest.raises(DownloadError):
+            dl.download("https://cdn/book", tmp_path / "book.aaxc")
+        assert not (tmp_path / "book.aaxc").exists()
+        progress = DownloadProgress.load(
+            tmp_path / "book.aaxc.progress", len(DATA), 65536
+        )
+        assert 2 not in progress.done
+        missing = [f"bytes={start}-{end}" for _, start, end in progress.pending]
+
+        fail.clear()
+        requested.clear()
+        target = dl.download("https://cdn/book", tmp_path / "book.aaxc")
+
+    # the probe and the missing segments, finished segments are not requested
+    assert requested[0] == "bytes=0-0"
+    assert sorted(requested[1:]) == sorted(missing)
+    assert target.read_bytes() == DATA
+    assert verify_download(target, full=True)
+    assert not (tmp_path / "book.aaxc.progress").exists()
+
+
+def test_manifest_is_written_after_the_file(
+    tmp_path: pathlib.Path, mocker: MockerFixture
+) -> None:
+    session = httpx.Client(transport=httpx.MockTransport(handler))
+    with Downloader(segment_size=65536, session=session) as dl:
+        target = dl.download("https://cdn/book", tmp_path / "book.aaxc")
+        manifest = DownloadManifest.path_for(target)
+        assert manifest.exists()
+
+        # a crash after the rename leaves the file without a stale manifest
+        mocker.patch.object(DownloadManifest, "save", side_effect=OSError("crash"))
+        with pytest.raises(OSError):
+            dl.download("https://cdn/book", target)
+
+    assert target.read_bytes() == DATA
+    assert not manifest.exists()
+    assert not verify_download(target)
+
+
+def test_segments_are_synced_before_they_are_marked_done(
+    tmp_path: pathlib.Path, mocker: MockerFixture
+) -> None:
+    events: list[str] = []
+    sync = _PartFile.sync
+    mark_done = DownloadProgress.mark_done
+
+    def record_sync(self: _PartFile) -> None:
+        sync(self)
+        events.append("sync")
+
+    def record_mark_done(self: DownloadProgress, index: int, segment_hash: str) -> None:
+        assert events[-1] == "sync"
+        events.append("done")
+        mark_done(self, index, segment_hash)
+
+    mocker.patch.object(_PartFile, "sync", record_sync)
+    mocker.patch.object(DownloadProgress, "mark_done", record_mark_done)
+    session = httpx.Client(transport=httpx.MockTransport(handler))
+    with Downloader(segment_size=65536, max_connections=1, session=session) as dl:
+        dl.download("https://cdn/book", tmp_path / "book.aaxc")
+
+    assert events == ["sync", "done"] * 5
+
+
+def test_part_file_preallocate(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    with _PartFile(tmp_path / "fallocate.part", truncate=True) as part_file:
+        part_file.preallocate(100_000)
+    assert (tmp_path / "fallocate.part").stat().st_size == 100_000
+
+    # filesystems without fallocate support use ftruncate
+    def unsupported(fd: int, offset: int, size: int) -> None:
+        raise OSError("not supported")
+
+    monkeypatch.setattr(os, "posix_fallocate", unsupported, raising=False)
+    with _PartFile(tmp_path / "unsupported.part", truncate=True) as part_file:
+        part_file.preallocate(100_000)
+    assert (tmp_path / "unsupported.part").stat().st_size == 100_000
+
+    monkeypatch.delattr(os, "posix_fallocate")
+    with _PartFile(tmp_path / "ftruncate.part", truncate=True) as part_file:
+        part_file.preallocate(100_000)
+    assert (tmp_path / "ftruncate.part").stat().st_size == 100_000
+
+
+@pytest.mark.parametrize("has_pwrite", [True, False])
+def test_part_file_write_at(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch, has_pwrite: bool
+) -> None:
+    # without os.pwrite, the offset is set with lseek under a lock
+    monkeypatch.setattr("audible.download._HAS_PWRITE", has_pwrite)
+    segments = [
+        (start, DATA[start : start + 10_000]) for start in range(0, 300_001, 10_000)
+    ]
+    with _PartFile(tmp_path / "book.part", truncate=True) as part_file:
+        part_file.preallocate(len(DATA))
+        with ThreadPoolExecutor(8) as executor:
+            for start, data in reversed(segments):
+                executor.submit(part_file.write_at, memoryview(data), start)
+    assert (tmp_path / "book.part").read_bytes() == DATA
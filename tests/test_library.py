@@ -0,0 +1,153 @@
+"""Test cases for the library module."""
+
+import asyncio
+from datetime import datetime, timezone
+from typing import Any
+
+import httpx
+import pytest
+
+import audible
+from audible.exceptions import ServerError
+from audible.library import SYNC_OVERLAP, LibrarySnapshot
+
+
+class Library:
+    # a paginated library endpoint which records the query parameters
+    def __init__(self, items: list[dict[str, Any]]) -> None:
+        self.items = items
+        self.requests: list[httpx.QueryParams] = []
+        self.fail_page: int | None = None
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        params = request.url.params
+        self.requests.append(params)
+        page, num_results = int(params["page"]), int(params["num_results"])
+        if page == self.fail_page:
+            return httpx.Response(503, json={"message": "unavailable"})
+        items = self.items
+        if "purchased_after" in params:
+            items = [i for i in items if i["purchase_date"] > params["purchased_after"]]
+        page_items = items[(page - 1) * num_results : page * num_results]
+        return httpx.Response(
+            200, json={"items": page_items}, headers={"Total-Count": str(len(items))}
+        )
+
+
+def item(asin: str, purchase_date: str = "2024-01-01T00:00:00Z") -> dict[str, Any]:
+    return {"asin": asin, "purchase_date": purchase_date}
+
+
+def test_full_and_delta_sync(auth: audible.Authenticator) -> None:
+    library = Library([item("B1"), item("B2"), item("B3")])
+    with (
+        audible.Client(auth, transport=httpx.MockTransport(library)) as client,
+        LibrarySnapshot(":memory:", response_groups="product_desc") as snapshot,
+    ):
+        assert snapshot.last_sync is None
+        assert snapshot.sync(client, num_results=2) == 3
+        assert [i["asin"] for i in snapshot] == ["B1", "B2", "B3"]
+        assert "purchased_after" not in library.requests[0]
+        assert library.requests[0]["response_groups"] == "product_desc"
+        last_sync = snapshot.last_sync
+        assert last_sync is not None
+
+        # a delta sync requests the purchases since the last sync
+        library.items.append(item("B4", "2999-01-01T00:00:00Z"))
+        library.requests.clear()
+        assert snapshot.sync(client, num_results=2) == 1
+        purchased_after = datetime.fromisoformat(
+            library.requests[0]["purchased_after"].replace("Z", "+00:00")
+        )
+        # the delta overlaps the previous sync
+        assert purchased_after == (last_sync - SYNC_OVERLAP).replace(microsecond=0)
+        assert len(snapshot) == 4
+        assert snapshot.last_sync is not None and snapshot.last_sync > last_sync
+
+        # a full sync replaces the snapshot
+        library.items = [item("B1")]
+        assert snapshot.sync(client, full=True, num_results=2) == 1
+        assert [i["asin"] for i in snapshot] == ["B1"]
+        assert "B2" not in snapshot
+
+
+def test_changed_response_groups_force_full_sync(
+    auth: audible.Authenticator,
+) -> None:
+    library = Library([item("B1")])
+    with (
+        audible.Client(auth, transport=httpx.MockTransport(library)) as client,
+        LibrarySnapshot(":memory:") as snapshot,
+    ):
+        snapshot.sync(client)
+        snapshot.response_groups = "media"
+        snapshot.sync(client)
+    assert "purchased_after" not in library.requests[1]
+
+
+def test_response_groups_of_sync_are_compared(
+    auth: audible.Authenticator,
+) -> None:
+    library = Library([item("B1")])
+    with (
+        audible.Client(auth, transport=httpx.MockTransport(library)) as client,
+        LibrarySnapshot(":memory:", response_groups="product_desc") as snapshot,
+    ):
+        snapshot.sync(client)
+        snapshot.sync(client, response_groups="media")
+        snapshot.sync(client, response_groups="media")
+        snapshot.sync(client)
+    assert [r["response_groups"] for r in library.requests] == [
+        "product_desc",
+        "media",
+        "media",
+        "product_desc",
+    ]
+    full_syncs = ["purchased_after" not in r for r in library.requests]
+    assert full_syncs == [True, True, False, True]
+
+
+def test_interrupted_sync_is_rolled_back(auth: audible.Authenticator) -> None:
+    library = Library([item("B1"), item("B2"), item("B3")])
+    with (
+        audible.Client(auth, transport=httpx.MockTransport(library)) as client,
+        LibrarySnapshot(":memory:") as snapshot,
+    ):
+        snapshot.sync(client, num_results=2)
+        last_sync = snapshot.last_sync
+
+        library.items = [item("B4"), item("B5"), item("B6")]
+        library.fail_page = 2
+        with pytest.raises(ServerError):
+            snapshot.sync(client, full=True, num_results=2)
+
+        assert [i["asin"] for i in snapshot] == ["B1", "B2", "B3"]
+        assert snapshot.last_sync == last_sync
+
+
+def test_marketplace_mismatch(auth: audible.Authenticator) -> None:
+    library = Library([item("B1")])
+    transport = httpx.MockTransport(library)
+    with LibrarySnapshot(":memory:") as snapshot:
+        with audible.Client(auth, transport=transport) as client:
+            snapshot.sync(client)
+        with audible.Client(auth, country_code="de", transport=transport) as client:
+            with pytest.raises(ValueError):
+                snapshot.sync(client)
+
+
+def test_async_sync(auth: audible.Authenticator) -> None:
+    library = Library([item("B1"), item("B2"), item("B3")])
+
+    async def main(snapshot: LibrarySnapshot) -> int:
+        async with audible.AsyncClient(
+            auth, transport=httpx.MockTransport(library)
+        ) as client:
+            return await snapshot.async_sync(client, num_results=2)
+
+    with LibrarySnapshot(":memory:") as snapshot:
+        assert asyncio.run(main(snapshot)) == 3
+        assert len(snapshot) == 3
+        last_sync = snapshot.last_sync
+        assert last_sync is not None
+        assert last_sync <= datetime.now(timezone.utc)
@@ -0,0 +1,151 @@
+"""Test cases for the licenses module."""
+
+import asyncio
+import pathlib
+import stat
+import time
+from typing import Any
+
+import httpx
+import pytest
+
+import audible
+from audible.exceptions import DownloadError
+from audible.licenses import (
+    License,
+    VoucherCache,
+    async_request_licenses,
+    get_voucher_expiry,
+    request_licenses,
+)
+
+from .helpers import encrypt_voucher
+
+
+REFRESH_DATE = "2099-01-01T00:00:00Z"
+
+
+def license_handler(requests: list[str]) -> Any:
+    def handler(request: httpx.Request) -> httpx.Response:
+        asin = request.url.path.split("/")[-2]
+        requests.append(asin)
+        if asin == "DENIED":
+            return httpx.Response(
+                200, json={"content_license": {"status_code": "Denied"}}
+            )
+        # the license can belong to another ASIN than the requested one
+        license_asin = asin.removeprefix("ALIAS_")
+        voucher = {
+            "key": f"key-{license_asin}",
+            "iv": "iv",
+            "refreshDate": REFRESH_DATE,
+        }
+        content_license = {
+            "asin": license_asin,
+            "status_code": "Granted",
+            "license_response": encrypt_voucher(license_asin, voucher),
+            "content_metadata": {"content_url": {"offline_url": f"https://cdn/{asin}"}},
+        }
+        return httpx.Response(200, json={"content_license": content_license})
+
+    return handler
+
+
+def test_request_licenses_uses_cache(
+    auth: audible.Authenticator, tmp_path: pathlib.Path
+) -> None:
+    requests: list[str] = []
+    cache = VoucherCache(tmp_path)
+    transport = httpx.MockTransport(license_handler(requests))
+    asins = ["B1", "B2", "ALIAS_B3", "DENIED", "B1"]
+
+    with audible.Client(auth, transport=transport) as client:
+        licenses = request_licenses(
+            client, asins, cache=cache, max_in_flight=2, return_exceptions=True
+        )
+        assert list(licenses) == ["B1", "B2", "ALIAS_B3", "DENIED"]
+        assert isinstance(licenses["DENIED"], DownloadError)
+        license_ = licenses["ALIAS_B3"]
+        assert isinstance(license_, License)
+        assert license_.voucher["key"] == "key-B3"
+        assert license_.offline_url == "https://cdn/ALIAS_B3"
+        assert sorted(requests) == ["ALIAS_B3", "B1", "B2", "DENIED"]
+
+        requests.clear()
+        licenses = request_licenses(client, ["B1", "B2"], cache=cache)
+        assert requests == []
+        assert cache.hits == 2
+
+        with pytest.raises(DownloadError):
+            request_licenses(client, ["B1", "DENIED"], cache=cache)
+
+
+def test_async_request_licenses(
+    auth: audible.Authenticator, tmp_path: pathlib.Path
+) -> None:
+    requests: list[str] = []
+    cache = VoucherCache(tmp_path)
+
+    async def main() -> dict[str, License | BaseException]:
+        async with audible.AsyncClient(
+            auth, transport=httpx.MockTransport(license_handler(requests))
+        ) as client:
+            return await async_request_licenses(
+                client,
+                ["B1", "ALIAS_B2", "DENIED"],
+                cache=cache,
+                return_exceptions=True,
+            )
+
+    licenses = asyncio.run(main())
+    assert isinstance(licenses["DENIED"], DownloadError)
+    assert isinstance(licenses["ALIAS_B2"], License)
+    assert licenses["ALIAS_B2"].voucher["key"] == "key-B2"
+    assert cache.get("B1") is not None
+
+
+def test_voucher_cache_expiry(tmp_path: pathlib.Path) -> None:
+    cache = VoucherCache(tmp_path, margin=60)
+    soon = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(time.time() + 30))
+    cache.set(License("EXPIRING", {}, {"refreshDate": soon}))
+    cache.set(License("VALID", {}, {"refreshDate": REFRESH_DATE}))
+
+    assert cache.get("EXPIRING") is None
+    assert not (tmp_path / "EXPIRING.high.json").exists()
+    assert cache.get("VALID") is not None
+    assert cache.get("VALID", quality="Normal") is None
+    assert (cache.hits, cache.misses) == (1, 2)
+
+    mode = stat.S_IMODE((tmp_path / "VALID.high.json").stat().st_mode)
+    assert mode == 0o600
+
+
+def test_voucher_cache_does_not_follow_tmp_symlink(tmp_path: pathlib.Path) -> None:
+    cache = VoucherCache(tmp_path / "cache")
+    other = tmp_path / "other.json"
+    other.write_text("")
+    other.chmod(0o644)
+    (tmp_path / "cache" / "B1.high.json.tmp").symlink_to(other)
+
+    cache.set(License("B1", {}, {"key": "k", "refreshDate": REFRESH_DATE}))
+
+    assert other.read_text() == ""
+    assert cache.get("B1") is not None
+    mode = stat.S_IMODE((tmp_path / "cache" / "B1.high.json").stat().st_mode)
+    assert mode == 0o600
+
+
+def test_get_voucher_expiry() -> None:
+    voucher = {
+        "refreshDate": "2030-01-02T00:00:00Z",
+        "rules": [
+            {
+                "name": "DefaultExpiresRule",
+                "parameters": [
+                    {"type": "EXPIRES", "expireDate": "2030-01-01T00:00:00Z"}
+                ],
+            }
+        ],
+    }
+    assert get_voucher_expiry(voucher) == 1893456000.0
+    assert get_voucher_expiry({"key": "k"}) is None
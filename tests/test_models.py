@@ -0,0 +1,85 @@
+"""Test cases for the models module."""
+
+import json
+from functools import partial
+from typing import Any
+
+import httpx
+
+import audible
+from audible._json import ItemSplitter
+from audible.models import LibraryItem, LibraryPage
+
+
+DATA = {
+    "items": [
+        {"asin": f"B00{i}", "title": 'with "}], { in string\\', "tags": [{"a": []}]}
+        for i in range(5)
+    ],
+    "response_groups": ["product_desc"],
+}
+
+
+def test_item_splitter_chunked() -> None:
+    raw = json.dumps(DATA).encode()
+    splitter = ItemSplitter()
+    items = []
+    for i in range(0, len(raw), 7):
+        items.extend(splitter.feed(raw[i : i + 7]))
+
+    assert [json.loads(item) for item in items] == DATA["items"]
+    assert json.loads(splitter.rest()) == {
+        "items": [],
+        "response_groups": ["product_desc"],
+    }
+
+
+def test_library_page_from_response() -> None:
+    request = httpx.Request("GET", "https://api.audible.com/1.0/library")
+    resp = httpx.Response(200, json=DATA, headers={"Total-Count": "5"}, request=request)
+    page = LibraryPage.from_response(resp)
+
+    assert len(page) == 5
+    assert page.total == 5
+    assert page.data == {"response_groups": ["product_desc"]}
+    assert not page[1].is_decoded
+    assert page[1].asin == "B001"
+    assert page[1].is_decoded
+
+
+def test_from_response_with_json_decoder_of_client(
+    auth: audible.Authenticator,
+) -> None:
+    decoded: list[bytes] = []
+
+    def json_decoder(raw: bytes) -> Any:
+        decoded.append(raw)
+        return json.loads(raw)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/B001"):
+            return httpx.Response(200, json={"item": DATA["items"][1]})
+        return httpx.Response(200, json=DATA)
+
+    with audible.Client(
+        auth, json_decoder=json_decoder, transport=httpx.MockTransport(handler)
+    ) as client:
+        assert client.json_decoder is json_decoder
+        page = client.get(
+            "library",
+            response_callback=partial(
+                LibraryPage.from_response, json_decoder=client.json_decoder
+            ),
+        )
+        assert len(decoded) == 1
+        assert page[0].asin == "B000"
+        assert len(decoded) == 2
+
+        item = client.get(
+            "library/B001",
+            response_callback=partial(
+                LibraryItem.from_response, json_decoder=client.json_decoder
+            ),
+        )
+        assert item.asin == "B001"
+        assert len(decoded) == 3
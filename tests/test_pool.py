@@ -0,0 +1,116 @@
+"""Test cases for the pool module."""
+
+import httpx
+import pytest
+from pytest_mock import MockerFixture
+
+import audible
+from audible.pool import (
+    PoolConfig,
+    close_shared_transports,
+    configure_shared_pool,
+    get_shared_mounts,
+    get_shared_transport,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clear_proxy_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    for name in ("HTTP_PROXY", "HTTPS_PROXY", "ALL_PROXY", "NO_PROXY"):
+        monkeypatch.delenv(name, raising=False)
+        monkeypatch.delenv(name.lower(), raising=False)
+
+
+@pytest.mark.parametrize(
+    "no_proxy", ["", "localhost,::1,.internal", "internal,127.0.0.1", "*"]
+)
+def test_shared_mounts_behave_like_httpx(
+    monkeypatch: pytest.MonkeyPatch, no_proxy: str
+) -> None:
+    monkeypatch.setenv("ALL_PROXY", "http://all.local:3128")
+    monkeypatch.setenv("HTTPS_PROXY", "https.local:3128")
+    monkeypatch.setenv("NO_PROXY", no_proxy)
+    urls = [
+        "https://api.amazon.com",
+        "http://api.amazon.com",
+        "http://localhost:8000",
+        "https://[::1]",
+        "https://127.0.0.1",
+        "https://a.internal",
+        "https://internal",
+    ]
+    try:
+        with (
+            httpx.Client() as plain,
+            httpx.Client(
+                transport=get_shared_transport(), mounts=get_shared_mounts()
+            ) as shared,
+        ):
+            for url in map(httpx.URL, urls):
+                plain_proxied = plain._transport_for_url(url) is not plain._transport
+                shared_proxied = (
+                    shared._transport_for_url(url) is not get_shared_transport()
+                )
+                assert shared_proxied == plain_proxied, url
+    finally:
+        close_shared_transports()
+
+
+def test_pool_config_limits_reach_the_transport(
+    auth: audible.Authenticator,
+) -> None:
+    config = PoolConfig(max_connections=7, max_keepalive_connections=3)
+    with audible.Client(auth, pool=config) as client:
+        pool = client.session._transport._pool  # type: ignore[attr-defined]
+        assert pool._max_connections == 7
+        assert pool._max_keepalive_connections == 3
+
+    configure_shared_pool(config)
+    try:
+        transport = get_shared_transport()
+        assert transport.transport._pool._max_connections == 7  # type: ignore[attr-defined]
+    finally:
+        configure_shared_pool(PoolConfig())
+
+
+def test_clients_do_not_close_the_shared_transport(mocker: MockerFixture) -> None:
+    close = mocker.spy(httpx.HTTPTransport, "close")
+    try:
+        transport = get_shared_transport()
+        with httpx.Client(transport=transport):
+            pass
+        transport.close()
+        close.assert_not_called()
+        assert get_shared_transport() is transport
+    finally:
+        close_shared_transports()
+    close.assert_called_once()
+    assert get_shared_transport() is not transport
+    close_shared_transports()
+
+
+def test_shared_transport_keeps_env_proxies(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("HTTPS_PROXY", "proxy.local:3128")
+    monkeypatch.setenv("NO_PROXY", "localhost,::1,.internal")
+    mounts = get_shared_mounts()
+    try:
+        with httpx.Client(transport=get_shared_transport(), mounts=mounts) as client:
+            proxied = client._transport_for_url(httpx.URL("https://api.amazon.com"))
+            direct = client._transport_for_url(httpx.URL("https://a.internal"))
+
+        assert set(mounts) == {
+            "https://",
+            "all://localhost",
+            "all://[::1]",
+            "all://*.internal",
+        }
+        assert proxied is mounts["https://"]
+        assert direct is get_shared_transport()
+        # proxy transports are shared too
+        assert get_shared_mounts()["https://"] is proxied
+    finally:
+        close_shared_transports()
+
+
+def test_shared_mounts_without_env_proxies() -> None:
+    assert get_shared_mounts() == {}
@@ -0,0 +1,192 @@
+"""Test cases for the ratelimit module."""
+
+import asyncio
+import pathlib
+import threading
+from collections.abc import Iterator
+
+import httpx
+import pytest
+from pytest_mock import MockerFixture
+
+import audible
+from audible.ratelimit import FileTokenBucket, RateLimiter, TokenBucket
+from audible.retry import RetryPolicy
+
+
+def test_token_bucket_reserves_after_burst() -> None:
+    bucket = TokenBucket(rate=10, capacity=2)
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 0
+    # the third token is available after 1/rate seconds
+    assert bucket.reserve() == pytest.approx(0.1, abs=0.01)
+    assert bucket.reserve() == pytest.approx(0.2, abs=0.01)
+
+
+def test_token_bucket_validates_arguments() -> None:
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0, capacity=1)
+    with pytest.raises(ValueError):
+        TokenBucket(rate=1, capacity=0.5)
+
+
+def test_file_token_bucket_is_shared(tmp_path: pathlib.Path) -> None:
+    pytest.importorskip("fcntl")
+    first = FileTokenBucket(tmp_path / "bucket", rate=10, capacity=1)
+    second = FileTokenBucket(tmp_path / "bucket", rate=10, capacity=1)
+    assert first.reserve() == 0
+    assert second.reserve() == pytest.approx(0.1, abs=0.01)
+
+
+def test_rate_limiter_selects_longest_prefix() -> None:
+    limiter = RateLimiter(
+        rate=5, rules={"/1.0/library": (1, 1), "/1.0/library/item": (2, 2)}
+    )
+    assert limiter.get_bucket("us", "/1.0/catalog").rate == 5
+    assert limiter.get_bucket("us", "/1.0/library").rate == 1
+    assert limiter.get_bucket("us", "/1.0/library/item/B00").rate == 2
+    # every marketplace has its own buckets
+    assert limiter.get_bucket("us", "/1.0/library") is limiter.get_bucket(
+        "us", "/1.0/library?x"
+    )
+    assert limiter.get_bucket("us", "/1.0/library") is not limiter.get_bucket(
+        "de", "/1.0/library"
+    )
+
+
+def test_rate_limiter_rules_per_marketplace() -> None:
+    limiter = RateLimiter(
+        rate=5,
+        rules={
+            "/1.0/content": (1, 1),
+            ("de", ""): (2, 2),
+            ("de", "/1.0/content"): (0.5, 1),
+        },
+    )
+    assert limiter.get_bucket("us", "/1.0/library").rate == 5
+    assert limiter.get_bucket("us", "/1.0/content/B00").rate == 1
+    assert limiter.get_bucket("de", "/1.0/library").rate == 2
+    assert limiter.get_bucket("de", "/1.0/content/B00").rate == 0.5
+
+
+def test_marketplaces_are_limited_differently(
+    auth: audible.Authenticator, mocker: MockerFixture
+) -> None:
+    sleep = mocker.patch("audible.client.time.sleep")
+    limiter = RateLimiter(rate=100, capacity=1, rules={("de", ""): (1, 1)})
+    transport = httpx.MockTransport(items_handler)
+    delays = {}
+    for country_code in ("us", "de"):
+        with audible.Client(
+            auth, country_code, rate_limiter=limiter, transport=transport
+        ) as client:
+            client.get("library")
+            client.get("library")
+        # only the second request waits for a token
+        delays[country_code] = sleep.call_args.args[0]
+        assert sleep.call_count == 1
+        sleep.reset_mock()
+
+    assert delays["us"] == pytest.approx(0.01, abs=0.005)
+    assert delays["de"] == pytest.approx(1, abs=0.005)
+
+
+def test_rate_limiter_counts_waits() -> None:
+    limiter = RateLimiter(rate=10, capacity=1)
+    assert limiter.reserve("us", "/1.0/library") == 0
+    assert limiter.reserve("us", "/1.0/library") > 0
+    assert limiter.waits == 1
+    assert limiter.wait_time > 0
+    limiter.reset()
+    assert limiter.waits == 0
+    assert limiter.wait_time == 0
+
+
+def items_handler(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, json={"items": [{"asin": "B1"}, {"asin": "B2"}]})
+
+
+def test_stream_items_uses_rate_limit_and_retry(auth: audible.Authenticator) -> None:
+    attempts = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal attempts
+        attempts += 1
+        if attempts == 1:
+            return httpx.Response(503, json={"message": "maintenance"})
+        return items_handler(request)
+
+    limiter = RateLimiter(rate=100, capacity=1)
+    retry = RetryPolicy(backoff_factor=0, jitter=False)
+    with audible.Client(
+        auth,
+        rate_limiter=limiter,
+        retry=retry,
+        transport=httpx.MockTransport(handler),
+    ) as client:
+        items = list(client.stream_items("library"))
+
+    assert items == [{"asin": "B1"}, {"asin": "B2"}]
+    assert attempts == 2
+    assert retry.retries == 1
+    assert limiter.waits == 1  # the retry waited for a token
+
+
+class BrokenStream(httpx.SyncByteStream):
+    def __iter__(self) -> Iterator[bytes]:
+        yield b'{"items": [{"asin": "B1"}, '
+        raise httpx.ReadError("connection lost")
+
+
+def test_stream_items_does_not_retry_after_items(
+    auth: audible.Authenticator,
+) -> None:
+    attempts = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal attempts
+        attempts += 1
+        return httpx.Response(200, stream=BrokenStream())
+
+    retry = RetryPolicy(backoff_factor=0, jitter=False)
+    items = []
+    with audible.Client(
+        auth, retry=retry, transport=httpx.MockTransport(handler)
+    ) as client:
+        with pytest.raises(audible.exceptions.NetworkError):
+            for item in client.stream_items("library"):
+                items.append(item)
+
+    assert items == [{"asin": "B1"}]
+    assert attempts == 1
+
+
+def test_async_client_reserves_file_bucket_in_thread(
+    auth: audible.Authenticator, tmp_path: pathlib.Path
+) -> None:
+    pytest.importorskip("fcntl")
+    threads: list[threading.Thread] = []
+    reserve = FileTokenBucket.reserve
+
+    def record_thread(self: FileTokenBucket, amount: float = 1) -> float:
+        threads.append(threading.current_thread())
+        return reserve(self, amount)
+
+    limiter = RateLimiter(rate=100, directory=tmp_path)
+
+    async def main() -> list[object]:
+        async with audible.AsyncClient(
+            auth,
+            rate_limiter=limiter,
+            transport=httpx.MockTransport(items_handler),
+        ) as client:
+            await client.get("library")
+            return [item async for item in client.stream_items("library")]
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(FileTokenBucket, "reserve", record_thread)
+        items = asyncio.run(main())
+
+    assert items == [{"asin": "B1"}, {"asin": "B2"}]
+    assert len(threads) == 2
+    assert threading.main_thread() not in threads
@@ -0,0 +1,98 @@
+"""Test cases for the retry module."""
+
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import httpx
+import pytest
+from pytest_mock import MockerFixture
+
+import audible
+from audible.exceptions import BadRequest, NotResponding, RatelimitError
+from audible.retry import RetryPolicy, parse_retry_after
+
+
+def ratelimit_error(retry_after: str | None = None) -> RatelimitError:
+    headers = {"Retry-After": retry_after} if retry_after is not None else {}
+    request = httpx.Request("GET", "https://api.audible.com/1.0/library")
+    return RatelimitError(httpx.Response(429, headers=headers, request=request), {})
+
+
+def test_parse_retry_after() -> None:
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("") is None
+    assert parse_retry_after("invalid") is None
+    assert parse_retry_after("5") == 5
+    date = datetime.now(timezone.utc) + timedelta(seconds=30)
+    assert parse_retry_after(format_datetime(date, usegmt=True)) == pytest.approx(
+        30, abs=1.5
+    )
+    past = datetime.now(timezone.utc) - timedelta(seconds=30)
+    assert parse_retry_after(format_datetime(past, usegmt=True)) == 0
+
+
+def test_exponential_backoff() -> None:
+    policy = RetryPolicy(backoff_factor=0.5, max_backoff=3, jitter=False)
+    delays = [policy.get_backoff(attempt) for attempt in range(1, 6)]
+    assert delays == [0.5, 1, 2, 3, 3]
+
+    policy = RetryPolicy(backoff_factor=0.5, jitter=True)
+    assert all(0 <= policy.get_backoff(3) <= 2 for _ in range(100))
+
+
+def test_get_delay_respects_retry_after() -> None:
+    policy = RetryPolicy(backoff_factor=0.5, jitter=False, max_retry_after=60)
+    assert policy.get_delay("GET", 1, ratelimit_error()) == 0.5
+    assert policy.get_delay("GET", 1, ratelimit_error("10")) == 10
+    # the backoff is used if it is longer than Retry-After
+    assert policy.get_delay("GET", 2, ratelimit_error("0")) == 1
+    # the server asks to wait too long
+    assert policy.get_delay("GET", 1, ratelimit_error("61")) is None
+
+
+def test_get_delay_gives_up() -> None:
+    policy = RetryPolicy(max_attempts=3, backoff_factor=0, jitter=False)
+    # non-idempotent methods and other errors are not retried
+    assert policy.get_delay("POST", 1, NotResponding()) is None
+    request = httpx.Request("GET", "https://api.audible.com/1.0/library")
+    bad_request = BadRequest(httpx.Response(400, request=request), {})
+    assert policy.get_delay("GET", 1, bad_request) is None
+    assert policy.failures == 0
+
+    assert policy.get_delay("get", 1, NotResponding()) == 0
+    assert policy.get_delay("GET", 2, NotResponding()) == 0
+    assert policy.get_delay("GET", 3, NotResponding()) is None
+    assert (policy.retries, policy.failures) == (2, 1)
+
+    policy.reset()
+    assert (policy.retries, policy.retry_time, policy.failures) == (0, 0, 0)
+
+
+def test_max_attempts_must_be_positive() -> None:
+    with pytest.raises(ValueError):
+        RetryPolicy(max_attempts=0)
+
+
+def test_client_retries_requests(
+    auth: audible.Authenticator, mocker: MockerFixture
+) -> None:
+    sleep = mocker.patch("audible.client.time.sleep")
+    methods: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        methods.append(request.method)
+        if len(methods) == 1 or request.method == "POST":
+            return httpx.Response(429, json={}, headers={"Retry-After": "2"})
+        return httpx.Response(200, json={"ok": True})
+
+    policy = RetryPolicy(backoff_factor=0.1, jitter=False)
+    with audible.Client(
+        auth, retry=policy, transport=httpx.MockTransport(handler)
+    ) as client:
+        assert client.get("library") == {"ok": True}
+        with pytest.raises(RatelimitError):
+            client.post("library", body={})
+
+    assert methods == ["GET", "GET", "POST"]
+    sleep.assert_called_once_with(2)
+    assert (policy.retries, policy.retry_time, policy.failures) == (1, 2, 0)
@@ -0,0 +1,127 @@
+"""Test cases for the scheduler module."""
+
+import json
+import os
+import pathlib
+import re
+import stat
+from typing import Any
+
+import httpx
+
+import audible
+from audible.download import Downloader
+from audible.scheduler import (
+    DONE,
+    DOWNLOADED,
+    FAILED,
+    LICENSED,
+    PENDING,
+    DownloadQueue,
+    DownloadScheduler,
+)
+
+from .helpers import encrypt_voucher
+
+
+DATA = {asin: os.urandom(200_000 + i) for i, asin in enumerate(["B1", "B2", "B3"])}
+
+
+def make_license(asin: str) -> dict[str, Any]:
+    return {
+        "content_license": {
+            "asin": asin,
+            "status_code": "Granted",
+            "license_response": encrypt_voucher(
+                asin, {"key": f"key-{asin}", "iv": "iv"}
+            ),
+            "content_metadata": {
+                "content_url": {"offline_url": f"https://cdn/{asin}"},
+                "content_reference": {"content_size": len(DATA[asin])},
+            },
+        }
+    }
+
+
+def test_download_queue(tmp_path: pathlib.Path) -> None:
+    with DownloadQueue(tmp_path / "queue.sqlite") as queue:
+        assert queue.add(["B2", "B1", "B2"]) == 2
+        assert queue.add(["B1", "B3"]) == 1
+        job = queue.jobs()[0]
+        job.state = FAILED
+        job.error = "error"
+        queue.update(job)
+
+    with DownloadQueue(tmp_path / "queue.sqlite") as queue:
+        assert [(j.asin, j.state, j.error) for j in queue.jobs()] == [
+            ("B2", FAILED, "error"),
+            ("B1", PENDING, None),
+            ("B3", PENDING, None),
+        ]
+        assert queue.counts() == {FAILED: 1, PENDING: 2}
+        queue.retry_failed()
+        assert [j.asin for j in queue.jobs([PENDING])] == ["B2", "B1", "B3"]
+
+
+def test_scheduler_resumes_interrupted_run(
+    auth: audible.Authenticator, tmp_path: pathlib.Path
+) -> None:
+    license_requests: list[str] = []
+    ranges: list[tuple[str, int]] = []
+    fail = {"B3": 1}
+
+    def api(request: httpx.Request) -> httpx.Response:
+        asin = request.url.path.split("/")[-2]
+        license_requests.append(asin)
+        return httpx.Response(200, json=make_license(asin))
+
+    def cdn(request: httpx.Request) -> httpx.Response:
+        asin = request.url.path.lstrip("/")
+        match = re.fullmatch(r"bytes=(\d+)-(\d+)", request.headers["Range"])
+        assert match is not None
+        start, end = map(int, match.groups())
+        ranges.append((asin, start))
+        if start > 0 and fail.get(asin):
+            fail[asin] -= 1
+            return httpx.Response(500)
+        data = DATA[asin]
+        return httpx.Response(
+            206,
+            content=data[start : end + 1],
+            headers={"Content-Range": f"bytes {start}-{end}/{len(data)}"},
+        )
+
+    # state of a crashed run: B1 is downloaded, B2 has an old license
+    with DownloadQueue(tmp_path / "download_queue.sqlite") as queue:
+        queue.add(["B1", "B2", "B3"])
+        b1, b2, _ = queue.jobs()
+        b1.state, b1.license = DOWNLOADED, make_license("B1")
+        b1.filename = str(tmp_path / "B1.aaxc")
+        (tmp_path / "B1.aaxc").write_bytes(DATA["B1"])
+        b2.state, b2.license = LICENSED, make_license("B2")
+        queue.update(b1)
+        queue.update(b2)
+
+    session = httpx.Client(transport=httpx.MockTransport(cdn))
+    downloader = Downloader(segment_size=65536, session=session)
+    with (
+        audible.Client(auth, transport=httpx.MockTransport(api)) as client,
+        DownloadScheduler(client, tmp_path, downloader=downloader) as scheduler,
+    ):
+        assert scheduler.run() == {DONE: 2, FAILED: 1}
+        assert sorted(license_requests) == ["B2", "B3"]
+        progress = json.loads((tmp_path / "B3.aaxc.progress").read_text())
+        missing = [i * 65536 for i in range(4) if str(i) not in progress["hashes"]]
+        assert 65536 in missing
+
+        ranges.clear()
+        scheduler.queue.retry_failed()
+        assert scheduler.run() == {DONE: 3}
+        # only the probe and the missing segments of B3 are requested again
+        assert sorted(start for asin, start in ranges if asin == "B3") == [0, *missing]
+
+    for asin, data in DATA.items():
+        assert (tmp_path / f"{asin}.aaxc").read_bytes() == data
+        voucher_file = tmp_path / f"{asin}.json"
+        assert json.loads(voucher_file.read_text())["key"] == f"key-{asin}"
+        assert stat.S_IMODE(voucher_file.stat().st_mode) == 0o600